@@ -1,8 +0,0 @@
-def core_window_dimensions(SelectedCore):
-
-    match SelectedCore["family"]:
-        case 'ETD' | 'EFD':
-            WindowWidth  = (SelectedCore["E"] - SelectedCore["F"])/2
-            WindowHeight = SelectedCore["D"]*2
-    
-    return WindowWidth, WindowHeight
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Accuracy and cost of the outside-window models: the "infinite window" series (10x window, 150 harmonics, the default)
+against the closed-form open boundary (OutsideWindow='open'). To separate the two errors of the series, it is also
+evaluated with 10x more harmonics in the same 10x window (truncation error removed, window-size error left) and in a 40x
+window with 600 harmonics (the same harmonics per window width, so the truncation error of the default is kept).
+
+    python -m benchmarks.outside_window_accuracy
+"""
+import time
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+from magnetics_modeling.leakage_inductance.OpenBoundaryLeakageEngine import OpenBoundaryLeakageEngine
+from benchmarks.run_benchmarks import CORES
+
+
+# (core, BobbinType, BobbinThickness, N1, N2, d, WindingsSpacing, PrimaryHeight, InterSectionSpacing, SecondaryHeight)
+CASES = [
+    ('ETD', 'Normal', 1e-3, 64, 34, 0.8e-3, 1e-3, 0, 0, 0),
+    ('ETD', 'Normal', 1e-3, 20, 10, 1.2e-3, 0.2e-3, 0, 0, 0),
+    ('ETD', 'Split', 1e-3, 64, 34, 0.8e-3, 0, 10e-3, 3e-3, 5.7e-3),
+    ('ETD', 'Split', 1e-3, 30, 30, 0.8e-3, 0, 9e-3, 1e-3, 9e-3),
+    ('EFD', 'Normal', 0.5e-3, 10, 5, 0.8e-3, 0.5e-3, 0, 0, 0),
+    ('EFD', 'Split', 0.5e-3, 20, 10, 0.8e-3, 0, 7e-3, 1e-3, 8e-3),
+]
+
+
+def _series(Scale, Harmonics, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds):
+    # Outside-window series in a window Scale times larger, with the blocks centered vertically in it
+    shift = Scale * WindowHeight / 2 - WindowHeight / 2
+    shifted = [(x_minus, x_plus, y_minus + shift, y_plus + shift) for x_minus, x_plus, y_minus, y_plus in Bounds]
+    arguments = (Harmonics, Harmonics, 1, Scale * WindowWidth, Scale * WindowHeight)
+    return (FactorizedLeakageEngine.Leakage_pul(*arguments, CurrentDensities, shifted),
+            FactorizedLeakageEngine.Leakage_pua(*arguments, DiameterCentralLeg, CurrentDensities, shifted))
+
+
+def compare():
+    rows = []
+    for family, BobbinType, BobbinThickness, N1, N2, d, WindingsSpacing, PrimaryHeight, InterSectionSpacing, SecondaryHeight in CASES:
+        SelectedCore = CORES[family]
+        WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+        blocks = WindingMaker(WindowWidth, WindowHeight, BobbinType, BobbinThickness, N1, N2, d, 0.05e-3, d, 0.05e-3,
+                              WindingsSpacing, PrimaryHeight, InterSectionSpacing, SecondaryHeight,
+                              'center', 'center', 'center').winding_dims
+        primary, secondary = blocks['primary'], blocks['secondary']
+        Bounds = [(block['x'], block['x'] + block['width'], block['y'], block['y'] + block['height']) for block in (primary, secondary)]
+        CurrentDensities = [N1 / (primary['width'] * primary['height']), -N1 / (secondary['width'] * secondary['height'])]
+        DiameterCentralLeg = SelectedCore["F"] if family == 'ETD' else 0
+
+        series = _series(10, 150, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds)
+        harmonics = _series(10, 1500, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds)
+        window = _series(40, 600, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds)
+        start = time.perf_counter()
+        open_boundary = (OpenBoundaryLeakageEngine.Leakage_pul(1, CurrentDensities, Bounds),
+                         OpenBoundaryLeakageEngine.Leakage_pua(1, DiameterCentralLeg, CurrentDensities, Bounds))
+        open_time = time.perf_counter() - start
+
+        # Total leakage inductance with each outside-window model
+        totals, times = {}, {}
+        for model in ('series', 'open'):
+            FactorizedLeakageEngine.WindowWeights.cache_clear()
+            start = time.perf_counter()
+            totals[model] = LeakageInductanceCalculator(SelectedCore, 'Primary', WindowWidth, WindowHeight, blocks, N1, N2,
+                                                        OutsideWindow=model).LeakageInductance
+            times[model] = time.perf_counter() - start
+
+        rows.append({'case': f"{family} {BobbinType} {N1}:{N2}",
+                     'pua_OW_series_error': series[1] / open_boundary[1] - 1,
+                     'pua_OW_harmonics_error': harmonics[1] / open_boundary[1] - 1,
+                     'pua_OW_40x_error': window[1] / open_boundary[1] - 1,
+                     'pul_OW_series_error': series[0] / open_boundary[0] - 1,
+                     'total_difference': totals['series'] / totals['open'] - 1,
+                     'open_time': open_time, 'series_time': times['series'], 'open_total_time': times['open']})
+    return rows
+
+
+if __name__ == '__main__':
+    print(f"{'case':<20} {'pua_OW 10x/150':>15} {'pua_OW 10x/1500':>16} {'pua_OW 40x/600':>15} {'pul_OW 10x/150':>15} {'L total':>10} "
+          f"{'open OW ms':>11} {'series L ms':>12} {'open L ms':>10}")
+    for row in compare():
+        print(f"{row['case']:<20} {row['pua_OW_series_error']:>15.2e} {row['pua_OW_harmonics_error']:>16.2e} {row['pua_OW_40x_error']:>15.2e} {row['pul_OW_series_error']:>15.2e} "
+              f"{row['total_difference']:>10.2e} {row['open_time'] * 1e3:>11.2f} {row['series_time'] * 1e3:>12.2f} {row['open_total_time'] * 1e3:>10.2f}")
@@ -0,0 +1,303 @@
+"""
+Benchmark suite for the leakage kernels, LeakageInductanceCalculator, WindingMaker, the plotters and the import time.
+
+Every case is timed with time.perf_counter (median and minimum of Repeat runs, after a warm-up run) and its peak
+Python memory is measured in a separate run with tracemalloc, so the tracing overhead does not affect the timings.
+The results are written as JSON and compared against a stored baseline; a case is reported as a regression when its
+median time or peak memory grows by more than THRESHOLD times and by more than MINIMUM_DELTAS, so the run-to-run noise
+of sub-millisecond cases is not reported (lower --threshold on a quiet machine). Timings depend on the machine, so the
+baseline should be re-recorded (--save-baseline) on the machine that runs the comparison. The import cases time a fresh
+interpreter that imports a set of public names of magnetics_modeling; the compute-only one also has an absolute budget
+(IMPORT_BUDGETS) and fails if it loads any of the modules it must not.
+
+    python -m benchmarks.run_benchmarks                          # run and compare against benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --filter kernel/ --repeat 20
+    python -m benchmarks.run_benchmarks --save-baseline
+"""
+import os
+import sys
+import io
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import statistics
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.core_window_plotter import TransformerPlotter
+from magnetics_modeling.auxiliary_functions.batch_plotter import BatchTransformerPlotter
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+CORES = {
+    'ETD': {'manufacturer': 'OUGE', 'family': 'ETD', 'sub_family': 'ETD34', 'model': 'ETD3434', 'core_material': 'OGP44',
+            'A': 34.2e-3, 'B': 17.3e-3, 'C': 10.8e-3, 'D': 12.1e-3, 'E': 26.4e-3, 'F': 10.7e-3},
+    'EFD': {'manufacturer': 'TDK', 'family': 'EFD', 'sub_family': 'EFD25', 'model': 'EFD25', 'core_material': 'N87',
+            'A': 25e-3, 'B': 12.5e-3, 'C': 9.1e-3, 'D': 9.3e-3, 'E': 18.7e-3, 'F': 11.4e-3, 'F2': 5.2e-3},
+}
+
+# Design of each core used by the leakage benchmarks (WindingMaker arguments after the window dimensions)
+DESIGNS = {
+    'ETD': ('Split', 1e-3, 64, 34, 0.8e-3, 0.05e-3, 0.8e-3, 0.05e-3, 1e-3, 10e-3, 3e-3, 5.7e-3, 'center', 'center', 'center'),
+    'EFD': ('Split', 0.5e-3, 20, 10, 0.8e-3, 0.05e-3, 0.8e-3, 0.05e-3, 0.5e-3, 7e-3, 1e-3, 8e-3, 'center', 'center', 'center'),
+}
+
+KERNEL_SIZES = (30, 60, 150)
+WINDING_TURNS = (10, 100, 1000, 10000)
+PLOT_TURNS = (100, 1000)
+
+# Public names used by each import case and the modules it must not load
+IMPORT_CASES = {'compute': (('LeakageInductanceCalculator', 'BatchLeakageInductanceCalculator', 'WindingMaker', 'DesignSweep'),
+                            ('matplotlib', 'magnetics_modeling.auxiliary_functions.core_catalog',
+                             'magnetics_modeling.winding_loss.WindingLossCalculator')),
+                'plotting': (('LeakageInductanceCalculator', 'WindingMaker', 'TransformerPlotter'), ())}
+# Seconds of a fresh interpreter importing the case (about 60 ms of it is numpy itself)
+IMPORT_BUDGETS = {'import/compute': 0.25}
+# Allowed ratio to the baseline: on a shared machine the medians of an unchanged tree drift by up to ~1.7x between runs
+THRESHOLD = 2.0
+# Smallest growth reported as a regression, whatever the ratio: seconds of median time and bytes of peak memory
+MINIMUM_DELTAS = {'time_median': 2e-3, 'peak_memory': 2**20}
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Benchmark:
+    """
+    One benchmark case: Setup() builds the inputs (not timed) and returns the callable that is timed.
+    """
+    registry = {}
+
+    def __init__(self, Name, Setup):
+        self.Name = Name
+        self.Setup = Setup
+        Benchmark.registry[Name] = self
+
+    def measure(self, Repeat=5):
+        run = self.Setup()
+        run() # Warm-up: imports, lru caches, first-touch allocations
+
+        times = []
+        for _ in range(Repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {'time_median': statistics.median(times), 'time_min': min(times), 'repeat': Repeat, 'peak_memory': peak}
+
+
+def _design(family):
+    SelectedCore = CORES[family]
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    winding = WindingMaker(WindowWidth, WindowHeight, *DESIGNS[family])
+    return SelectedCore, WindowWidth, WindowHeight, winding
+
+
+def _kernel_arguments(family, ReferredWinding='Primary'):
+    # Positional arguments shared by the Leakage_pul/pua kernels, as built by _LeakageScaler
+    SelectedCore, WindowWidth, WindowHeight, winding = _design(family)
+    scaler = LeakageInductanceCalculator(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, winding.winding_dims,
+                                         DESIGNS[family][2], DESIGNS[family][3])
+    blocks = (scaler.Height_1_Minus, scaler.Height_1_Plus, scaler.Height_2_Minus, scaler.Height_2_Plus,
+              scaler.Width_1_Minus, scaler.Width_1_Plus, scaler.Width_2_Minus, scaler.Width_2_Plus)
+    windings = (DESIGNS[family][2], scaler.I_1, scaler.Width_1, scaler.Height_1,
+                DESIGNS[family][3], scaler.I_2, scaler.Width_2, scaler.Height_2)
+    return scaler.I_ref, WindowWidth, WindowHeight, SelectedCore["F"], windings, blocks
+
+
+def _kernel_case(Name, Harmonics, Method):
+    def Setup():
+        I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, windings, blocks = _kernel_arguments('ETD')
+        Kernel = getattr(LeakageInductanceCalculator, 'Leakage_' + Name)
+        geometry = (WindowWidth, WindowHeight, DiameterCentralLeg) if Name.startswith('pua') else (WindowWidth, WindowHeight)
+
+        def run():
+            # Cold window weights, so every run pays the full kernel cost
+            FactorizedLeakageEngine.WindowWeights.cache_clear()
+            return Kernel(Harmonics, Harmonics, I_ref, *geometry, *windings, *blocks, Method=Method)
+        return run
+    return Setup
+
+
+def _scaler_case(family, OutsideWindow='series'):
+    def Setup():
+        SelectedCore, WindowWidth, WindowHeight, winding = _design(family)
+        def run():
+            FactorizedLeakageEngine.WindowWeights.cache_clear()
+            return LeakageInductanceCalculator(SelectedCore, 'Primary', WindowWidth, WindowHeight, winding.winding_dims,
+                                               DESIGNS[family][2], DESIGNS[family][3], OutsideWindow=OutsideWindow).LeakageInductance
+        return run
+    return Setup
+
+
+def _winding_arguments(Turns):
+    # Normal bobbin in the ETD34 window with the wire scaled so that Turns primary + Turns/2 secondary turns fill up to 60%
+    WindowWidth, WindowHeight = core_window_dimensions(CORES['ETD'])
+    BobbinThickness = 1e-3
+    area = (WindowWidth - BobbinThickness) * (WindowHeight - 2 * BobbinThickness)
+    pitch = min(np.sqrt(0.6 * area / (1.5 * Turns)), (WindowWidth - BobbinThickness) / 5)
+    d, t = 0.9 * pitch, 0.05 * pitch
+    return (WindowWidth, WindowHeight, 'Normal', BobbinThickness, Turns, max(1, Turns // 2), d, t, d, t, 0.1 * pitch)
+
+
+def _winding_case(Turns):
+    def Setup():
+        arguments = _winding_arguments(Turns)
+        return lambda: WindingMaker(*arguments)
+    return Setup
+
+
+def _plotter_case(Turns):
+    def Setup():
+        arguments = _winding_arguments(Turns)
+        winding = WindingMaker(*arguments)
+        WindowWidth, WindowHeight, BobbinType, BobbinThickness = arguments[:4]
+        def run():
+            plotter = TransformerPlotter(WindowWidth, WindowHeight, BobbinThickness, BobbinType)
+            plotter.plot_geometry(winding.turns, winding.winding_dims, *arguments[6:10])
+            plotter.fig.savefig(io.BytesIO(), format='png')
+            plt.close(plotter.fig)
+        return run
+    return Setup
+
+
+def _batch_plotter_case(Turns):
+    def Setup():
+        arguments = _winding_arguments(Turns)
+        winding = WindingMaker(*arguments)
+        WindowWidth, WindowHeight, BobbinType, BobbinThickness = arguments[:4]
+        plotter = BatchTransformerPlotter()
+        return lambda: plotter.render(io.BytesIO(), WindowWidth, WindowHeight, BobbinThickness, BobbinType,
+                                      winding.turns, winding.winding_dims, *arguments[6:10])
+    return Setup
+
+
+def _import_case(Names, Forbidden):
+    def Setup():
+        script = (f"import sys, magnetics_modeling\n"
+                  f"for name in {Names!r}: getattr(magnetics_modeling, name)\n"
+                  f"loaded = [name for name in {Forbidden!r} if name in sys.modules]\n"
+                  f"sys.exit(f'Loaded {{loaded}}' if loaded else 0)")
+        return lambda: subprocess.run([sys.executable, '-c', script], cwd=REPOSITORY, check=True)
+    return Setup
+
+
+for _name in ('pul_IW', 'pul_OW', 'pua_IW', 'pua_OW'):
+    for _size in KERNEL_SIZES:
+        Benchmark(f'kernel/{_name}/M{_size}', _kernel_case(_name, _size, 'factorized'))
+    Benchmark(f'kernel/{_name}/M30/dense', _kernel_case(_name, 30, 'dense'))
+for _name in ('pul_OW', 'pua_OW'):
+    Benchmark(f'kernel/{_name}/open', _kernel_case(_name, 0, 'open'))
+for _family in CORES:
+    Benchmark(f'scaler/{_family}', _scaler_case(_family))
+    Benchmark(f'scaler/{_family}/open', _scaler_case(_family, 'open'))
+for _turns in WINDING_TURNS:
+    Benchmark(f'winding_maker/N{_turns}', _winding_case(_turns))
+for _turns in PLOT_TURNS:
+    Benchmark(f'plotter/N{_turns}', _plotter_case(_turns))
+    Benchmark(f'batch_plotter/N{_turns}', _batch_plotter_case(_turns))
+for _case, (_names, _forbidden) in IMPORT_CASES.items():
+    Benchmark(f'import/{_case}', _import_case(_names, _forbidden))
+
+
+def run_benchmarks(Filter=None, Repeat=5):
+    """
+    Runs every registered case whose name contains Filter and returns the results with a description of the environment.
+    """
+    results = {}
+    for name, benchmark in Benchmark.registry.items():
+        if Filter and Filter not in name:
+            continue
+        results[name] = benchmark.measure(Repeat)
+        print(f"{name:<32} {results[name]['time_median'] * 1e3:10.3f} ms {results[name]['peak_memory'] / 2**20:10.3f} MiB", flush=True)
+
+    environment = {'python': platform.python_version(), 'numpy': np.__version__, 'matplotlib': matplotlib.__version__,
+                   'machine': platform.machine(), 'processor': platform.processor(), 'system': platform.system()}
+    return {'environment': environment, 'results': results}
+
+
+def compare(Results, Baseline, Threshold=THRESHOLD, MinimumDeltas=MINIMUM_DELTAS):
+    """
+    Cases whose median time or peak memory is more than Threshold times the baseline and more than its MinimumDeltas
+    entry above it: list of (name, metric, ratio). Cases missing from either side are skipped.
+    """
+    regressions = []
+    for name, result in Results['results'].items():
+        reference = Baseline['results'].get(name)
+        if reference is None:
+            continue
+        for metric in ('time_median', 'peak_memory'):
+            if (reference[metric] > 0 and result[metric] / reference[metric] > Threshold
+                    and result[metric] - reference[metric] > MinimumDeltas[metric]):
+                regressions.append((name, metric, result[metric] / reference[metric]))
+    return regressions
+
+
+def over_budget(Results):
+    """
+    Cases whose median time exceeds their IMPORT_BUDGETS entry: list of (name, time, budget).
+    """
+    return [(name, Results['results'][name]['time_median'], budget) for name, budget in IMPORT_BUDGETS.items()
+            if name in Results['results'] and Results['results'][name]['time_median'] > budget]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default='bench_output.json', help="JSON file for the results")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="stored results to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--filter', default=None, help="only run the cases whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help="allowed ratio to the baseline")
+    parser.add_argument('--min-time-delta', type=float, default=MINIMUM_DELTAS['time_median'] * 1e3,
+                        help="smallest median time growth (ms) reported as a regression")
+    parser.add_argument('--min-memory-delta', type=float, default=MINIMUM_DELTAS['peak_memory'] / 2**20,
+                        help="smallest peak memory growth (MiB) reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.filter, args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=1)
+
+    exceeded = over_budget(results)
+    for name, seconds, budget in exceeded:
+        print(f"OVER BUDGET {name}: {seconds * 1e3:.1f} ms > {budget * 1e3:.0f} ms")
+
+    if args.save_baseline:
+        # A filtered run only replaces its own cases in an existing baseline
+        if args.filter and os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+            baseline['results'].update(results['results'])
+            results = baseline
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=1)
+        return 1 if exceeded else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}")
+        return 1 if exceeded else 0
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file), args.threshold,
+                              {'time_median': args.min_time_delta * 1e-3, 'peak_memory': args.min_memory_delta * 2**20})
+    for name, metric, ratio in regressions:
+        print(f"REGRESSION {name}: {metric} x{ratio:.2f}")
+    return 1 if regressions or exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Public API of the magnetics models.
+
+    import magnetics_modeling as mm
+    leakage = mm.LeakageInductanceCalculator(...)
+
+Every name is imported from its submodule on first access (PEP 562), so importing the package costs nothing beyond
+the package itself and a process that only uses the leakage kernels never loads matplotlib, the catalog or the loss
+models.
+"""
+import importlib
+
+
+__version__ = '0.1.0'
+
+# Public name -> module that defines it
+_EXPORTS = {
+    # Leakage inductance
+    'LeakageInductanceCalculator': 'magnetics_modeling.leakage_inductance.LeakageInductanceCalculator',
+    'BatchLeakageInductanceCalculator': 'magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator',
+    'MultiWindingLeakageCalculator': 'magnetics_modeling.leakage_inductance.MultiWindingLeakageCalculator',
+    'FrequencyDependentLeakageCalculator': 'magnetics_modeling.leakage_inductance.FrequencyDependentLeakageCalculator',
+    'FactorizedLeakageEngine': 'magnetics_modeling.leakage_inductance.FactorizedLeakageEngine',
+    'OpenBoundaryLeakageEngine': 'magnetics_modeling.leakage_inductance.OpenBoundaryLeakageEngine',
+    'LeakageFieldMap': 'magnetics_modeling.leakage_inductance.LeakageFieldMap',
+    'LeakageSurrogate': 'magnetics_modeling.leakage_inductance.LeakageSurrogate',
+    # Losses and thermal
+    'WindingLossCalculator': 'magnetics_modeling.winding_loss.WindingLossCalculator',
+    'CoreLossCalculator': 'magnetics_modeling.core_loss.CoreLossCalculator',
+    'ElectroThermalSolver': 'magnetics_modeling.thermal.ElectroThermalSolver',
+    # Geometry and cores
+    'WindingMaker': 'magnetics_modeling.auxiliary_functions.winding_maker',
+    'core_window_dimensions': 'magnetics_modeling.auxiliary_functions.core_window_dimensions',
+    'core_series_weights': 'magnetics_modeling.auxiliary_functions.core_window_dimensions',
+    'CoreCatalog': 'magnetics_modeling.auxiliary_functions.core_catalog',
+    'GetCore': 'magnetics_modeling.auxiliary_functions.core_catalog',
+    # Design evaluation
+    'DesignSweep': 'magnetics_modeling.auxiliary_functions.design_sweep',
+    'DesignSession': 'magnetics_modeling.auxiliary_functions.design_session',
+    'DesignService': 'magnetics_modeling.auxiliary_functions.design_service',
+    'DesignBatch': 'magnetics_modeling.auxiliary_functions.design_batch',
+    'ResultCache': 'magnetics_modeling.auxiliary_functions.result_cache',
+    'Profiler': 'magnetics_modeling.auxiliary_functions.profiling',
+    # Plotting (matplotlib)
+    'TransformerPlotter': 'magnetics_modeling.auxiliary_functions.core_window_plotter',
+    'BatchTransformerPlotter': 'magnetics_modeling.auxiliary_functions.batch_plotter',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value # Later accesses skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
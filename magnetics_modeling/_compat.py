@@ -0,0 +1,35 @@
+"""
+Aliases of the pre-package module paths (auxiliary_functions, leakage_inductance, ...) to the subpackages of
+magnetics_modeling. An old path resolves to the very same module object as the new one, so classes, caches and module
+state are shared whichever path imported them.
+"""
+import sys
+import importlib
+import importlib.abc
+import importlib.util
+
+
+class _AliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+
+    def __init__(self, Old, New):
+        self.Old = Old
+        self.New = New
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(self.Old + '.'):
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        return importlib.import_module(self.New + spec.name[len(self.Old):])
+
+    def exec_module(self, module):
+        pass
+
+
+def alias(Old, New):
+    """
+    Makes the package Old and every Old.<module> names of New and New.<module>.
+    """
+    sys.meta_path.insert(0, _AliasFinder(Old, New))
+    sys.modules[Old] = importlib.import_module(New)
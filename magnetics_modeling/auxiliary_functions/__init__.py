@@ -0,0 +1,4 @@
+"""
+Winding geometry, core catalog, design evaluation (sweeps, sessions, batch and service entry points), profiling and plotting.
+Import the submodules directly, or the public names lazily from magnetics_modeling.
+"""
@@ -0,0 +1,197 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.patches as patches
+from matplotlib.ticker import FuncFormatter
+from matplotlib.collections import EllipseCollection
+from matplotlib.legend import Legend
+from matplotlib.image import imsave
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.plot_colors import darken_color
+
+
+class BatchTransformerPlotter:
+    """
+    Headless (Agg) version of TransformerPlotter for rendering report images of many designs.
+    The figure, axes and every artist are created once. The axes, ticks, grid, title and legend only depend on the core
+    window, the bobbin type and the title, so they are drawn once per combination and cached as a background image;
+    each raster render restores that background and draws only the design artists (bobbin, spacer, turns and blocks)
+    over it. Vector formats (.svg, .pdf, ...) are saved with a full draw. The format is taken from the file extension.
+    """
+    RASTER_FORMATS = ('png', 'jpg', 'jpeg', 'tif', 'tiff', 'webp')
+
+    def __init__(self, figsize=(8, 8), dpi=100):
+
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ax.set_aspect('equal', adjustable='box')
+        # Grid and ticks under the patches, as they are when the design artists are drawn over the cached background
+        self.ax.set_axisbelow(True)
+
+        self.window = self.ax.add_patch(patches.Rectangle((0, 0), 0, 0, lw=2, ec='black', fc='none', label='Core Window'))
+        self.bobbin = self.ax.add_patch(patches.Rectangle((0, 0), 0, 0, lw=1.5, ls='--', ec='gray', fc='lightgray', alpha=0.3, label='Bobbin Window'))
+        self.spacer = self.ax.add_patch(patches.Rectangle((0, 0), 0, 0, linewidth=1, linestyle='--', edgecolor='gray', facecolor='lightgray', alpha=0.3, label='Spacing'))
+
+        # Insulation and copper collections of each winding, with the turn centers as offsets
+        primary_color, secondary_color = 'darkorange', 'royalblue'
+        self.turns = []
+        for color in (primary_color, secondary_color):
+            self.turns.append(tuple(
+                self.ax.add_collection(EllipseCollection([], [], [], units='xy', offsets=np.empty((0, 2)),
+                                                         offset_transform=self.ax.transData, facecolor=facecolor, edgecolor='none'))
+                for facecolor in (darken_color(color, 0.4), color)))
+
+        rect_style = {'linestyle': ':', 'linewidth': 1.5, 'facecolor': 'none', 'alpha': 0.8}
+        self.blocks = {
+            'primary': self.ax.add_patch(patches.Rectangle((0, 0), 0, 0, edgecolor=darken_color(primary_color), **rect_style, label='Primary Equivalent Block')),
+            'secondary': self.ax.add_patch(patches.Rectangle((0, 0), 0, 0, edgecolor=darken_color(secondary_color), **rect_style, label='Secondary Equivalent Block')),
+        }
+        self.design_artists = [self.bobbin, self.spacer, *(collection for pair in self.turns for collection in pair), *self.blocks.values()]
+
+        self.ax.set_xlabel('Window Width (mm)')
+        self.ax.set_ylabel('Window Height (mm)')
+        formatter = FuncFormatter(lambda x, pos: f'{x * 1000:.0f}')
+        self.ax.xaxis.set_major_formatter(formatter)
+        self.ax.yaxis.set_major_formatter(formatter)
+        self.ax.grid(True, linestyle=':', alpha=0.6)
+
+        # One legend per bobbin type, so only Split bobbins list the spacing
+        self.legends = {}
+        for BobbinType in ('Normal', 'Split'):
+            handles = [self.window, self.bobbin] + ([self.spacer] if BobbinType == 'Split' else []) + list(self.blocks.values())
+            self.legends[BobbinType] = self.ax.add_artist(Legend(self.ax, handles, [handle.get_label() for handle in handles],
+                                                                 loc='center left', bbox_to_anchor=(1.05, 0.5)))
+        # Fixed layout with room for the legend, so saving needs a single draw (no bbox_inches='tight' pass)
+        self.fig.subplots_adjust(left=0.1, right=0.68, bottom=0.08, top=0.94)
+
+        self._background_key = None
+        self._background = None
+
+    def _set_window(self, WindowWidth, WindowHeight, BobbinType, title):
+        # Everything that is part of the cached background
+        self.window.set_bounds(0, 0, WindowWidth, WindowHeight)
+        for name, legend in self.legends.items():
+            legend.set_visible(name == BobbinType)
+
+        x_margin = WindowWidth * 0.05
+        y_margin = WindowHeight * 0.05
+        self.ax.set_xlim(-x_margin, WindowWidth + x_margin)
+        self.ax.set_ylim(-y_margin, WindowHeight + y_margin)
+        self.ax.set_title(title)
+
+    def _draw_background(self, Key):
+        # Full draw without the design artists, kept until the window, bobbin type or title change
+        visible = [artist.get_visible() for artist in self.design_artists]
+        for artist in self.design_artists:
+            artist.set_visible(False)
+        self.fig.canvas.draw()
+        for artist, was_visible in zip(self.design_artists, visible):
+            artist.set_visible(was_visible)
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._background_key = Key
+
+    def render(self, Path, WindowWidth, WindowHeight, BobbinThickness, BobbinType, turns, winding_dims,
+               ConductorDiameter_1, InsulationThickness_1, ConductorDiameter_2, InsulationThickness_2,
+               PrimaryHeight=0, InterSectionSpacing=0, title="2D Core Window Plot"):
+        """
+        Draws one design on the shared figure and saves it to Path.
+        turns are the WindingMaker turn arrays (or the legacy list of per-turn dicts).
+        """
+        turns = WindingMaker.turn_arrays(turns)
+        bobbin_inner_width = WindowWidth - BobbinThickness
+        bobbin_inner_height = WindowHeight - 2 * BobbinThickness
+
+        self.bobbin.set_bounds(BobbinThickness, BobbinThickness, bobbin_inner_width, bobbin_inner_height)
+        self.spacer.set_bounds(BobbinThickness, BobbinThickness + PrimaryHeight, bobbin_inner_width, InterSectionSpacing)
+        self.spacer.set_visible(BobbinType == 'Split')
+
+        offsets = np.column_stack((turns['x'], turns['y']))
+        for winding, (pitch, diameter) in enumerate(((ConductorDiameter_1 + 2 * InsulationThickness_1, ConductorDiameter_1),
+                                                     (ConductorDiameter_2 + 2 * InsulationThickness_2, ConductorDiameter_2))):
+            winding_offsets = offsets[turns['winding'] == winding]
+            for collection, size in zip(self.turns[winding], (pitch, diameter)):
+                sizes = np.full(len(winding_offsets), size)
+                collection.set_offsets(winding_offsets)
+                collection.set_widths(sizes)
+                collection.set_heights(sizes)
+                collection.set_angles(np.zeros(len(winding_offsets)))
+
+        for name, block in self.blocks.items():
+            dims = winding_dims.get(name)
+            block.set_visible(dims is not None)
+            if dims is not None:
+                block.set_bounds(dims['x'], dims['y'], dims['width'], dims['height'])
+
+        key = (WindowWidth, WindowHeight, BobbinType, title)
+        if key != self._background_key:
+            self._set_window(*key)
+            self._background_key = None
+
+        extension = os.path.splitext(Path)[1][1:].lower() if isinstance(Path, (str, os.PathLike)) else 'png'
+        if extension not in self.RASTER_FORMATS:
+            self.fig.savefig(Path)
+            return Path
+
+        if self._background_key is None:
+            self._draw_background(key)
+        else:
+            self.fig.canvas.restore_region(self._background)
+        for artist in self.design_artists:
+            self.ax.draw_artist(artist)
+        imsave(Path, np.asarray(self.fig.canvas.buffer_rgba()), format=extension, dpi=self.fig.dpi)
+        return Path
+
+    def render_design(self, Path, WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+                      NumberOfTurns_1, NumberOfTurns_2,
+                      ConductorDiameter_1, InsulationThickness_1,
+                      ConductorDiameter_2, InsulationThickness_2,
+                      WindingsSpacing=0, PrimaryHeight=0, InterSectionSpacing=0, SecondaryHeight=0,
+                      SecondaryYAlign='bottom', PrimaryYAlignSplit='bottom', SecondaryYAlignSplit='bottom',
+                      title="2D Core Window Plot"):
+        """
+        Builds the geometry of one design (same arguments as WindingMaker) and renders it.
+        Returns Path, or None when the windings do not fit.
+        """
+        turns, winding_dims = WindingMaker.geometry(
+            WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+            NumberOfTurns_1, NumberOfTurns_2, ConductorDiameter_1, InsulationThickness_1,
+            ConductorDiameter_2, InsulationThickness_2, WindingsSpacing, PrimaryHeight,
+            InterSectionSpacing, SecondaryHeight, SecondaryYAlign,
+            PrimaryYAlignSplit, SecondaryYAlignSplit)
+        if not turns['x'].size:
+            return None
+
+        return self.render(Path, WindowWidth, WindowHeight, BobbinThickness, BobbinType, turns, winding_dims,
+                           ConductorDiameter_1, InsulationThickness_1, ConductorDiameter_2, InsulationThickness_2,
+                           PrimaryHeight, InterSectionSpacing, title)
+
+    @staticmethod
+    def render_designs(Designs, Processes=None, ChunkSize=16, **FigureOptions):
+        """
+        Renders an iterable of designs, each a dict with the output 'Path' and the render_design arguments.
+        Processes=0 renders in the calling process; otherwise chunks of designs are spread over a process pool and each
+        worker reuses a single figure. Returns the written paths (None for the designs that do not fit), in order.
+        """
+        Designs = list(Designs)
+        if Processes == 0:
+            return _RenderChunk(Designs, FigureOptions)
+
+        chunks = [Designs[start:start + ChunkSize] for start in range(0, len(Designs), ChunkSize)]
+        with ProcessPoolExecutor(max_workers=Processes or os.cpu_count()) as pool:
+            return [path for paths in pool.map(_RenderChunk, chunks, [FigureOptions] * len(chunks)) for path in paths]
+
+
+# One plotter per process, reused by every chunk that process renders
+_plotters = {}
+
+def _RenderChunk(Designs, FigureOptions):
+    key = tuple(sorted(FigureOptions.items()))
+    if key not in _plotters:
+        _plotters[key] = BatchTransformerPlotter(**FigureOptions)
+    plotter = _plotters[key]
+
+    return [plotter.render_design(**design) for design in Designs]
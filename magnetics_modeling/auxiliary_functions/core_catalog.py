@@ -0,0 +1,151 @@
+import os
+import csv
+import json
+import numpy as np
+from functools import lru_cache
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions import versioned_directory
+
+
+# Identification of a core, in GetCore argument order
+KEY_COLUMNS = ('manufacturer', 'family', 'sub_family', 'model', 'core_material')
+# Core dimensions as given by the manufacturers (NaN when a family does not define one)
+DIMENSION_COLUMNS = ('A', 'B', 'C', 'D', 'E', 'F', 'F2')
+# Precomputed at build time so no worker has to repeat it
+DERIVED_COLUMNS = ('WindowWidth', 'WindowHeight', 'WindowArea')
+
+DEFAULT_SOURCE = os.path.join(os.path.dirname(__file__), 'core_database', 'cores.csv')
+# Built on first use in the user cache (as ResultCache), so a read-only install works
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'magnetics-modeling', 'core_catalog')
+
+
+class CoreCatalog:
+    """
+    Columnar core database. Every column is stored as its own .npy file and opened memory-mapped, so opening the
+    catalog in each worker costs a few file handles regardless of the number of cores. Lookups by
+    (manufacturer, family, sub_family, model, core_material) go through a hash index and queries are plain
+    vectorized masks over the columns, e.g. catalog.where(catalog['WindowArea'] > 1e-4, family='ETD').
+    """
+    def __init__(self, Path=DEFAULT_PATH):
+
+        version = versioned_directory.current(Path)
+        with open(os.path.join(version, 'manifest.json')) as file:
+            manifest = json.load(file)
+
+        self.Path = Path
+        # Families stored without window dimensions (see build)
+        self.UnsupportedFamilies = manifest.get('unsupported_families', [])
+        self.Columns = {name: np.load(os.path.join(version, f'{name}.npy'), mmap_mode='r') for name in manifest['columns']}
+        self._index = None
+
+    def __len__(self):
+        return len(self.Columns['model'])
+
+    def __getitem__(self, name):
+        return self.Columns[name]
+
+    @property
+    def index(self):
+        # (manufacturer, family, sub_family, model, core_material) -> row, built on first lookup
+        if self._index is None:
+            self._index = {key: row for row, key in enumerate(zip(*(self.Columns[name].tolist() for name in KEY_COLUMNS)))}
+        return self._index
+
+    def GetCore(self, manufacturer, family, sub_family, model, core_material):
+        """
+        SelectedCore dict of one core, with its window dimensions already included.
+        """
+        try:
+            row = self.index[(manufacturer, family, sub_family, model, core_material)]
+        except KeyError:
+            raise KeyError(f"Core not found in the catalog: {manufacturer} / {family} / {sub_family} / {model} / {core_material}") from None
+        return self.record(row)
+
+    def record(self, row):
+        # Family-specific dimensions that are not defined (NaN) are left out, as in a hand-written SelectedCore
+        core = {name: str(self.Columns[name][row]) for name in KEY_COLUMNS}
+        for name in DIMENSION_COLUMNS + DERIVED_COLUMNS:
+            value = float(self.Columns[name][row])
+            if not np.isnan(value):
+                core[name] = value
+        return core
+
+    def where(self, Mask=True, **Keys):
+        """
+        Rows matching a boolean mask over the columns and, optionally, exact values (or tuples of values) of the key columns.
+        """
+        mask = np.broadcast_to(np.asarray(Mask, dtype=bool), (len(self),)).copy()
+        for name, value in Keys.items():
+            if name not in KEY_COLUMNS:
+                raise ValueError(f"Unknown key column: {name}")
+            mask &= np.isin(self.Columns[name], value if isinstance(value, (tuple, list)) else [value])
+        return np.flatnonzero(mask)
+
+    def select(self, Rows, Columns=None):
+        """
+        Dict of column arrays for the given rows.
+        """
+        return {name: np.asarray(self.Columns[name][Rows]) for name in (Columns or self.Columns)}
+
+    @staticmethod
+    def build(Records, Path=DEFAULT_PATH):
+        """
+        Writes the columnar catalog of an iterable of core dicts (KEY_COLUMNS plus the dimensions they define).
+        The columns are written to a new version directory of Path that is then published atomically (see
+        versioned_directory), so concurrent readers never see a partial or missing catalog. Empty or missing
+        dimensions are stored as NaN, and so are the window dimensions of the families core_window_dimensions does not
+        model; those families are listed under 'unsupported_families' in the manifest.
+        """
+        Records = list(Records)
+        columns = {name: np.array([str(record[name]) for record in Records]) for name in KEY_COLUMNS}
+        for name in DIMENSION_COLUMNS:
+            columns[name] = np.array([np.nan if record.get(name) in (None, '') else float(record[name]) for record in Records],
+                                     dtype=np.float64)
+
+        columns['WindowWidth'] = np.full(len(Records), np.nan)
+        columns['WindowHeight'] = np.full(len(Records), np.nan)
+        unsupported = []
+        for family in np.unique(columns['family']):
+            rows = columns['family'] == family
+            try:
+                columns['WindowWidth'][rows], columns['WindowHeight'][rows] = core_window_dimensions(
+                    {'family': str(family), **{name: columns[name][rows] for name in DIMENSION_COLUMNS}})
+            except ValueError:
+                unsupported.append(str(family))
+        columns['WindowArea'] = columns['WindowWidth'] * columns['WindowHeight']
+
+        version = versioned_directory.new_version(Path)
+        try:
+            for name, values in columns.items():
+                np.save(os.path.join(version, f'{name}.npy'), values)
+            with open(os.path.join(version, 'manifest.json'), 'w') as file:
+                json.dump({'columns': list(columns), 'cores': len(Records), 'unsupported_families': unsupported}, file, indent=2)
+        except BaseException:
+            versioned_directory.discard(version)
+            raise
+        versioned_directory.publish(Path, version)
+
+        return CoreCatalog(Path)
+
+    @staticmethod
+    def from_csv(Source=DEFAULT_SOURCE, Path=DEFAULT_PATH):
+        """
+        Opens the catalog built from a CSV source (one core per row, header with KEY_COLUMNS and the dimensions in meters),
+        rebuilding it first when it is missing or older than the source.
+        """
+        manifest = os.path.join(versioned_directory.current(Path), 'manifest.json')
+        if not os.path.exists(manifest) or os.path.getmtime(manifest) < os.path.getmtime(Source):
+            with open(Source, newline='') as file:
+                return CoreCatalog.build(csv.DictReader(file), Path)
+        return CoreCatalog(Path)
+
+
+@lru_cache(maxsize=None)
+def default_catalog():
+    # Catalog of the CSV shipped in core_database/, opened once per process
+    return CoreCatalog.from_csv()
+
+
+def GetCore(manufacturer, family, sub_family, model, core_material):
+    return default_catalog().GetCore(manufacturer, family, sub_family, model, core_material)
@@ -0,0 +1,41 @@
+import numpy as np
+
+
+def core_window_dimensions(SelectedCore):
+
+    # Cores coming from the CoreCatalog already carry their window dimensions
+    if "WindowWidth" in SelectedCore and "WindowHeight" in SelectedCore:
+        return SelectedCore["WindowWidth"], SelectedCore["WindowHeight"]
+
+    match SelectedCore["family"]:
+        case 'ETD' | 'EFD':
+            WindowWidth  = (SelectedCore["E"] - SelectedCore["F"])/2
+            WindowHeight = SelectedCore["D"]*2
+
+        case family:
+            raise ValueError(f"Unsupported core family {family!r} (only ETD and EFD cores are modeled)")
+
+    return WindowWidth, WindowHeight
+
+
+def core_series_weights(SelectedCore):
+    """
+    Central-leg diameter of the p.u.a. series and weights of the 2D leakage series ('pul_IW', 'pul_OW', 'pua_IW',
+    'pua_OW'; the ones a family does not use are left out) whose weighted sum is the leakage inductance of the core.
+    The p.u.a. weights are the ENTIRE inside-window angle alpha of a turn and the rest of the turn, 2 pi - alpha.
+    """
+    match SelectedCore["family"]:
+        case 'ETD':
+            DiameterCentralLeg = SelectedCore["F"]
+            alpha = 4*np.arctan((SelectedCore["C"]/2)/(SelectedCore["E"]/2))
+            Weights = {'pua_IW': alpha, 'pua_OW': 2*np.pi - alpha}
+
+        case 'EFD':
+            DiameterCentralLeg = 0
+            alpha = 2*np.arctan((SelectedCore["C"]-SelectedCore["F2"])/((SelectedCore["E"]-SelectedCore["F"])/2))
+            Weights = {'pul_IW': SelectedCore["F2"], 'pul_OW': SelectedCore["F"], 'pua_IW': alpha, 'pua_OW': 2*np.pi - alpha}
+
+        case family:
+            raise ValueError(f"Unsupported core family {family!r} (only ETD and EFD cores are modeled)")
+
+    return DiameterCentralLeg, Weights
@@ -2,24 +2,19 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.ticker import FuncFormatter
-import matplotlib.colors as mcolors
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import EllipseCollection
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.plot_colors import darken_color
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
 
 
 class TransformerPlotter:
     """
     This class plots the core window.
     """
-    @staticmethod
-    def darken_color(color, amount=0.5):
-        try:
-            c = mcolors.cnames[color]
-        except:
-            c = color
-        c = mcolors.to_rgb(c)
-        c = mcolors.rgb_to_hsv(c)
-        c[2] = c[2] * (1 - amount)
-        return mcolors.hsv_to_rgb(c)
+    darken_color = staticmethod(darken_color)
+    turn_arrays = staticmethod(WindingMaker.turn_arrays)
     
     def __init__(self, WindowWidth, WindowHeight, BobbinThickness, BobbinType, 
                  PrimaryHeight=0, InterSectionSpacing=0):
@@ -46,30 +41,22 @@ class TransformerPlotter:
                       ConductorDiameter_1, InsulationThickness_1,
                       ConductorDiameter_2, InsulationThickness_2):
         
-        if not coordinates:
+        turns = self.turn_arrays(coordinates)
+        if not turns['x'].size:
             print("ERROR: No Geometry Assigned!")
             return
 
-        primary_ins_patches, primary_cop_patches = [], []
-        secondary_ins_patches, secondary_cop_patches = [], []
-
         pitch_1 = ConductorDiameter_1 + 2 * InsulationThickness_1
         pitch_2 = ConductorDiameter_2 + 2 * InsulationThickness_2
         
-        for turn in coordinates:
-            x, y = turn['x'], turn['y']
-            if turn['winding'] == 'primary':
-                primary_ins_patches.append(patches.Circle((x, y), pitch_1 / 2))
-                primary_cop_patches.append(patches.Circle((x, y), ConductorDiameter_1 / 2))
-            else:
-                secondary_ins_patches.append(patches.Circle((x, y), pitch_2 / 2))
-                secondary_cop_patches.append(patches.Circle((x, y), ConductorDiameter_2 / 2))
-        
+        # One collection per winding and layer (insulation / copper), sized in data units
         primary_color, secondary_color = 'darkorange', 'royalblue' 
-        self.ax.add_collection(PatchCollection(primary_ins_patches, facecolor=self.darken_color(primary_color, 0.4), edgecolor='none'))
-        self.ax.add_collection(PatchCollection(primary_cop_patches, facecolor=primary_color, edgecolor='none'))
-        self.ax.add_collection(PatchCollection(secondary_ins_patches, facecolor=self.darken_color(secondary_color, 0.4), edgecolor='none'))
-        self.ax.add_collection(PatchCollection(secondary_cop_patches, facecolor=secondary_color, edgecolor='none'))
+        for winding, pitch, diameter, color in ((0, pitch_1, ConductorDiameter_1, primary_color),
+                                                (1, pitch_2, ConductorDiameter_2, secondary_color)):
+            offsets = np.column_stack((turns['x'], turns['y']))[turns['winding'] == winding]
+            for size, facecolor in ((pitch, self.darken_color(color, 0.4)), (diameter, color)):
+                self.ax.add_collection(EllipseCollection(size, size, 0, units='xy', offsets=offsets,
+                                                         offset_transform=self.ax.transData, facecolor=facecolor, edgecolor='none'))
         
         rect_style = {'linestyle': ':', 'linewidth': 1.5, 'facecolor': 'none', 'alpha': 0.8}
         if 'primary' in winding_dims:
@@ -81,6 +68,18 @@ class TransformerPlotter:
             self.ax.add_patch(patches.Rectangle((s_dims['x'], s_dims['y']), s_dims['width'], s_dims['height'],
                                   edgecolor=self.darken_color(secondary_color), **rect_style, label='Secondary Equivalent Block'))
 
+    def plot_field(self, Field, Quantity='B', Levels=32, Cmap='viridis', Streamlines=True):
+        """
+        Overlays a field map (LeakageFieldMap.grid) under the geometry: filled contours of Quantity ('B' or 'A') and,
+        optionally, the field lines of (Bx, By).
+        """
+        labels = {'B': '|B| (T)', 'A': 'A (Wb/m)'}
+        contour = self.ax.contourf(Field['x'], Field['y'], Field[Quantity], levels=Levels, cmap=Cmap, zorder=0)
+        self.fig.colorbar(contour, ax=self.ax, label=labels[Quantity], shrink=0.8)
+        if Streamlines:
+            self.ax.streamplot(Field['x'], Field['y'], Field['Bx'], Field['By'], color='white', linewidth=0.6, density=1.2,
+                               arrowsize=0.6, zorder=0.5)
+
     def finalize_and_show(self, title="2D Core Window Plot", instance_name="transformer_plot"):
         self.ax.set_title(title)
         self.ax.set_xlabel('Window Width (mm)')
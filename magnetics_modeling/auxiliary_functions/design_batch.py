@@ -0,0 +1,239 @@
+"""
+Streaming batch evaluation of candidate designs read from a CSV or JSONL file (or stdin).
+
+    python -m magnetics_modeling.auxiliary_functions.design_batch designs.csv -o results.jsonl --chunk-size 4096
+    cat designs.jsonl | python -m magnetics_modeling.auxiliary_functions.design_batch - -o results.csv --input-format jsonl
+    python -m magnetics_modeling.auxiliary_functions.design_batch designs.csv -o results.jsonl --resume
+
+Every row holds the WindingMaker arguments after the window dimensions (named as in DesignSweep, the optional ones
+with its DEFAULTS), the core and, optionally, 'ReferredWinding' and an 'id' copied to the result. The core is
+either the KEY_COLUMNS of a catalog core or 'family' and its dimensions (A, B, ...); a JSONL row may also give it as a
+"core" object, as in a design_service request. Each result line holds the row number, 'fits', 'LeakageInductance',
+the equivalent blocks of both windings and 'error' for rows that could not be evaluated, including rows with a design
+design_service would reject (turns, lengths, bobbin type, alignments) or core dimensions that are not positive.
+"""
+import os
+import sys
+import csv
+import json
+import math
+import hashlib
+import argparse
+import itertools
+
+from magnetics_modeling.auxiliary_functions.core_catalog import GetCore, KEY_COLUMNS, DIMENSION_COLUMNS
+from magnetics_modeling.auxiliary_functions.design_sweep import _Chunked
+from magnetics_modeling.auxiliary_functions.design_service import _Core, _Normalized, _EvaluateBatch, _Finite
+
+
+# Columns of a row that are not WindingMaker arguments
+ROW_COLUMNS = ('id', 'core', 'ReferredWinding') + KEY_COLUMNS + DIMENSION_COLUMNS
+WINDING_KEYS = ('x', 'y', 'width', 'height', 'turns_per_layer', 'layers')
+OUTPUT_COLUMNS = (('row', 'id', 'fits', 'LeakageInductance')
+                  + tuple(f'{winding}_{key}' for winding in ('primary', 'secondary') for key in WINDING_KEYS) + ('error',))
+FORMATS = ('csv', 'jsonl')
+
+
+class DesignBatch:
+    """
+    Reads the designs of Input ('-' for stdin) ChunkSize rows at a time, evaluates every chunk with one vectorized fit
+    check and one batched leakage calculation per (core, referred winding) of the chunk and appends its results to
+    Output, so memory stays flat whatever the size of the input.
+
+    After every chunk the output is flushed to disk and Output.checkpoint records the rows done and the size of the
+    output; run(Resume=True) truncates a chunk that was only partly written and skips the rows already done. The
+    checkpoint also keeps the SHA-256 of the input file, so it is not resumed against a file that changed since.
+    """
+    def __init__(self, Input, Output, InputFormat=None, OutputFormat=None, ChunkSize=1024, ReferredWinding='Primary'):
+
+        self.Input = Input
+        self.Output = Output
+        self.InputFormat = InputFormat or self._format(Input)
+        self.OutputFormat = OutputFormat or self._format(Output)
+        self.ChunkSize = ChunkSize
+        self.ReferredWinding = ReferredWinding
+        self.Checkpoint = f'{Output}.checkpoint'
+
+        for name, path, value in (('input', Input, self.InputFormat), ('output', Output, self.OutputFormat)):
+            if value not in FORMATS:
+                raise ValueError(f"Unknown {name} format of {path!r} (expected one of {FORMATS})")
+
+    @staticmethod
+    def _format(Path):
+        # csv or jsonl, from the extension of a path (None for stdin and unknown extensions)
+        extension = os.path.splitext(Path)[1].lower().lstrip('.')
+        return {'csv': 'csv', 'jsonl': 'jsonl', 'ndjson': 'jsonl'}.get(extension)
+
+    @staticmethod
+    def _digest(Path):
+        # SHA-256 of an input file (None for stdin, which cannot be checked)
+        if Path == '-':
+            return None
+        digest = hashlib.sha256()
+        with open(Path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    # Input
+    def _rows(self, stream):
+        """
+        Lazily yields (row, error) per input row: a dict of its non-empty fields, or the reason it could not be parsed.
+        """
+        if self.InputFormat == 'csv':
+            for row in csv.DictReader(stream):
+                yield {name: value for name, value in row.items() if name and value not in ('', None)}, None
+            return
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield None, error
+                continue
+            yield (row, None) if isinstance(row, dict) else (None, TypeError("Every JSONL row must be an object"))
+
+    def _parse(self, Row):
+        # (SelectedCore, ReferredWinding, WindingMaker arguments) of an input row
+        if 'core' in Row:
+            core = _Core(Row['core'])
+        elif 'A' in Row:
+            core = {'family': Row['family'], **{name: float(Row[name]) for name in DIMENSION_COLUMNS if name in Row}}
+            for name in DIMENSION_COLUMNS:
+                if name in core and not (math.isfinite(core[name]) and core[name] > 0):
+                    raise ValueError(f"Core dimension {name} must be a positive number, not {core[name]}")
+        else:
+            core = GetCore(*(Row[name] for name in KEY_COLUMNS))
+        design = _Normalized({name: value for name, value in Row.items() if name not in ROW_COLUMNS})
+        return core, Row.get('ReferredWinding', self.ReferredWinding), design
+
+    # Evaluation
+    def _evaluate(self, Rows, Start):
+        """
+        Results of a chunk of (row, error) pairs, the first of which is input row Start.
+        """
+        results, groups = [], {}
+        for index, (row, problem) in enumerate(Rows):
+            result = dict.fromkeys(OUTPUT_COLUMNS)
+            result.update({'row': Start + index, 'id': row.get('id') if row else None, 'fits': False})
+            try:
+                if problem is not None:
+                    raise problem
+                core, referred, design = self._parse(row)
+                groups.setdefault((json.dumps(core, sort_keys=True), referred), []).append((index, design))
+            except (KeyError, TypeError, ValueError) as error:
+                result['error'] = f"{type(error).__name__}: {error}"
+            results.append(result)
+
+        for (core, referred), items in groups.items():
+            try:
+                fits, winding_dims, leakage = _EvaluateBatch(json.loads(core), referred, [design for _, design in items])
+            except Exception as error:
+                for index, _ in items:
+                    results[index]['error'] = f"{type(error).__name__}: {error}"
+                continue
+            for position, (index, _) in enumerate(items):
+                if fits[position]:
+                    results[index].update({'fits': True, 'LeakageInductance': _Finite(leakage[position]),
+                                           **{f'{winding}_{key}': _Finite(winding_dims[winding][key][position])
+                                              for winding in ('primary', 'secondary') for key in WINDING_KEYS}})
+        return results
+
+    # Output
+    def _write(self, file, Results, Header):
+        if self.OutputFormat == 'csv':
+            writer = csv.DictWriter(file, OUTPUT_COLUMNS)
+            if Header:
+                writer.writeheader()
+            writer.writerows(Results)
+        else:
+            file.writelines(json.dumps(result, allow_nan=False) + '\n' for result in Results)
+
+    def _save_checkpoint(self, State):
+        # Written aside and renamed, so an interruption leaves either the previous or the new checkpoint
+        with open(f'{self.Checkpoint}.tmp', 'w') as file:
+            json.dump(State, file, indent=2)
+        os.replace(f'{self.Checkpoint}.tmp', self.Checkpoint)
+
+    def run(self, Resume=False):
+        """
+        Evaluates every row of the input and returns the summary also kept in the checkpoint
+        ({'input', 'input_sha256', 'rows', 'fitting', 'errors', 'chunks', 'output_bytes', 'complete'}).
+        """
+        state = {'input': self.Input, 'input_sha256': self._digest(self.Input), 'rows': 0, 'fitting': 0, 'errors': 0, 'chunks': 0, 'output_bytes': 0, 'complete': False}
+        to_stdout = self.Output == '-'
+        if Resume:
+            if to_stdout:
+                raise ValueError("Resuming needs an output file")
+            if os.path.exists(self.Checkpoint):
+                with open(self.Checkpoint) as file:
+                    state = json.load(file)
+                if state['input'] != self.Input:
+                    raise ValueError(f"{self.Checkpoint} belongs to input {state['input']!r}, not {self.Input!r}")
+                if state.get('input_sha256') != self._digest(self.Input):
+                    raise ValueError(f"{self.Input!r} changed since {self.Checkpoint} was written")
+
+        if to_stdout:
+            output = sys.stdout
+        else:
+            # Drops whatever was written after the last checkpoint (a partly written chunk)
+            with open(self.Output, 'a'):
+                pass
+            os.truncate(self.Output, state['output_bytes'])
+            output = open(self.Output, 'a', newline='' if self.OutputFormat == 'csv' else None)
+
+        source = sys.stdin if self.Input == '-' else open(self.Input, newline='')
+        try:
+            rows = itertools.islice(self._rows(source), state['rows'], None)
+            header = state['output_bytes'] == 0
+            for chunk in _Chunked(rows, self.ChunkSize):
+                results = self._evaluate(chunk, state['rows'])
+                self._write(output, results, header)
+                header = False
+                output.flush()
+
+                state['rows'] += len(chunk)
+                state['chunks'] += 1
+                state['fitting'] += sum(result['fits'] for result in results)
+                state['errors'] += sum(result['error'] is not None for result in results)
+                if not to_stdout:
+                    os.fsync(output.fileno())
+                    state['output_bytes'] = os.path.getsize(self.Output)
+                    self._save_checkpoint(state)
+            state['complete'] = True
+            if not to_stdout:
+                self._save_checkpoint(state)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+
+        return state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', help="CSV or JSONL file of designs ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="CSV or JSONL file of results ('-' for stdout)")
+    parser.add_argument('--input-format', choices=FORMATS, default=None, help="default: from the extension")
+    parser.add_argument('--output-format', choices=FORMATS, default=None, help="default: from the extension, else jsonl")
+    parser.add_argument('--chunk-size', type=int, default=1024, help="designs evaluated (and checkpointed) together")
+    parser.add_argument('--referred-winding', choices=('Primary', 'Secondary'), default='Primary',
+                        help="for rows without a ReferredWinding")
+    parser.add_argument('--resume', action='store_true', help="continue after the last completed chunk of the output")
+    args = parser.parse_args(argv)
+
+    try:
+        batch = DesignBatch(args.input, args.output, args.input_format,
+                            args.output_format or DesignBatch._format(args.output) or 'jsonl', args.chunk_size, args.referred_winding)
+        summary = batch.run(Resume=args.resume)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{summary['rows']} designs, {summary['fitting']} fitting, {summary['errors']} errors", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,414 @@
+"""
+Local design evaluation service: WindingMaker fit check + leakage inductance over HTTP/JSON on localhost.
+
+    python -m magnetics_modeling.auxiliary_functions.design_service --port 8765 --processes 4
+
+    POST /evaluate  {"core": {...}, "ReferredWinding": "Primary", "designs": [{...}, ...]}   (or "design": {...})
+    GET  /metrics   latency, throughput, batching and queue statistics
+    GET  /health
+
+"core" is either a SelectedCore dict with its dimensions or the (manufacturer, family, sub_family, model,
+core_material) key of a core of the catalog. Each design holds the WindingMaker arguments after the window dimensions,
+named as in DesignSweep: turn counts are positive integers, lengths finite and non-negative (conductor diameters and
+the Split section heights positive), the bobbin type and alignments one of CHOICES and "ReferredWinding" one of
+REFERRED_WINDINGS, otherwise the request gets 400.
+The result of each design is {"fits", "LeakageInductance", "winding_dims"}, with null for values that are not finite.
+"""
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+import statistics
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.core_catalog import GetCore, KEY_COLUMNS
+from magnetics_modeling.auxiliary_functions.design_sweep import COMMON_PARAMETERS, DEFAULTS, BLOCK_KEYS, BOBBIN_PARAMETERS
+from magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator import BatchLeakageInductanceCalculator
+
+
+STRING_PARAMETERS = ('BobbinType', 'SecondaryYAlign', 'PrimaryYAlignSplit', 'SecondaryYAlignSplit')
+# Values WindingMaker understands for each string parameter
+CHOICES = {'BobbinType': tuple(BOBBIN_PARAMETERS), 'SecondaryYAlign': ('bottom', 'center'),
+           'PrimaryYAlignSplit': ('bottom', 'center', 'top'), 'SecondaryYAlignSplit': ('bottom', 'center', 'top')}
+TURN_PARAMETERS = ('NumberOfTurns_1', 'NumberOfTurns_2')
+REFERRED_WINDINGS = ('Primary', 'Secondary')
+# Lengths that must be positive (the others may be 0); the section heights only for Split bobbins
+POSITIVE_PARAMETERS = {'Normal': ('ConductorDiameter_1', 'ConductorDiameter_2'),
+                       'Split': ('ConductorDiameter_1', 'ConductorDiameter_2', 'PrimaryHeight', 'SecondaryHeight')}
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error', 503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+
+class Overloaded(Exception):
+    pass
+
+
+class DesignService:
+    """
+    asyncio HTTP/JSON server that coalesces the designs of concurrent requests into batched evaluations.
+    Designs are queued per (core, referred winding); a dispatcher takes the oldest group once a worker is free, waits up
+    to MaxBatchDelay for the batch to fill and sends up to MaxBatchSize designs as one vectorized fit check + batched
+    leakage calculation to the worker pool. While every worker is busy the queues keep growing, so the batches get
+    larger under load. Requests that would take the queued and running designs beyond MaxPending are rejected with 503.
+    Processes=0 evaluates in a thread of the serving process.
+    """
+    def __init__(self, Host='127.0.0.1', Port=8765, Processes=None, MaxBatchSize=256, MaxBatchDelay=0.002,
+                 MaxPending=4096, MaxBodyBytes=2**20, RequestTimeout=30, LatencyWindow=4096):
+
+        self.Host = Host
+        self.Port = Port
+        self.Processes = Processes
+        self.MaxBatchSize = MaxBatchSize
+        self.MaxBatchDelay = MaxBatchDelay
+        self.MaxPending = MaxPending
+        self.MaxBodyBytes = MaxBodyBytes
+        self.RequestTimeout = RequestTimeout
+
+        self.Counters = {'requests': 0, 'designs': 0, 'rejected': 0, 'errors': 0, 'timeouts': 0, 'batches': 0, 'batched_designs': 0}
+        self._latencies = deque(maxlen=LatencyWindow)   # seconds per /evaluate request
+        self._batch_times = deque(maxlen=LatencyWindow) # seconds per worker batch
+        self._completions = deque(maxlen=LatencyWindow) # (time, designs) of the finished batches
+
+        self._groups = OrderedDict() # (core, referred winding) -> [(future, design, arrival)], oldest group first
+        self._pending = 0            # designs queued or being evaluated
+        self._server = None
+        self._pool = None
+        self._dispatcher = None
+        self._batches = set()
+
+    @property
+    def Workers(self):
+        return 1 if self.Processes == 0 else self.Processes
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        if self.Processes == 0:
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.Processes = self.Processes or os.cpu_count()
+            self._pool = ProcessPoolExecutor(max_workers=self.Processes)
+        # Starts the workers (and their imports) before the first request
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _WarmUp) for _ in range(self.Workers)))
+
+        self._started = time.monotonic()
+        self._slots = asyncio.Semaphore(self.Workers)
+        self._arrived = asyncio.Event()
+        self._dispatcher = loop.create_task(self._dispatch())
+        self._server = await asyncio.start_server(self._handle, self.Host, self.Port)
+        self.Port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        for items in self._groups.values():
+            for future, _, _ in items:
+                if not future.done():
+                    future.set_exception(Overloaded("Service stopped"))
+        self._groups.clear()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._pool is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._pool.shutdown)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def serve_forever(self):
+        async with self:
+            await self._server.serve_forever()
+
+    # Coalescing
+    async def evaluate(self, SelectedCore, Designs, ReferredWinding='Primary'):
+        """
+        Results of a list of designs (dicts of WindingMaker arguments) for one core, evaluated with the designs of the
+        other concurrent callers. Raises Overloaded when the queue is full.
+        """
+        if ReferredWinding not in REFERRED_WINDINGS:
+            raise ValueError(f"ReferredWinding must be one of {REFERRED_WINDINGS}, not {ReferredWinding!r}")
+        designs = [_Normalized(design) for design in Designs]
+        if not designs:
+            return []
+        if len(designs) > self.MaxPending:
+            raise ValueError(f"{len(designs)} designs in one request (limit {self.MaxPending})")
+        if self._pending + len(designs) > self.MaxPending:
+            self.Counters['rejected'] += 1
+            raise Overloaded(f"{self._pending} designs pending (limit {self.MaxPending})")
+
+        loop = asyncio.get_running_loop()
+        key = (json.dumps(SelectedCore, sort_keys=True), ReferredWinding)
+        futures = [loop.create_future() for _ in designs]
+        self._groups.setdefault(key, []).extend((future, design, loop.time()) for future, design in zip(futures, designs))
+        self._pending += len(designs)
+        self.Counters['designs'] += len(designs)
+        self._arrived.set()
+        return await asyncio.gather(*futures)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            while not self._groups:
+                self._arrived.clear()
+                await self._arrived.wait()
+
+            key, items = next(iter(self._groups.items()))
+            try:
+                # An idle worker waits a little for the batch to fill; a busy pool has already let it fill
+                delay = items[0][2] + self.MaxBatchDelay - loop.time()
+                if delay > 0 and len(items) < self.MaxBatchSize:
+                    await asyncio.sleep(delay)
+            except Exception as error:
+                # A malformed group fails its own requests instead of stopping the dispatcher
+                for future, _, _ in self._groups.pop(key, ()):
+                    self._pending -= 1
+                    if not future.done():
+                        future.set_exception(error)
+                self._slots.release()
+                continue
+
+            items = self._groups.pop(key)
+            batch, rest = items[:self.MaxBatchSize], items[self.MaxBatchSize:]
+            if rest:
+                self._groups[key] = rest # Behind the other groups, so one large request does not starve them
+
+            # Designs of requests that have timed out or disconnected are dropped
+            live = [item for item in batch if not item[0].done()]
+            self._pending -= len(batch) - len(live)
+            if not live:
+                self._slots.release()
+                continue
+            task = loop.create_task(self._run_batch(key, live))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, key, items):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            fits, winding_dims, leakage = await loop.run_in_executor(
+                self._pool, _EvaluateBatch, json.loads(key[0]), key[1], [design for _, design, _ in items])
+        except Exception as error:
+            for future, _, _ in items:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for index, (future, _, _) in enumerate(items):
+                if not future.done():
+                    future.set_result(_Result(index, fits, winding_dims, leakage))
+        finally:
+            self._slots.release()
+            self._pending -= len(items)
+            self.Counters['batches'] += 1
+            self.Counters['batched_designs'] += len(items)
+            self._batch_times.append(time.perf_counter() - start)
+            self._completions.append((time.monotonic(), len(items)))
+
+    def metrics(self):
+        """
+        Counters, latency percentiles (over the last LatencyWindow requests), throughput and queue state.
+        """
+        now = time.monotonic()
+        uptime = now - self._started
+        recent = [designs for finished, designs in self._completions if now - finished <= 60]
+
+        def percentiles(samples):
+            if not samples:
+                return None
+            p50, p90, p99 = np.percentile(samples, (50, 90, 99))
+            return {'mean': statistics.fmean(samples), 'p50': p50, 'p90': p90, 'p99': p99, 'max': max(samples)}
+
+        return {**self.Counters,
+                'uptime': uptime,
+                'latency': percentiles(self._latencies),
+                'batch_time': percentiles(self._batch_times),
+                'mean_batch_size': self.Counters['batched_designs'] / self.Counters['batches'] if self.Counters['batches'] else None,
+                'throughput': self.Counters['batched_designs'] / uptime if uptime > 0 else 0.0,
+                'throughput_last_minute': sum(recent) / min(60, uptime) if uptime > 0 else 0.0,
+                'pending': self._pending,
+                'queued': sum(len(items) for items in self._groups.values()),
+                'max_pending': self.MaxPending,
+                'workers': self.Workers}
+
+    # HTTP
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > self.MaxBodyBytes:
+                    await self._respond(writer, 413, {'error': f"Body larger than {self.MaxBodyBytes} bytes"}, False)
+                    break
+                body = await reader.readexactly(length)
+
+                status, payload = await self._route(method, target.partition('?')[0], body)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, Status, Payload, KeepAlive):
+        body = json.dumps(Payload, allow_nan=False).encode()
+        headers = [f'HTTP/1.1 {Status} {REASONS[Status]}', 'Content-Type: application/json', f'Content-Length: {len(body)}',
+                   f"Connection: {'keep-alive' if KeepAlive else 'close'}"]
+        if Status == 503:
+            headers.append('Retry-After: 1')
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode() + body)
+        await writer.drain()
+
+    async def _route(self, Method, Path, Body):
+        routes = {'/evaluate': 'POST', '/metrics': 'GET', '/health': 'GET'}
+        if Path not in routes:
+            return 404, {'error': f"Unknown path {Path}"}
+        if Method != routes[Path]:
+            return 405, {'error': f"{Path} only accepts {routes[Path]}"}
+        if Path == '/metrics':
+            return 200, self.metrics()
+        if Path == '/health':
+            return 200, {'status': 'ok', 'pending': self._pending}
+
+        self.Counters['requests'] += 1
+        start = time.perf_counter()
+        try:
+            request = json.loads(Body)
+            SelectedCore = _Core(request['core'])
+            single = 'design' in request
+            designs = [request['design']] if single else request['designs']
+            results = await asyncio.wait_for(self.evaluate(SelectedCore, designs, request.get('ReferredWinding', 'Primary')),
+                                             self.RequestTimeout)
+        except Overloaded as error:
+            return 503, {'error': str(error)}
+        except asyncio.TimeoutError:
+            self.Counters['timeouts'] += 1
+            return 504, {'error': f"No result within {self.RequestTimeout} s"}
+        except (KeyError, TypeError, ValueError) as error:
+            self.Counters['errors'] += 1
+            return 400, {'error': f"{type(error).__name__}: {error}"}
+        except Exception as error:
+            self.Counters['errors'] += 1
+            return 500, {'error': f"{type(error).__name__}: {error}"}
+
+        self._latencies.append(time.perf_counter() - start)
+        return 200, {'result': results[0]} if single else {'results': results}
+
+
+def _Core(Core):
+    # SelectedCore dict of a request: given with its dimensions or looked up in the catalog by its key
+    if not isinstance(Core, dict):
+        raise TypeError("core must be an object")
+    if 'A' in Core:
+        return Core
+    return GetCore(*(Core[name] for name in KEY_COLUMNS))
+
+
+def _Normalized(Design):
+    # WindingMaker arguments of a design, with the defaults filled in and the numbers as floats
+    if not isinstance(Design, dict):
+        raise TypeError("Every design must be an object")
+    unknown = set(Design) - set(COMMON_PARAMETERS) - set(DEFAULTS) - {'BobbinType'}
+    if unknown:
+        raise ValueError(f"Unknown design parameters: {sorted(unknown)}")
+    design = {'BobbinType': Design['BobbinType'], **{name: Design.get(name, DEFAULTS[name]) for name in DEFAULTS}}
+    for name in COMMON_PARAMETERS:
+        design[name] = Design[name]
+    for name, value in design.items():
+        if name in STRING_PARAMETERS:
+            design[name] = value = str(value)
+            if value not in CHOICES[name]:
+                raise ValueError(f"{name} must be one of {CHOICES[name]}, not {value!r}")
+            continue
+        if isinstance(value, bool):
+            raise TypeError(f"{name} must be a number")
+        design[name] = value = float(value)
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"{name} must be a finite, non-negative number, not {value}")
+        if name in TURN_PARAMETERS and (value < 1 or not value.is_integer()):
+            raise ValueError(f"{name} must be a positive integer, not {value}")
+    for name in POSITIVE_PARAMETERS[design['BobbinType']]:
+        if design[name] <= 0:
+            raise ValueError(f"{name} must be positive")
+    return design
+
+
+def _WarmUp():
+    return None
+
+
+def _EvaluateBatch(SelectedCore, ReferredWinding, Designs):
+    """
+    Worker task: vectorized fit check of a batch of designs and batched leakage inductance of the fitting ones.
+    """
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    parameters = {name: np.array([design[name] for design in Designs]) for name in Designs[0]}
+    fits, winding_dims = WindingMaker.fit_check(WindowWidth, WindowHeight, **parameters)
+
+    leakage = np.full(len(Designs), np.nan)
+    if fits.any():
+        blocks = {winding: {key: winding_dims[winding][key][fits] for key in BLOCK_KEYS} for winding in ('primary', 'secondary')}
+        leakage[fits] = BatchLeakageInductanceCalculator(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, blocks,
+                                                         parameters['NumberOfTurns_1'][fits], parameters['NumberOfTurns_2'][fits]).LeakageInductance
+    return fits, winding_dims, leakage
+
+
+def _Finite(value):
+    # JSON number of a result value, null when it is not finite
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _Result(index, fits, winding_dims, leakage):
+    # JSON result of one design of a batch
+    if not fits[index]:
+        return {'fits': False, 'LeakageInductance': None, 'winding_dims': None}
+    return {'fits': True, 'LeakageInductance': _Finite(leakage[index]),
+            'winding_dims': {winding: {key: _Finite(values[index]) for key, values in dims.items()} for winding, dims in winding_dims.items()}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--processes', type=int, default=None, help="worker processes (0: evaluate in a thread)")
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-batch-delay', type=float, default=2.0, help="ms an idle worker waits for a batch to fill")
+    parser.add_argument('--max-pending', type=int, default=4096, help="queued designs beyond which requests get 503")
+    parser.add_argument('--timeout', type=float, default=30.0, help="s per request")
+    args = parser.parse_args(argv)
+
+    service = DesignService(args.host, args.port, args.processes, args.max_batch_size, args.max_batch_delay / 1e3,
+                            args.max_pending, RequestTimeout=args.timeout)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions, core_series_weights
+from magnetics_modeling.auxiliary_functions.design_sweep import COMMON_PARAMETERS, DEFAULTS
+from magnetics_modeling.auxiliary_functions.profiling import stage
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+from magnetics_modeling.leakage_inductance.OpenBoundaryLeakageEngine import OpenBoundaryLeakageEngine
+
+
+WINDING_PARAMETERS = ('BobbinType',) + COMMON_PARAMETERS + tuple(DEFAULTS)
+
+
+class DesignSession:
+    """
+    Interactive design session over core_window_dimensions -> WindingMaker -> leakage inductance -> TransformerPlotter
+    that only recomputes the stages invalidated by a change:
+
+        session = DesignSession(SelectedCore, BobbinType='Split', BobbinThickness=1e-3, ...)
+        session.LeakageInductance
+        session.update(SecondaryHeight=6e-3)
+        session.LeakageInductance   # windings and leakage are recomputed, the window is not
+
+    Every stage lists the inputs and upstream stages it depends on (STAGES) and is computed lazily on first access.
+    Within the leakage stage the BlockSpectrum of each winding block is kept for as long as the block does not move, so a
+    secondary-only change reuses the primary's sine terms; when neither block nor the turns changed (e.g. an alignment
+    that has no effect), the previous result is returned as is. The leakage matches LeakageInductanceCalculator with its
+    fixed harmonic counts (Method='factorized').
+    """
+    # Stage: (upstream stages, inputs), in dependency order
+    STAGES = {
+        'window': ((), ('SelectedCore',)),
+        'windings': (('window',), WINDING_PARAMETERS),
+        'leakage': (('window', 'windings'), ('SelectedCore', 'ReferredWinding', 'OutsideWindow')),
+        'plot': (('window', 'windings'), ()),
+    }
+
+    def __init__(self, SelectedCore, ReferredWinding='Primary', OutsideWindow='series', **WindingParameters):
+
+        self.Inputs = {'SelectedCore': SelectedCore, 'ReferredWinding': ReferredWinding, 'OutsideWindow': OutsideWindow, **DEFAULTS}
+        self._check(WindingParameters)
+        missing = {'BobbinType', *COMMON_PARAMETERS} - set(WindingParameters)
+        if missing:
+            raise ValueError(f"Missing design parameters: {sorted(missing)}")
+        self.Inputs.update(WindingParameters)
+
+        self.Recomputed = {name: 0 for name in self.STAGES} # Evaluations of each stage
+        self.SpectrumReuse = {'hits': 0, 'misses': 0}
+        self._values = {}
+        self._spectra = {}      # (M, N, window, block bounds) -> BlockSpectrum of the blocks in use
+        self._last_leakage = None # (leakage inputs, LeakageInductance) of the last evaluation
+
+    def _check(self, Parameters):
+        unknown = set(Parameters) - set(self.Inputs) - set(WINDING_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown design parameters: {sorted(unknown)}")
+
+    def update(self, **Changes):
+        """
+        Changes some inputs and invalidates the stages that depend on them (directly or through an upstream stage).
+        """
+        self._check(Changes)
+        changed = {name for name, value in Changes.items() if self.Inputs.get(name) != value}
+        self.Inputs.update(Changes)
+
+        invalid = set()
+        for name, (upstream, inputs) in self.STAGES.items():
+            if changed.intersection(inputs) or invalid.intersection(upstream):
+                invalid.add(name)
+                self._discard(name)
+        return self
+
+    def _discard(self, Name):
+        value = self._values.pop(Name, None)
+        if Name == 'plot' and value is not None:
+            import matplotlib.pyplot as plt
+            plt.close(value.fig)
+
+    def stale(self):
+        """
+        Stages that will be recomputed on their next access.
+        """
+        return [name for name in self.STAGES if name not in self._values]
+
+    def _get(self, Name):
+        if Name not in self._values:
+            with stage(f'session/{Name}'):
+                self._values[Name] = getattr(self, f'_{Name}')()
+            self.Recomputed[Name] += 1
+        return self._values[Name]
+
+    @property
+    def WindowWidth(self):
+        return self._get('window')[0]
+
+    @property
+    def WindowHeight(self):
+        return self._get('window')[1]
+
+    @property
+    def winding(self):
+        return self._get('windings')
+
+    @property
+    def LeakageInductance(self):
+        # None while the windings do not fit
+        return self._get('leakage')
+
+    def plot(self):
+        """
+        TransformerPlotter with the current geometry (call finalize_and_show() on it to display it).
+        """
+        return self._get('plot')
+
+    # Stages
+    def _window(self):
+        return core_window_dimensions(self.Inputs['SelectedCore'])
+
+    def _windings(self):
+        return WindingMaker(self.WindowWidth, self.WindowHeight, *(self.Inputs[name] for name in WINDING_PARAMETERS))
+
+    def _plot(self):
+        from magnetics_modeling.auxiliary_functions.core_window_plotter import TransformerPlotter
+
+        inputs = self.Inputs
+        plotter = TransformerPlotter(self.WindowWidth, self.WindowHeight, inputs['BobbinThickness'], inputs['BobbinType'],
+                                     inputs['PrimaryHeight'], inputs['InterSectionSpacing'])
+        plotter.plot_geometry(self.winding.turns, self.winding.winding_dims, inputs['ConductorDiameter_1'], inputs['InsulationThickness_1'],
+                              inputs['ConductorDiameter_2'], inputs['InsulationThickness_2'])
+        return plotter
+
+    def _Spectra(self, M, N, WindowWidth, WindowHeight, Bounds, used):
+        # BlockSpectrum of each block, reused while the block (and the window) stays the same
+        spectra = []
+        for bounds in Bounds:
+            key = (M, N, WindowWidth, WindowHeight, bounds)
+            if key in self._spectra:
+                self.SpectrumReuse['hits'] += 1
+            else:
+                self._spectra[key] = FactorizedLeakageEngine.BlockSpectrum(M, N, WindowWidth, WindowHeight, *bounds)
+                self.SpectrumReuse['misses'] += 1
+            used[key] = self._spectra[key]
+            spectra.append(used[key])
+        return spectra
+
+    def _leakage(self):
+        winding_dims = self.winding.winding_dims
+        if not winding_dims:
+            return None
+
+        inputs = self.Inputs
+        SelectedCore = inputs['SelectedCore']
+        WindowWidth, WindowHeight = self.WindowWidth, self.WindowHeight
+        NumberOfTurns_1, NumberOfTurns_2 = inputs['NumberOfTurns_1'], inputs['NumberOfTurns_2']
+        Bounds = tuple((float(block['x']), float(block['x'] + block['width']), float(block['y']), float(block['y'] + block['height']))
+                       for block in (winding_dims['primary'], winding_dims['secondary']))
+
+        signature = (SelectedCore, inputs['ReferredWinding'], inputs['OutsideWindow'], Bounds, NumberOfTurns_1, NumberOfTurns_2)
+        if self._last_leakage is not None and self._last_leakage[0] == signature:
+            return self._last_leakage[1]
+
+        # Same excitation as LeakageInductanceCalculator._LeakageScaler (I_ref = 1)
+        match inputs['ReferredWinding']:
+            case "Primary":
+                I_1, I_2 = 1, -NumberOfTurns_1/NumberOfTurns_2
+            case "Secondary":
+                I_1, I_2 = -NumberOfTurns_2/NumberOfTurns_1, 1
+        primary, secondary = winding_dims['primary'], winding_dims['secondary']
+        CurrentDensities = [(NumberOfTurns_1 * I_1) / (primary['width'] * primary['height']),
+                            (NumberOfTurns_2 * I_2) / (secondary['width'] * secondary['height'])]
+
+        # Per-block spectra of the inside-window and "infinite window" series, shared by the p.u.l. and p.u.a. series
+        used = {}
+        w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+        Bounds_OW = tuple((w_minus, w_plus, h_minus + shift, h_plus + shift) for w_minus, w_plus, h_minus, h_plus in Bounds)
+        spectra_IW = self._Spectra(30, 30, WindowWidth, WindowHeight, Bounds, used)
+        open_boundary = inputs['OutsideWindow'] == 'open'
+        spectra_OW = None if open_boundary else self._Spectra(150, 150, w_w_inf, h_w_inf, Bounds_OW, used)
+        self._spectra = used # Blocks that moved are forgotten
+
+        def pul_IW():
+            return FactorizedLeakageEngine.Leakage_pul(30, 30, 1, WindowWidth, WindowHeight, CurrentDensities, Bounds, Spectra=spectra_IW)
+
+        def pul_OW():
+            if open_boundary:
+                return OpenBoundaryLeakageEngine.Leakage_pul(1, CurrentDensities, Bounds)
+            return FactorizedLeakageEngine.Leakage_pul(150, 150, 1, w_w_inf, h_w_inf, CurrentDensities, Bounds_OW, Spectra=spectra_OW)
+
+        def pua_IW(DiameterCentralLeg):
+            return FactorizedLeakageEngine.Leakage_pua(30, 30, 1, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds,
+                                                       Spectra=spectra_IW)
+
+        def pua_OW(DiameterCentralLeg):
+            if open_boundary:
+                return OpenBoundaryLeakageEngine.Leakage_pua(1, DiameterCentralLeg, CurrentDensities, Bounds)
+            return FactorizedLeakageEngine.Leakage_pua(150, 150, 1, w_w_inf, h_w_inf, DiameterCentralLeg, CurrentDensities, Bounds_OW,
+                                                       Spectra=spectra_OW)
+
+        # Core-Specific Leakage Expressions (same weighting as LeakageInductanceCalculator._LeakageScaler)
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+        series = {'pul_IW': pul_IW, 'pul_OW': pul_OW,
+                  'pua_IW': lambda: pua_IW(DiameterCentralLeg), 'pua_OW': lambda: pua_OW(DiameterCentralLeg)}
+        LeakageInductance = sum(series[name]()*weight for name, weight in Weights.items())
+
+        self._last_leakage = (signature, LeakageInductance)
+        return LeakageInductance
@@ -0,0 +1,160 @@
+import os
+import json
+import itertools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator import BatchLeakageInductanceCalculator
+
+
+# Parameters swept for every bobbin type and the ones that only make sense for one of them
+COMMON_PARAMETERS = ('BobbinThickness', 'NumberOfTurns_1', 'NumberOfTurns_2',
+                     'ConductorDiameter_1', 'InsulationThickness_1', 'ConductorDiameter_2', 'InsulationThickness_2')
+BOBBIN_PARAMETERS = {'Normal': ('WindingsSpacing', 'SecondaryYAlign'),
+                     'Split': ('PrimaryHeight', 'InterSectionSpacing', 'SecondaryHeight', 'PrimaryYAlignSplit', 'SecondaryYAlignSplit')}
+DEFAULTS = {'WindingsSpacing': 0, 'PrimaryHeight': 0, 'InterSectionSpacing': 0, 'SecondaryHeight': 0,
+            'SecondaryYAlign': 'bottom', 'PrimaryYAlignSplit': 'bottom', 'SecondaryYAlignSplit': 'bottom'}
+BLOCK_KEYS = ('x', 'y', 'width', 'height')
+
+
+class DesignSweep:
+    """
+    Parametric design sweep over WindingMaker + LeakageInductanceCalculator for one core.
+    Every parameter may be a single value or an iterable of values; the candidates are expanded lazily (per bobbin type,
+    only over the parameters that bobbin uses), dispatched in chunks to a process pool, non-fitting candidates are dropped
+    by a vectorized closed-form fit check and each evaluated chunk is written as its own columnar .npz part, so the sweep
+    never holds all results in memory.
+    """
+    def __init__(self, SelectedCore, ReferredWinding='Primary', BobbinType=('Normal', 'Split'), **Parameters):
+
+        unknown = set(Parameters) - set(COMMON_PARAMETERS) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+        missing = set(COMMON_PARAMETERS) - set(Parameters)
+        if missing:
+            raise ValueError(f"Missing sweep parameters: {sorted(missing)}")
+
+        self.SelectedCore = SelectedCore
+        self.ReferredWinding = ReferredWinding
+        self.WindowWidth, self.WindowHeight = core_window_dimensions(SelectedCore)
+
+        self.BobbinTypes = self._values(BobbinType)
+        self.Parameters = {name: self._values(Parameters.get(name, DEFAULTS.get(name))) for name in COMMON_PARAMETERS + tuple(DEFAULTS)}
+
+    @staticmethod
+    def _values(value):
+        if isinstance(value, (str, bytes)) or not np.iterable(value):
+            return (value,)
+        return tuple(value)
+
+    def __len__(self):
+        return sum(int(np.prod([len(self.Parameters[name]) for name in COMMON_PARAMETERS + BOBBIN_PARAMETERS[bobbin]]))
+                   for bobbin in self.BobbinTypes)
+
+    def candidates(self):
+        """
+        Lazily yields one dict of WindingMaker arguments per candidate design.
+        """
+        for bobbin in self.BobbinTypes:
+            names = COMMON_PARAMETERS + BOBBIN_PARAMETERS[bobbin]
+            fixed = {name: DEFAULTS[name] for name in DEFAULTS if name not in names}
+            for values in itertools.product(*(self.Parameters[name] for name in names)):
+                yield {'BobbinType': bobbin, **fixed, **dict(zip(names, values))}
+
+    def run(self, OutputPath, Processes=None, ChunkSize=1024, MaxPendingChunks=None):
+        """
+        Evaluates every candidate and writes the fitting ones to OutputPath/part-XXXXXX.npz.
+        Processes=0 evaluates in the calling process. Returns a summary that is also saved as OutputPath/manifest.json.
+        """
+        os.makedirs(OutputPath, exist_ok=True)
+        chunks = _Chunked(self.candidates(), ChunkSize)
+        summary = {'candidates': 0, 'fitting': 0, 'parts': []}
+
+        def store(index, result):
+            candidates, columns = result
+            summary['candidates'] += candidates
+            count = len(columns['LeakageInductance'])
+            if count:
+                part = f'part-{index:06d}.npz'
+                np.savez(os.path.join(OutputPath, part), **columns)
+                summary['fitting'] += count
+                summary['parts'].append(part)
+
+        arguments = (self.SelectedCore, self.ReferredWinding, self.WindowWidth, self.WindowHeight)
+
+        if Processes == 0:
+            for index, chunk in enumerate(chunks):
+                store(index, _EvaluateChunk(*arguments, chunk))
+        else:
+            Processes = Processes or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=Processes) as pool:
+                # Only a bounded number of chunks is in flight, so neither the candidates nor the results pile up in memory
+                max_pending = MaxPendingChunks or 2 * Processes
+                pending = {}
+                for index, chunk in enumerate(chunks):
+                    pending[pool.submit(_EvaluateChunk, *arguments, chunk)] = index
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            store(pending.pop(future), future.result())
+                for future in list(pending):
+                    store(pending.pop(future), future.result())
+
+        summary['parts'].sort()
+        with open(os.path.join(OutputPath, 'manifest.json'), 'w') as file:
+            json.dump(summary, file, indent=2)
+
+        return summary
+
+    @staticmethod
+    def iter_parts(OutputPath, Columns=None):
+        """
+        Yields the stored result parts one at a time as dicts of column arrays.
+        """
+        with open(os.path.join(OutputPath, 'manifest.json')) as file:
+            parts = json.load(file)['parts']
+        for part in parts:
+            with np.load(os.path.join(OutputPath, part)) as data:
+                yield {name: data[name] for name in (Columns or data.files)}
+
+    @staticmethod
+    def load(OutputPath, Columns=None):
+        """
+        Concatenates the requested columns of every stored part.
+        """
+        parts = list(DesignSweep.iter_parts(OutputPath, Columns))
+        if not parts:
+            return {}
+        return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def _Chunked(iterable, size):
+    # Lists of up to size consecutive items of iterable
+    while chunk := list(itertools.islice(iterable, size)):
+        yield chunk
+
+
+def _EvaluateChunk(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, candidates):
+    """
+    Worker task: drops the non-fitting candidates of a chunk with the closed-form WindingMaker.fit_check and evaluates
+    the leakage of the others in one batched call. Returns the number of candidates seen and the columns of the fitting ones.
+    """
+    parameters = {name: np.array([candidate[name] for candidate in candidates]) for name in candidates[0]}
+    fits, winding_dims = WindingMaker.fit_check(WindowWidth, WindowHeight, **parameters)
+
+    columns = {name: values[fits] for name, values in parameters.items()}
+    for winding in ('primary', 'secondary'):
+        for key in BLOCK_KEYS:
+            columns[f'{winding}_{key}'] = winding_dims[winding][key][fits]
+
+    if fits.any():
+        EquivalentWindingsBlocks = {winding: {key: columns[f'{winding}_{key}'] for key in BLOCK_KEYS} for winding in ('primary', 'secondary')}
+        columns['LeakageInductance'] = BatchLeakageInductanceCalculator(
+            SelectedCore, ReferredWinding, WindowWidth, WindowHeight, EquivalentWindingsBlocks,
+            columns['NumberOfTurns_1'], columns['NumberOfTurns_2']).LeakageInductance
+    else:
+        columns['LeakageInductance'] = np.empty(0)
+
+    return len(candidates), columns
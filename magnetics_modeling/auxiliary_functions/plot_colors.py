@@ -0,0 +1,13 @@
+import matplotlib.colors as mcolors
+
+
+# Color helpers shared by the plotters, kept apart from pyplot so the headless BatchTransformerPlotter can use them
+def darken_color(color, amount=0.5):
+    try:
+        c = mcolors.cnames[color]
+    except:
+        c = color
+    c = mcolors.to_rgb(c)
+    c = mcolors.rgb_to_hsv(c)
+    c[2] = c[2] * (1 - amount)
+    return mcolors.hsv_to_rgb(c)
@@ -0,0 +1,202 @@
+import csv
+import json
+import time
+import functools
+import contextvars
+import tracemalloc
+from contextlib import nullcontext
+
+
+# Profiler recording in the current context (thread or asyncio task), None when profiling is off
+_active = contextvars.ContextVar('profiler', default=None)
+_DISABLED = nullcontext()
+
+
+class Profiler:
+    """
+    Per-stage profile of the modeling pipeline, aggregated over every call made while the profiler is active:
+
+        with Profiler() as profiler:
+            ...sweep...
+        profiler.export('profile.json')
+
+    Stages nest (a stage opened inside another one is recorded as 'outer/inner') and each stage can be split further
+    with checkpoints. For every stage the calls, wall time, noted array elements and, with TraceMemory, the net and peak
+    bytes allocated (tracemalloc) are accumulated. While no profiler is active, stage() and checkpoint() return at once.
+    The active profiler is a context variable: it records the thread or asyncio task that entered it (and the tasks it
+    starts), not the other threads of the process; use one profiler per thread or worker and combine their Records with
+    merge().
+    """
+    def __init__(self, TraceMemory=False):
+
+        self.TraceMemory = TraceMemory
+        self.Records = {}
+        self._frames = []
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        self._token = _active.set(self)
+        if self.TraceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _memory(self):
+        # Current traced bytes; the peak since the last sample is folded into every open frame before being reset
+        if not self.TraceMemory:
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for frame in self._frames:
+            frame['peak'] = max(frame['peak'], peak)
+            frame['segment_peak'] = max(frame['segment_peak'], peak)
+        return current
+
+    def _open(self, Name, Elements):
+        path = f"{self._frames[-1]['path']}/{Name}" if self._frames else Name
+        current = self._memory()
+        now = time.perf_counter()
+        self._frames.append({'path': path, 'start': now, 'mark': now, 'elements': Elements,
+                             'start_memory': current, 'mark_memory': current, 'peak': current, 'segment_peak': current})
+
+    def _close(self):
+        current = self._memory()
+        now = time.perf_counter()
+        frame = self._frames.pop()
+        self._record(frame['path'], now - frame['start'], frame['elements'], current - frame['start_memory'], frame['peak'] - frame['start_memory'])
+        if self._frames:
+            # The closed stage counts as part of the open segment of its parent
+            self._frames[-1]['segment_peak'] = max(self._frames[-1]['segment_peak'], frame['peak'])
+
+    def _checkpoint(self, Name, Elements):
+        if not self._frames:
+            return
+        current = self._memory()
+        now = time.perf_counter()
+        frame = self._frames[-1]
+        self._record(f"{frame['path']}/{Name}", now - frame['mark'], Elements, current - frame['mark_memory'], frame['segment_peak'] - frame['mark_memory'])
+        frame['mark'], frame['mark_memory'], frame['segment_peak'] = now, current, current
+
+    def _record(self, Path, Seconds, Elements, Allocated, Peak):
+        record = self.Records.get(Path)
+        if record is None:
+            record = self.Records[Path] = {'calls': 0, 'time': 0.0, 'min_time': float('inf'), 'max_time': 0.0,
+                                           'elements': 0, 'max_elements': 0, 'allocated': 0, 'peak': 0}
+        record['calls'] += 1
+        record['time'] += Seconds
+        record['min_time'] = min(record['min_time'], Seconds)
+        record['max_time'] = max(record['max_time'], Seconds)
+        record['elements'] += Elements
+        record['max_elements'] = max(record['max_elements'], Elements)
+        record['allocated'] += Allocated
+        record['peak'] = max(record['peak'], Peak)
+
+    def merge(self, Records):
+        """
+        Adds the Records of another profiler (e.g. returned by a worker process) to this one.
+        """
+        for path, other in Records.items():
+            record = self.Records.setdefault(path, {'calls': 0, 'time': 0.0, 'min_time': float('inf'), 'max_time': 0.0,
+                                                    'elements': 0, 'max_elements': 0, 'allocated': 0, 'peak': 0})
+            for key in ('calls', 'time', 'elements', 'allocated'):
+                record[key] += other[key]
+            for key in ('max_time', 'max_elements', 'peak'):
+                record[key] = max(record[key], other[key])
+            record['min_time'] = min(record['min_time'], other['min_time'])
+        return self
+
+    def summary(self):
+        """
+        One row per stage, sorted by path, with the mean time and the share of the parent stage time.
+        """
+        rows = []
+        for path in sorted(self.Records):
+            record = self.Records[path]
+            parent = self.Records.get(path.rpartition('/')[0])
+            rows.append({'stage': path, **record, 'mean_time': record['time'] / record['calls'],
+                         'share_of_parent': record['time'] / parent['time'] if parent and parent['time'] > 0 else None})
+        return rows
+
+    def export(self, Path):
+        """
+        Writes the summary as JSON or, for a .csv path, as CSV.
+        """
+        rows = self.summary()
+        if Path.endswith('.csv'):
+            with open(Path, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else ['stage'])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(Path, 'w') as file:
+                json.dump(rows, file, indent=1)
+
+    def report(self):
+        # Indented text table of the summary
+        lines = [f"{'stage':<44} {'calls':>8} {'total ms':>11} {'mean us':>10} {'share':>7} {'peak KiB':>10}"]
+        for row in self.summary():
+            depth = row['stage'].count('/')
+            share = '' if row['share_of_parent'] is None else f"{100 * row['share_of_parent']:.1f}%"
+            lines.append(f"{'  ' * depth + row['stage'].rpartition('/')[2]:<44} {row['calls']:>8} {row['time'] * 1e3:>11.3f} "
+                         f"{row['mean_time'] * 1e6:>10.1f} {share:>7} {row['peak'] / 1024:>10.1f}")
+        return '\n'.join(lines)
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'elements')
+
+    def __init__(self, profiler, name, elements):
+        self.profiler, self.name, self.elements = profiler, name, elements
+
+    def __enter__(self):
+        self.profiler._open(self.name, self.elements)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler._close()
+
+
+def _elements(Arrays):
+    return sum(getattr(array, 'size', 1) for array in Arrays)
+
+
+def stage(Name, *Arrays):
+    """
+    Context manager recording one stage (and the total elements of Arrays) on the active profiler; a no-op otherwise.
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _DISABLED
+    return _Stage(profiler, Name, _elements(Arrays))
+
+
+def checkpoint(Name, *Arrays):
+    """
+    Records the time since the start of the current stage (or its previous checkpoint) as the sub-stage Name.
+    """
+    profiler = _active.get()
+    if profiler is not None:
+        profiler._checkpoint(Name, _elements(Arrays))
+
+
+def profiled(Name):
+    """
+    Decorator running the function as a stage.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _active.get()
+            if profiler is None:
+                return function(*args, **kwargs)
+            with _Stage(profiler, Name, 0):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import contextlib
+import numpy as np
+
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'magnetics-modeling', 'results.sqlite')
+
+
+class ResultCache:
+    """
+    Persistent, content-addressed cache of calculation results.
+    Results are keyed by a SHA-256 of a canonical JSON form of the inputs (dict keys sorted, numbers rounded to Digits
+    significant digits, arrays as lists) and stored in a local SQLite database in WAL mode, so several processes can
+    read and write it at the same time. The least recently used entries are evicted once the stored results exceed MaxBytes.
+    """
+    def __init__(self, Path=DEFAULT_PATH, MaxBytes=256 * 2**20, Digits=10):
+
+        self.Path = Path
+        self.MaxBytes = MaxBytes
+        self.Digits = Digits
+        self.Hits = 0
+        self.Misses = 0
+        self._connection = None
+        self._pid = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(Path)), exist_ok=True)
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, namespace TEXT, value BLOB, size INTEGER, last_access REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)')
+            connection.execute('CREATE TABLE IF NOT EXISTS statistics (name TEXT PRIMARY KEY, value INTEGER)')
+            connection.execute("INSERT OR IGNORE INTO statistics VALUES ('hits', 0), ('misses', 0), ('evictions', 0)")
+
+    def _connect(self):
+        # One connection per process (a forked worker must not reuse its parent's)
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.Path, timeout=30, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._pid = os.getpid()
+        return self._connection
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        # The connection is in autocommit mode, where 'with connection' opens no transaction: every statement in the
+        # block would be its own write
+        connection = self._connect()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
+
+    def _canonical(self, value):
+        # JSON-compatible form of the inputs, with numbers rounded so that round-off noise maps to the same key
+        if isinstance(value, dict):
+            return {str(key): self._canonical(value[key]) for key in sorted(value, key=str)}
+        if isinstance(value, np.ndarray):
+            return self._canonical(value.tolist())
+        if isinstance(value, (list, tuple)):
+            return [self._canonical(item) for item in value]
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (bool, np.bool_)):
+            return bool(value)
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        if isinstance(value, (float, np.floating)):
+            return float(f'{float(value):.{self.Digits}g}') + 0.0 # + 0.0 maps -0.0 to 0.0
+        raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+    def key(self, Namespace, **Parameters):
+        """
+        Content hash of a calculation: its namespace (calculator name and version) and its inputs.
+        """
+        canonical = json.dumps({'namespace': Namespace, 'parameters': self._canonical(Parameters)}, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, Key):
+        """
+        Stored result of Key, or None on a miss.
+        """
+        connection = self._connect()
+        row = connection.execute('SELECT value FROM results WHERE key = ?', (Key,)).fetchone()
+        if row is None:
+            self.Misses += 1
+            connection.execute("UPDATE statistics SET value = value + 1 WHERE name = 'misses'")
+            return None
+
+        self.Hits += 1
+        with self._transaction() as connection:
+            connection.execute('UPDATE results SET last_access = ? WHERE key = ?', (time.time(), Key))
+            connection.execute("UPDATE statistics SET value = value + 1 WHERE name = 'hits'")
+        return pickle.loads(row[0])
+
+    def put(self, Key, Value, Namespace=''):
+        """
+        Stores Value under Key and evicts the least recently used results beyond MaxBytes.
+        """
+        blob = pickle.dumps(Value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._transaction() as connection:
+            connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)', (Key, Namespace, blob, len(blob), time.time()))
+            excess = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0] - self.MaxBytes
+            if excess > 0:
+                evicted = 0
+                for key, size in connection.execute('SELECT key, size FROM results ORDER BY last_access').fetchall():
+                    if excess <= 0:
+                        break
+                    connection.execute('DELETE FROM results WHERE key = ?', (key,))
+                    excess -= size
+                    evicted += 1
+                connection.execute("UPDATE statistics SET value = value + ? WHERE name = 'evictions'", (evicted,))
+
+    def get_or_compute(self, Namespace, Parameters, Compute):
+        """
+        Cached result of Compute() for the given inputs, computing and storing it on a miss.
+        """
+        key = self.key(Namespace, **Parameters)
+        value = self.get(key)
+        if value is None:
+            value = Compute()
+            self.put(key, value, Namespace)
+        return value
+
+    def statistics(self):
+        """
+        Hits and misses of this instance, plus the totals, entries and size of the shared database.
+        """
+        connection = self._connect()
+        totals = dict(connection.execute('SELECT name, value FROM statistics').fetchall())
+        entries, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        return {'hits': self.Hits, 'misses': self.Misses,
+                'total_hits': totals['hits'], 'total_misses': totals['misses'], 'evictions': totals['evictions'],
+                'entries': entries, 'bytes': size}
+
+    def clear(self):
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM results')
+            connection.execute("UPDATE statistics SET value = 0")
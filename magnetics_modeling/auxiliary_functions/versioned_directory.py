@@ -0,0 +1,60 @@
+"""
+Directories of memory-mapped arrays that are rebuilt while other processes read them.
+
+Every build is written to its own version directory inside Path and published by atomically replacing the
+Path/CURRENT pointer, so a reader always opens either the previous or the new version, never a partial or missing one.
+The version replaced by a publish is kept for readers that resolved it just before, and removed by the next publish.
+"""
+import os
+import json
+import uuid
+import shutil
+
+
+POINTER = 'CURRENT'
+
+
+def current(Path):
+    """
+    Directory of the published version of Path (Path itself when it was written before versioning, without a pointer).
+    """
+    try:
+        with open(os.path.join(Path, POINTER)) as file:
+            return os.path.join(Path, json.load(file)['current'])
+    except FileNotFoundError:
+        return Path
+
+
+def new_version(Path):
+    """
+    Creates an empty, unpublished version directory in Path (with the usual umask permissions) and returns it.
+    """
+    os.makedirs(Path, exist_ok=True)
+    version = os.path.join(Path, uuid.uuid4().hex)
+    os.mkdir(version)
+    return version
+
+
+def publish(Path, Version):
+    """
+    Makes Version (from new_version) the published version of Path and removes the one published two builds ago.
+    """
+    pointer = os.path.join(Path, POINTER)
+    try:
+        with open(pointer) as file:
+            previous = json.load(file)
+    except FileNotFoundError:
+        previous = {'current': None, 'previous': None}
+
+    staging = f'{pointer}.{uuid.uuid4().hex}'
+    with open(staging, 'w') as file:
+        json.dump({'current': os.path.basename(Version), 'previous': previous['current']}, file)
+    os.replace(staging, pointer)
+
+    if previous['previous'] not in (None, previous['current'], os.path.basename(Version)):
+        shutil.rmtree(os.path.join(Path, previous['previous']), ignore_errors=True)
+
+
+def discard(Version):
+    # Version of a build that failed before being published
+    shutil.rmtree(Version, ignore_errors=True)
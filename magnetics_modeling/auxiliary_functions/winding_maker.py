@@ -0,0 +1,265 @@
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.profiling import profiled
+
+class WindingMaker:
+    """
+    This class performs a fit check of the defined windings in the core window considering the defined bobbin parameters
+    It also calculates the coordinates of each turn, as well as the position and dimensions of the equivalent winding blocks
+    (with the turns per layer and number of layers of each winding).
+    The turns are stored as arrays ('x', 'y', 'winding' index into WINDINGS and 'turn' number); the list of per-turn
+    dicts is only built when 'coordinates' is accessed.
+    """
+    WINDINGS = ('primary', 'secondary')
+
+    def __init__(self, WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 ConductorDiameter_1, InsulationThickness_1,
+                 ConductorDiameter_2, InsulationThickness_2,
+                 WindingsSpacing=0, PrimaryHeight=0, InterSectionSpacing=0, SecondaryHeight=0,
+                 SecondaryYAlign='bottom', PrimaryYAlignSplit='bottom', SecondaryYAlignSplit='bottom'):
+        
+        self.turns, self.winding_dims = self._calculate_geometry(
+            WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+            NumberOfTurns_1, NumberOfTurns_2, ConductorDiameter_1, InsulationThickness_1,
+            ConductorDiameter_2, InsulationThickness_2, WindingsSpacing, PrimaryHeight, 
+            InterSectionSpacing, SecondaryHeight, SecondaryYAlign, 
+            PrimaryYAlignSplit, SecondaryYAlignSplit
+        )
+        self._coordinates = None
+        if not self.turns['x'].size:
+            print("ERROR: The windings dont fit!")
+
+    @property
+    def coordinates(self):
+        # List of {'x', 'y', 'winding', 'turn'} dicts, materialized on first access
+        if self._coordinates is None:
+            self._coordinates = [{'x': x, 'y': y, 'winding': self.WINDINGS[winding], 'turn': turn}
+                                 for x, y, winding, turn in zip(self.turns['x'].tolist(), self.turns['y'].tolist(),
+                                                                self.turns['winding'].tolist(), self.turns['turn'].tolist())]
+        return self._coordinates
+
+    def get_all_coordinates(self):
+        return self.coordinates
+
+    def get_turn_arrays(self):
+        return self.turns
+
+    def get_equivalent_dims(self):
+        return self.winding_dims
+
+    @staticmethod
+    def turn_arrays(coordinates):
+        """
+        Turn arrays ('x', 'y', 'winding' index, 'turn') of either WindingMaker.turns or the legacy list of per-turn dicts.
+        """
+        if isinstance(coordinates, dict):
+            return coordinates
+        return {'x': np.array([turn['x'] for turn in coordinates], dtype=np.float64),
+                'y': np.array([turn['y'] for turn in coordinates], dtype=np.float64),
+                'winding': np.array([turn['winding'] != 'primary' for turn in coordinates], dtype=np.int8),
+                'turn': np.array([turn['turn'] for turn in coordinates], dtype=np.int64)}
+
+    @staticmethod
+    def geometry(WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 ConductorDiameter_1, InsulationThickness_1,
+                 ConductorDiameter_2, InsulationThickness_2,
+                 WindingsSpacing=0, PrimaryHeight=0, InterSectionSpacing=0, SecondaryHeight=0,
+                 SecondaryYAlign='bottom', PrimaryYAlignSplit='bottom', SecondaryYAlignSplit='bottom'):
+        """
+        Turn arrays and winding_dims of one design (same arguments as WindingMaker) without building a WindingMaker;
+        the turn arrays are empty when the windings do not fit.
+        """
+        return WindingMaker._calculate_geometry(
+            WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+            NumberOfTurns_1, NumberOfTurns_2, ConductorDiameter_1, InsulationThickness_1,
+            ConductorDiameter_2, InsulationThickness_2, WindingsSpacing, PrimaryHeight,
+            InterSectionSpacing, SecondaryHeight, SecondaryYAlign,
+            PrimaryYAlignSplit, SecondaryYAlignSplit)
+
+    @staticmethod
+    @profiled('winding_maker')
+    def _calculate_geometry(WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+                            NumberOfTurns_1, NumberOfTurns_2, ConductorDiameter_1, InsulationThickness_1,
+                            ConductorDiameter_2, InsulationThickness_2, WindingsSpacing, PrimaryHeight, 
+                            InterSectionSpacing, SecondaryHeight, SecondaryYAlign, 
+                            PrimaryYAlignSplit, SecondaryYAlignSplit):
+        
+        pitch_1 = ConductorDiameter_1 + 2 * InsulationThickness_1
+        pitch_2 = ConductorDiameter_2 + 2 * InsulationThickness_2
+        bobbin_inner_width = WindowWidth - BobbinThickness
+        bobbin_inner_height = WindowHeight - 2 * BobbinThickness
+        winding_dims = {}
+        no_fit = WindingMaker._turn_arrays([]), {}
+
+        if BobbinType == 'Normal':
+            turns_per_layer_1 = int(bobbin_inner_height / pitch_1)
+            if turns_per_layer_1 == 0: return no_fit
+            num_layers_1 = np.ceil(NumberOfTurns_1 / turns_per_layer_1)
+            width_1 = num_layers_1 * pitch_1
+            turns_per_layer_2 = int(bobbin_inner_height / pitch_2)
+            if turns_per_layer_2 == 0: return no_fit
+            num_layers_2 = np.ceil(NumberOfTurns_2 / turns_per_layer_2)
+            width_2 = num_layers_2 * pitch_2
+            total_width_needed = width_1 + WindingsSpacing + width_2
+            if total_width_needed > bobbin_inner_width: return no_fit
+            
+            primary = WindingMaker._place_turns(NumberOfTurns_1, turns_per_layer_1, BobbinThickness, BobbinThickness, pitch_1)
+            
+            y_start_2 = BobbinThickness
+            if SecondaryYAlign == 'center':
+                actual_turns = min(NumberOfTurns_2, turns_per_layer_2)
+                height_occupied = actual_turns * pitch_2
+                y_start_2 = BobbinThickness + (bobbin_inner_height - height_occupied) / 2
+            x_start_2 = BobbinThickness + (num_layers_1 * pitch_1) + WindingsSpacing
+            secondary = WindingMaker._place_turns(NumberOfTurns_2, turns_per_layer_2, x_start_2, y_start_2, pitch_2)
+            
+            winding_dims['primary'] = {'x': BobbinThickness + InsulationThickness_1, 'y': BobbinThickness + InsulationThickness_1, 'width': (NumberOfTurns_1 / turns_per_layer_1) * pitch_1 - 2*InsulationThickness_1, 'height': turns_per_layer_1 * pitch_1 - 2*InsulationThickness_1, 'turns_per_layer': turns_per_layer_1, 'layers': int(num_layers_1)}
+            winding_dims['secondary'] = {'x': x_start_2 + InsulationThickness_2, 'y': y_start_2 + InsulationThickness_2, 'width': (NumberOfTurns_2 / turns_per_layer_2) * pitch_2 - 2*InsulationThickness_2, 'height': turns_per_layer_2 * pitch_2 - 2*InsulationThickness_2, 'turns_per_layer': turns_per_layer_2, 'layers': int(num_layers_2)}
+
+        elif BobbinType == 'Split':
+            if PrimaryHeight + InterSectionSpacing + SecondaryHeight > bobbin_inner_height: return no_fit
+            
+            turns_per_layer_p = int(PrimaryHeight / pitch_1)
+            if turns_per_layer_p == 0: return no_fit
+            num_layers_1 = np.ceil(NumberOfTurns_1 / turns_per_layer_p)
+            width_1 = num_layers_1 * pitch_1
+            if width_1 > bobbin_inner_width: return no_fit
+
+            turns_per_layer_s = int(SecondaryHeight / pitch_2)
+            if turns_per_layer_s == 0: return no_fit
+            num_layers_2 = np.ceil(NumberOfTurns_2 / turns_per_layer_s)
+            width_2 = num_layers_2 * pitch_2
+            if width_2 > bobbin_inner_width: return no_fit
+
+            v_turns_p = min(NumberOfTurns_1, turns_per_layer_p) if NumberOfTurns_1 <= turns_per_layer_p else turns_per_layer_p
+            height_occupied_p = v_turns_p * pitch_1
+            empty_space_p = PrimaryHeight - height_occupied_p
+            y_start_p = BobbinThickness
+            if PrimaryYAlignSplit == 'center': y_start_p = BobbinThickness + empty_space_p / 2
+            elif PrimaryYAlignSplit == 'top': y_start_p = BobbinThickness + empty_space_p
+            primary = WindingMaker._place_turns(NumberOfTurns_1, turns_per_layer_p, BobbinThickness, y_start_p, pitch_1)
+
+            v_turns_s = min(NumberOfTurns_2, turns_per_layer_s) if NumberOfTurns_2 <= turns_per_layer_s else turns_per_layer_s
+            height_occupied_s = v_turns_s * pitch_2
+            empty_space_s = SecondaryHeight - height_occupied_s
+            y_start_s = BobbinThickness + PrimaryHeight + InterSectionSpacing
+            if SecondaryYAlignSplit == 'center': y_start_s += empty_space_s / 2
+            elif SecondaryYAlignSplit == 'top': y_start_s += empty_space_s
+            secondary = WindingMaker._place_turns(NumberOfTurns_2, turns_per_layer_s, BobbinThickness, y_start_s, pitch_2)
+                
+            winding_dims['primary'] = {'x': BobbinThickness + InsulationThickness_1, 'y': y_start_p + InsulationThickness_1, 'width': (NumberOfTurns_1 / turns_per_layer_p) * pitch_1 - 2*InsulationThickness_1, 'height': height_occupied_p - 2*InsulationThickness_1, 'turns_per_layer': turns_per_layer_p, 'layers': int(num_layers_1)}
+            winding_dims['secondary'] = {'x': BobbinThickness + InsulationThickness_2, 'y': y_start_s + InsulationThickness_2, 'width': (NumberOfTurns_2 / turns_per_layer_s) * pitch_2 - 2*InsulationThickness_2, 'height': height_occupied_s - 2*InsulationThickness_2, 'turns_per_layer': turns_per_layer_s, 'layers': int(num_layers_2)}
+
+        else:
+            return no_fit
+
+        return WindingMaker._turn_arrays([primary, secondary]), winding_dims
+
+    @staticmethod
+    @profiled('place_turns')
+    def _place_turns(NumberOfTurns, turns_per_layer, x_start, y_start, pitch):
+        # Turn centers filled layer by layer (bottom to top, then left to right)
+        layer, turn_in_layer = np.divmod(np.arange(NumberOfTurns), turns_per_layer)
+        x = x_start + (layer * pitch) + pitch / 2
+        y = y_start + (turn_in_layer * pitch) + pitch / 2
+        return x, y
+
+    @staticmethod
+    def _turn_arrays(windings):
+        # Concatenates the (x, y) arrays of each winding, in WINDINGS order, into the turn arrays
+        windings = [(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)) for x, y in windings] or [(np.empty(0), np.empty(0))]
+        return {
+            'x': np.concatenate([x for x, _ in windings]),
+            'y': np.concatenate([y for _, y in windings]),
+            'winding': np.concatenate([np.full(x.size, index, dtype=np.int8) for index, (x, _) in enumerate(windings)]),
+            'turn': np.concatenate([np.arange(1, x.size + 1) for x, _ in windings]),
+        }
+    
+    @staticmethod
+    @profiled('fit_check')
+    def fit_check(WindowWidth, WindowHeight, BobbinType, BobbinThickness,
+                  NumberOfTurns_1, NumberOfTurns_2,
+                  ConductorDiameter_1, InsulationThickness_1,
+                  ConductorDiameter_2, InsulationThickness_2,
+                  WindingsSpacing=0, PrimaryHeight=0, InterSectionSpacing=0, SecondaryHeight=0,
+                  SecondaryYAlign='bottom', PrimaryYAlignSplit='bottom', SecondaryYAlignSplit='bottom'):
+        """
+        Closed-form fit check of many candidate designs at once, without generating any turn coordinates.
+        Every argument may be an array (one entry per candidate) or a scalar shared by all of them. Returns a boolean mask of
+        the fitting candidates and the winding_dims arrays of the equivalent blocks ('x', 'y', 'width', 'height', plus
+        'turns_per_layer' and 'layers' of each winding), NaN for the candidates that do not fit.
+        """
+        (WindowWidth, WindowHeight, BobbinThickness, NumberOfTurns_1, NumberOfTurns_2,
+         ConductorDiameter_1, InsulationThickness_1, ConductorDiameter_2, InsulationThickness_2,
+         WindingsSpacing, PrimaryHeight, InterSectionSpacing, SecondaryHeight) = np.broadcast_arrays(*[
+            np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (
+                WindowWidth, WindowHeight, BobbinThickness, NumberOfTurns_1, NumberOfTurns_2,
+                ConductorDiameter_1, InsulationThickness_1, ConductorDiameter_2, InsulationThickness_2,
+                WindingsSpacing, PrimaryHeight, InterSectionSpacing, SecondaryHeight)])
+        BobbinType, SecondaryYAlign, PrimaryYAlignSplit, SecondaryYAlignSplit = np.broadcast_arrays(
+            *[np.asarray(value) for value in (BobbinType, SecondaryYAlign, PrimaryYAlignSplit, SecondaryYAlignSplit)], WindowWidth)[:4]
+
+        normal = BobbinType == 'Normal'
+        split = BobbinType == 'Split'
+
+        pitch_1 = ConductorDiameter_1 + 2 * InsulationThickness_1
+        pitch_2 = ConductorDiameter_2 + 2 * InsulationThickness_2
+        bobbin_inner_width = WindowWidth - BobbinThickness
+        bobbin_inner_height = WindowHeight - 2 * BobbinThickness
+
+        # Height available for each winding: the whole bobbin ('Normal') or its own section ('Split')
+        section_height_1 = np.where(split, PrimaryHeight, bobbin_inner_height)
+        section_height_2 = np.where(split, SecondaryHeight, bobbin_inner_height)
+
+        turns_per_layer_1 = np.trunc(section_height_1 / pitch_1)
+        turns_per_layer_2 = np.trunc(section_height_2 / pitch_2)
+        layers_fit = (turns_per_layer_1 > 0) & (turns_per_layer_2 > 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            num_layers_1 = np.ceil(NumberOfTurns_1 / turns_per_layer_1)
+            num_layers_2 = np.ceil(NumberOfTurns_2 / turns_per_layer_2)
+            width_1 = num_layers_1 * pitch_1
+            width_2 = num_layers_2 * pitch_2
+
+            fits_normal = normal & (width_1 + WindingsSpacing + width_2 <= bobbin_inner_width)
+            fits_split = (split & (PrimaryHeight + InterSectionSpacing + SecondaryHeight <= bobbin_inner_height)
+                          & (width_1 <= bobbin_inner_width) & (width_2 <= bobbin_inner_width))
+            fits = layers_fit & (fits_normal | fits_split) & (NumberOfTurns_1 + NumberOfTurns_2 > 0)
+
+            # Vertical start of each winding
+            height_occupied_1 = np.minimum(NumberOfTurns_1, turns_per_layer_1) * pitch_1
+            height_occupied_2 = np.minimum(NumberOfTurns_2, turns_per_layer_2) * pitch_2
+
+            y_start_normal_2 = BobbinThickness + np.where(SecondaryYAlign == 'center', (bobbin_inner_height - height_occupied_2) / 2, 0)
+            empty_space_p = PrimaryHeight - height_occupied_1
+            empty_space_s = SecondaryHeight - height_occupied_2
+            y_start_p = BobbinThickness + np.select([PrimaryYAlignSplit == 'center', PrimaryYAlignSplit == 'top'], [empty_space_p / 2, empty_space_p], 0)
+            y_start_s = (BobbinThickness + PrimaryHeight + InterSectionSpacing
+                         + np.select([SecondaryYAlignSplit == 'center', SecondaryYAlignSplit == 'top'], [empty_space_s / 2, empty_space_s], 0))
+
+            x_start_2 = np.where(split, BobbinThickness, BobbinThickness + width_1 + WindingsSpacing)
+            y_start_1 = np.where(split, y_start_p, BobbinThickness)
+            y_start_2 = np.where(split, y_start_s, y_start_normal_2)
+
+            # Equivalent blocks: full layer height for 'Normal', occupied height for 'Split'
+            block_height_1 = np.where(split, height_occupied_1, turns_per_layer_1 * pitch_1)
+            block_height_2 = np.where(split, height_occupied_2, turns_per_layer_2 * pitch_2)
+
+            winding_dims = {
+                'primary': {'x': BobbinThickness + InsulationThickness_1, 'y': y_start_1 + InsulationThickness_1,
+                            'width': (NumberOfTurns_1 / turns_per_layer_1) * pitch_1 - 2*InsulationThickness_1,
+                            'height': block_height_1 - 2*InsulationThickness_1,
+                            'turns_per_layer': turns_per_layer_1, 'layers': num_layers_1},
+                'secondary': {'x': x_start_2 + InsulationThickness_2, 'y': y_start_2 + InsulationThickness_2,
+                              'width': (NumberOfTurns_2 / turns_per_layer_2) * pitch_2 - 2*InsulationThickness_2,
+                              'height': block_height_2 - 2*InsulationThickness_2,
+                              'turns_per_layer': turns_per_layer_2, 'layers': num_layers_2},
+            }
+
+        for dims in winding_dims.values():
+            for key in dims:
+                dims[key] = np.where(fits, dims[key], np.nan)
+
+        return fits, winding_dims
@@ -0,0 +1,143 @@
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_series_weights
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+
+class BatchLeakageInductanceCalculator:
+    """
+    Vectorized counterpart of LeakageInductanceCalculator.
+    Block bounds, number of turns and currents may be given as arrays (one entry per design) while all designs
+    share the same core window, so the window weights of FactorizedLeakageEngine are built once and every series is
+    a Gram contraction per design along a leading batch axis (O(K^2 (M + N)) temporaries per design).
+    """
+    def __init__(self,
+                 SelectedCore,
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 ChunkSize=256):
+
+
+        self.LeakageInductance = self._LeakageScaler(
+                 SelectedCore,
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 ChunkSize)
+
+
+
+    # Designs as a batch of blocks for FactorizedLeakageEngine
+    @staticmethod
+    def _Blocks(NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2,
+                Height_1_Minus, Height_1_Plus, Height_2_Minus, Height_2_Plus,
+                Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus, Shift=0):
+        """
+        Current densities (B, 2) and (Width_Minus, Width_Plus, Height_Minus, Height_Plus) bounds (B, 2, 4) of the designs,
+        with the heights shifted by Shift (outside-window series).
+        """
+        CurrentDensities = np.stack(np.broadcast_arrays((NumberOfTurns_1 * I_1) / (Width_1 * Height_1),
+                                                        (NumberOfTurns_2 * I_2) / (Width_2 * Height_2)), axis=-1)
+        Bounds = np.stack(np.broadcast_arrays(Width_1_Minus, Width_1_Plus, Height_1_Minus + Shift, Height_1_Plus + Shift,
+                                              Width_2_Minus, Width_2_Plus, Height_2_Minus + Shift, Height_2_Plus + Shift), axis=-1)
+        return np.atleast_2d(CurrentDensities), np.atleast_2d(Bounds).reshape(-1, 2, 4)
+
+
+
+    # 2D Leakage Inductance Functions (batched, one Gram contraction per design)
+    @staticmethod
+    def Leakage_pul_IW(M, N, I_ref, WindowWidth, WindowHeight, *Windings):
+        """
+        Windings: (NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2, Height_1_Minus,
+        Height_1_Plus, Height_2_Minus, Height_2_Plus, Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus), one
+        entry per design, as in LeakageInductanceCalculator.
+        """
+        CurrentDensities, Bounds = BatchLeakageInductanceCalculator._Blocks(*Windings)
+        return FactorizedLeakageEngine.Leakage_pul(M, N, I_ref, WindowWidth, WindowHeight, CurrentDensities, Bounds)
+
+    @staticmethod
+    def Leakage_pul_OW(M, N, I_ref, WindowWidth, WindowHeight, *Windings):
+        # The outside-window series is the inside-window one over the "infinite window", with the blocks centered vertically
+        w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+        CurrentDensities, Bounds = BatchLeakageInductanceCalculator._Blocks(*Windings, Shift=shift)
+        return FactorizedLeakageEngine.Leakage_pul(M, N, I_ref, w_w_inf, h_w_inf, CurrentDensities, Bounds)
+
+    @staticmethod
+    def Leakage_pua_IW(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *Windings):
+        CurrentDensities, Bounds = BatchLeakageInductanceCalculator._Blocks(*Windings)
+        return FactorizedLeakageEngine.Leakage_pua(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds)
+
+    @staticmethod
+    def Leakage_pua_OW(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *Windings):
+        w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+        CurrentDensities, Bounds = BatchLeakageInductanceCalculator._Blocks(*Windings, Shift=shift)
+        return FactorizedLeakageEngine.Leakage_pua(M, N, I_ref, w_w_inf, h_w_inf, DiameterCentralLeg, CurrentDensities, Bounds)
+
+
+
+    def _LeakageScaler(self,
+                 SelectedCore,
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 ChunkSize):
+
+        primary = EquivalentWindingsBlocks['primary']
+        secondary = EquivalentWindingsBlocks['secondary']
+
+        # Every per-design quantity is broadcast to a common 1-D batch
+        (NumberOfTurns_1, NumberOfTurns_2,
+         x_1, y_1, w_1, h_1, x_2, y_2, w_2, h_2) = np.broadcast_arrays(*[np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (
+            NumberOfTurns_1, NumberOfTurns_2,
+            primary['x'], primary['y'], primary['width'], primary['height'],
+            secondary['x'], secondary['y'], secondary['width'], secondary['height'])])
+
+        # Defines the primary and secondary windings current excitation according to the chosen reference of measurement/calculation
+        match ReferredWinding:
+
+            case "Primary":
+                self.I_ref = 1
+                self.I_1 = np.ones_like(NumberOfTurns_1)
+                self.I_2 = -NumberOfTurns_1/NumberOfTurns_2
+
+            case "Secondary":
+                self.I_ref = 1
+                self.I_2 = np.ones_like(NumberOfTurns_2)
+                self.I_1 = -NumberOfTurns_2/NumberOfTurns_1
+
+            case _:
+                raise ValueError(f"ReferredWinding must be 'Primary' or 'Secondary', not {ReferredWinding!r}")
+
+        # Defines each winding block size and position
+        self.Height_1, self.Width_1 = h_1, w_1
+        self.Height_2, self.Width_2 = h_2, w_2
+
+        self.Height_1_Minus, self.Height_1_Plus = y_1, y_1 + h_1
+        self.Height_2_Minus, self.Height_2_Plus = y_2, y_2 + h_2
+        self.Width_1_Minus, self.Width_1_Plus = x_1, x_1 + w_1
+        self.Width_2_Minus, self.Width_2_Plus = x_2, x_2 + w_2
+
+        # Core-Specific Leakage Expressions: weights of the 2D series
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+
+        LeakageInductance = np.empty_like(NumberOfTurns_1)
+
+        # The designs are evaluated in chunks so the (B, 2, 2, M) temporaries stay bounded
+        for start in range(0, LeakageInductance.size, ChunkSize):
+            chunk = slice(start, start + ChunkSize)
+            args = (NumberOfTurns_1[chunk], self.I_1[chunk], self.Width_1[chunk], self.Height_1[chunk],
+                    NumberOfTurns_2[chunk], self.I_2[chunk], self.Width_2[chunk], self.Height_2[chunk],
+                    self.Height_1_Minus[chunk], self.Height_1_Plus[chunk], self.Height_2_Minus[chunk], self.Height_2_Plus[chunk],
+                    self.Width_1_Minus[chunk], self.Width_1_Plus[chunk], self.Width_2_Minus[chunk], self.Width_2_Plus[chunk])
+
+            series = {'pul_IW': lambda: self.Leakage_pul_IW(30, 30, self.I_ref, WindowWidth, WindowHeight, *args),
+                      'pul_OW': lambda: self.Leakage_pul_OW(150, 150, self.I_ref, WindowWidth, WindowHeight, *args),
+                      'pua_IW': lambda: self.Leakage_pua_IW(30, 30, self.I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *args),
+                      'pua_OW': lambda: self.Leakage_pua_OW(150, 150, self.I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *args)}
+
+            LeakageInductance[chunk] = sum(series[name]()*weight for name, weight in Weights.items())
+
+        return LeakageInductance
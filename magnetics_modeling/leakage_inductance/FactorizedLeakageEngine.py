@@ -0,0 +1,385 @@
+import numpy as np
+from functools import lru_cache
+
+from magnetics_modeling.auxiliary_functions.profiling import checkpoint
+
+def _T(Matrices):
+    # Transpose of the last two axes
+    return np.swapaxes(Matrices, -1, -2)
+
+
+class FactorizedLeakageEngine:
+    """
+    Separable (rank-factorized) evaluation of the Leakage_pu* series.
+    The current density of a rectangular block is an outer product of 1-D sine-difference vectors, so every
+    double sum (and the p contraction of the p.u.a. triple sum) reduces to small matrix-vector products against
+    window weights that are shared by all blocks. The sine terms of a block are computed once and reused by the
+    m0, 0n and mn stages.
+
+    Bounds, spectra and current densities may carry leading batch axes (e.g. (designs, blocks, 4) bounds): the Gram
+    matrices are then formed per design, so a batch costs O(designs K^2 (M + N)) memory, never an (M, N) or (M, N, M)
+    tensor per design.
+    """
+    mu_0 = 4 * np.pi * 1e-7
+
+    @staticmethod
+    def OutsideWindow(WindowWidth, WindowHeight):
+        # "Infinite window" used by the outside-window series, with the blocks centered vertically in it
+        w_w_inf = WindowWidth * 10
+        h_w_inf = WindowHeight * 10
+        shift = h_w_inf / 2 - WindowHeight / 2
+
+        return w_w_inf, h_w_inf, shift
+
+    @staticmethod
+    def BlockSpectrum(M, N, WindowWidth, WindowHeight, Width_Minus, Width_Plus, Height_Minus, Height_Plus):
+        """
+        Sine-difference vectors of one block: s(m) for m = 1..M-1 and t(n) for n = 1..N. With array bounds, the
+        spectra of all those blocks stacked along the leading axes.
+        """
+        k_m = np.arange(1, M, dtype=np.float64) * (np.pi / WindowWidth)
+        k_n = np.arange(1, N + 1, dtype=np.float64) * (np.pi / WindowHeight)
+
+        s_m = np.sin(np.multiply.outer(Width_Plus, k_m)) - np.sin(np.multiply.outer(Width_Minus, k_m))
+        t_n = np.sin(np.multiply.outer(Height_Plus, k_n)) - np.sin(np.multiply.outer(Height_Minus, k_n))
+
+        return {'s_m': s_m, 't_n': t_n, 'width': np.subtract(Width_Plus, Width_Minus), 'height': np.subtract(Height_Plus, Height_Minus)}
+
+    @staticmethod
+    def StackedSpectrum(M, N, WindowWidth, WindowHeight, Bounds):
+        """
+        Stacked BlockSpectrum of every block of Bounds, (..., K, 4) as in Leakage_pul.
+        """
+        Bounds = np.asarray(Bounds, dtype=np.float64)
+        return FactorizedLeakageEngine.BlockSpectrum(M, N, WindowWidth, WindowHeight, *np.moveaxis(Bounds, -1, 0))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def WindowWeights(M, N, WindowWidth, WindowHeight):
+        """
+        Green's-function weights of the window, shared by every block. The (m + p) parity masks of the p.u.a. couplings
+        are applied here (masked entries are zero) and the (m, n, p) coupling is split into its (m, p) and (n, p) factors.
+        """
+        m_range = np.arange(1, M, dtype=np.float64)
+        n_range = np.arange(1, N + 1, dtype=np.float64)
+        n_short_range = np.arange(1, N, dtype=np.float64)
+
+        m = m_range[:, np.newaxis]
+        p = m_range[np.newaxis, :]
+        n = n_short_range[:, np.newaxis]
+        mask_mp = (m + p) % 2 == 1
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # sum_m0 coupling, (m, p)
+            coeff_mp = (8 / np.pi**2) * (1 / (2 * p**2) - (m**2 + p**2) / ((m**2 - p**2)**2))
+            # m-dependent part of the sum_mn coupling, (m, p)
+            coeff_mnp_m = (8 / np.pi**2) * (-(m**2 + p**2) / (m**2 - p**2)**2)
+
+        # sum_0n coupling, (n, p), only odd p
+        den_pn = p**2 * WindowHeight**2 + n**2 * WindowWidth**2
+        coeff_pn = (8 / np.pi**2) * (WindowHeight**2 / den_pn - (1 / p**2) * (1 + (n**2 * WindowWidth**2) / den_pn))
+
+        # n-dependent part of the sum_mn coupling, (n, p). Rows m of one parity only see the p columns of the other one
+        coeff_mnp_n = (8 / np.pi**2) * 0.5 * (WindowHeight**2 / den_pn)
+        p_odd = m_range % 2 == 1
+
+        weights = {
+            'm': m_range, 'n': n_range, 'n_short': n_short_range,
+            'm_odd': p_odd.astype(np.float64), 'm_even': (~p_odd).astype(np.float64),
+            'w_m0': (WindowWidth / (m_range * np.pi))**2,
+            'w_0n': (WindowHeight / (n_short_range * np.pi))**2,
+            'w_pul_mn': 1 / (((m * np.pi) / WindowWidth)**2 + ((n_range[np.newaxis, :] * np.pi) / WindowHeight)**2),
+            'w_pua_mn': 1 / (((m * np.pi) / WindowWidth)**2 + ((n_short_range[np.newaxis, :] * np.pi) / WindowHeight)**2),
+            'coeff_mp': np.where(mask_mp, coeff_mp, 0),
+            'coeff_pn': np.where(p_odd, 0.5 * coeff_pn, 0),
+            'coeff_mnp_m': np.where(mask_mp, coeff_mnp_m, 0),
+            'coeff_mnp_n_even_p': np.where(~p_odd, coeff_mnp_n, 0),
+            'coeff_mnp_n_odd_p': np.where(p_odd, coeff_mnp_n, 0),
+        }
+        for array in weights.values():
+            array.setflags(write=False)
+
+        return weights
+
+    @staticmethod
+    def _StackSpectra(Spectra, weights, WindowWidth, WindowHeight, n_count):
+        # Per-block vectors of the m0, 0n and mn stages, one row per block (Spectra: list of BlockSpectrum or stacked)
+        m, n = weights['m'], weights['n'][:n_count]
+        if isinstance(Spectra, dict):
+            s_m, t_n, widths, heights = Spectra['s_m'], Spectra['t_n'][..., :n_count], Spectra['width'], Spectra['height']
+        else:
+            s_m = np.array([spectrum['s_m'] for spectrum in Spectra])
+            t_n = np.array([spectrum['t_n'][:n_count] for spectrum in Spectra])
+            widths = np.array([spectrum['width'] for spectrum in Spectra])
+            heights = np.array([spectrum['height'] for spectrum in Spectra])
+
+        a_m0 = ((2 * heights) / (WindowHeight * np.pi))[..., np.newaxis] * s_m / m
+        b_0n = ((2 * widths) / (WindowWidth * np.pi))[..., np.newaxis] * t_n[..., :weights['n_short'].size] / weights['n_short']
+        u_m = s_m / m
+        v_n = t_n / n
+
+        return a_m0, b_0n, u_m, v_n
+
+    @staticmethod
+    def Gram_pul(M, N, WindowWidth, WindowHeight, Spectra):
+        """
+        Gram matrices (K x K) of the m0, 0n and mn stages of the 2D (p.u.l.) series for unit current densities,
+        so that sum_m0 + sum_0n + 0.5 * sum_mn = J^T (G_m0 + G_0n + 0.5 * G_mn) J.
+        """
+        mu_0 = FactorizedLeakageEngine.mu_0
+        weights = FactorizedLeakageEngine.WindowWeights(M, N, WindowWidth, WindowHeight)
+        a_m0, b_0n, u_m, v_n = FactorizedLeakageEngine._StackSpectra(Spectra, weights, WindowWidth, WindowHeight, N)
+        checkpoint('weights', a_m0, b_0n, u_m, v_n)
+
+        G_m0 = mu_0 * (a_m0 * weights['w_m0']) @ _T(a_m0)
+        checkpoint('m0', weights['w_m0'])
+        G_0n = mu_0 * (b_0n * weights['w_0n']) @ _T(b_0n)
+        checkpoint('0n', weights['w_0n'])
+
+        # sum_mn = sum_m u_k(m) u_l(m) [W @ (v_k v_l)](m)
+        vv = v_n[..., :, np.newaxis, :] * v_n[..., np.newaxis, :, :]
+        G_mn = mu_0 * (16 / np.pi**4) * np.einsum('...km,...lm,...klm->...kl', u_m, u_m, vv @ weights['w_pul_mn'].T)
+        checkpoint('mn', weights['w_pul_mn'])
+
+        return G_m0, G_0n, G_mn
+
+    @staticmethod
+    def Gram_pua(M, N, WindowWidth, WindowHeight, DiameterCentralLeg, Spectra):
+        """
+        Gram matrices (K x K) of the m0, 0n and mn stages of the 2.5D (p.u.a.) series for unit current densities.
+        The p contraction of the triple sum is done per block: its (m, p) part is a matrix-vector product and its (n, p)
+        part only depends on the parity of m, so no (M-1, N-1, M-1) tensor is ever formed.
+        """
+        mu_0 = FactorizedLeakageEngine.mu_0
+        weights = FactorizedLeakageEngine.WindowWeights(M, N, WindowWidth, WindowHeight)
+        a_m0, b_0n, u_m, v_n = FactorizedLeakageEngine._StackSpectra(Spectra, weights, WindowWidth, WindowHeight, N - 1)
+        kappa = DiameterCentralLeg / WindowWidth + 1
+        checkpoint('weights', a_m0, b_0n, u_m, v_n)
+
+        # --- sum_m0 ---
+        G_m0 = mu_0 * (a_m0 * weights['w_m0']) @ _T(kappa * a_m0 + a_m0 @ weights['coeff_mp'].T)
+        checkpoint('m0', weights['coeff_mp'])
+
+        # --- sum_0n --- (J(p, n) of block l is (4/pi^2) u_l(p) v_l(n))
+        J_til_0n_temp = (4 / np.pi**2) * v_n * (u_m @ weights['coeff_pn'].T)
+        G_0n = mu_0 * (b_0n * weights['w_0n']) @ _T(kappa * b_0n + J_til_0n_temp)
+        checkpoint('0n', weights['coeff_pn'])
+
+        # --- sum_mn ---
+        w_mn = weights['w_pua_mn']
+        y_m = kappa * u_m + u_m @ weights['coeff_mnp_m'].T
+        z_even_p = u_m @ weights['coeff_mnp_n_even_p'].T # Seen by odd m
+        z_odd_p = u_m @ weights['coeff_mnp_n_odd_p'].T   # Seen by even m
+
+        vv = v_n[..., :, np.newaxis, :] * v_n[..., np.newaxis, :, :]
+        G_mn = np.einsum('...km,...lm,...klm->...kl', u_m, y_m, vv @ w_mn.T)
+        G_mn += np.einsum('...km,...klm->...kl', u_m * weights['m_odd'], (vv * z_even_p[..., np.newaxis, :, :]) @ w_mn.T)
+        G_mn += np.einsum('...km,...klm->...kl', u_m * weights['m_even'], (vv * z_odd_p[..., np.newaxis, :, :]) @ w_mn.T)
+        G_mn *= mu_0 * (16 / np.pi**4)
+        checkpoint('mn', w_mn, weights['coeff_mnp_m'])
+
+        return G_m0, G_0n, G_mn
+
+    @staticmethod
+    def FieldCoefficients(M, N, WindowWidth, WindowHeight, CurrentDensities, Spectra):
+        """
+        Fourier coefficients of the vector potential of the 2D (p.u.l.) problem,
+        A(x, y) = sum_m A_m0 cos(m pi x / W) + sum_n A_0n cos(n pi y / H) + sum_mn A_mn cos(m pi x / W) cos(n pi y / H),
+        for the given current densities of the blocks ('m', 'n' and 'n_short' are the matching harmonic numbers).
+        """
+        mu_0 = FactorizedLeakageEngine.mu_0
+        weights = FactorizedLeakageEngine.WindowWeights(M, N, WindowWidth, WindowHeight)
+        a_m0, b_0n, u_m, v_n = FactorizedLeakageEngine._StackSpectra(Spectra, weights, WindowWidth, WindowHeight, N)
+        J = np.asarray(CurrentDensities, dtype=np.float64)
+
+        return {
+            'm': weights['m'], 'n': weights['n'], 'n_short': weights['n_short'],
+            'A_m0': mu_0 * weights['w_m0'] * (J @ a_m0),
+            'A_0n': mu_0 * weights['w_0n'] * (J @ b_0n),
+            'A_mn': mu_0 * weights['w_pul_mn'] * ((4 / np.pi**2) * (u_m.T * J) @ v_n),
+        }
+
+    @staticmethod
+    def _Contract(Grams, CurrentDensities, scale, ReturnStages):
+        J = np.asarray(CurrentDensities, dtype=np.float64)
+        sum_m0, sum_0n, sum_mn = (np.einsum('...k,...kl,...l->...', J, G, J) for G in Grams)
+        Leakage = scale * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        if ReturnStages:
+            return Leakage, (scale * sum_m0, scale * sum_0n, scale * 0.5 * sum_mn)
+
+        return Leakage
+
+    @staticmethod
+    def _Chunked(Evaluate, M, N, CurrentDensities, Bounds, ReturnStages, MemoryBudget):
+        """
+        Evaluate(CurrentDensities, Bounds) over the designs of the leading batch axes, in chunks whose temporaries stay
+        within MemoryBudget bytes. A design needs O(K^2 (M + N)) bytes (the (K, K, harmonics) stage products), so a
+        single design is always evaluated at once; the cached window weights (O(M N)) are not counted.
+        """
+        Bounds = np.asarray(Bounds, dtype=np.float64)
+        K, shape = Bounds.shape[-2], Bounds.shape[:-2]
+        # Upper estimate of the peak temporaries of one design (measured: about half of it for the p.u.a. series)
+        designs = max(1, int(MemoryBudget // (24 * K * (K + 4) * (M + N))))
+        if len(shape) == 0 or int(np.prod(shape)) <= designs:
+            return Evaluate(CurrentDensities, Bounds)
+
+        J = np.broadcast_to(np.asarray(CurrentDensities, dtype=np.float64), shape + (K,)).reshape(-1, K)
+        Bounds = Bounds.reshape(-1, K, 4)
+        parts = [Evaluate(J[start:start + designs], Bounds[start:start + designs]) for start in range(0, len(J), designs)]
+        if ReturnStages:
+            return (np.concatenate([leakage for leakage, _ in parts]).reshape(shape),
+                    tuple(np.concatenate(stage).reshape(shape) for stage in zip(*(stages for _, stages in parts))))
+        return np.concatenate(parts).reshape(shape)
+
+    @staticmethod
+    def Leakage_pul(M, N, I_ref, WindowWidth, WindowHeight, CurrentDensities, Bounds, ReturnStages=False, Spectra=None,
+                    MemoryBudget=None):
+        """
+        2D leakage inductance p.u.l. of any number of blocks. Bounds holds (Width_Minus, Width_Plus, Height_Minus, Height_Plus)
+        for each block and CurrentDensities the matching current densities, optionally with leading batch axes ((..., K, 4)
+        and (..., K), one leakage per design). Spectra may hold the BlockSpectrum of each block
+        (for the same M, N and window) when the caller already has them, in which case Bounds is not used.
+        MemoryBudget (bytes) evaluates batches in chunks (_Chunked).
+        """
+        if MemoryBudget is not None and Spectra is None:
+            return FactorizedLeakageEngine._Chunked(
+                lambda J, B: FactorizedLeakageEngine.Leakage_pul(M, N, I_ref, WindowWidth, WindowHeight, J, B, ReturnStages),
+                M, N, CurrentDensities, Bounds, ReturnStages, MemoryBudget)
+        if Spectra is None:
+            Spectra = FactorizedLeakageEngine.StackedSpectrum(M, N, WindowWidth, WindowHeight, Bounds)
+        checkpoint('spectra')
+        Grams = FactorizedLeakageEngine.Gram_pul(M, N, WindowWidth, WindowHeight, Spectra)
+
+        return FactorizedLeakageEngine._Contract(Grams, CurrentDensities, (WindowWidth * WindowHeight) / (2 * I_ref**2), ReturnStages)
+
+    @staticmethod
+    def Leakage_pua(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds, ReturnStages=False, Spectra=None,
+                    MemoryBudget=None):
+        """
+        2.5D leakage inductance p.u.a. of any number of blocks (same arguments as Leakage_pul).
+        """
+        if MemoryBudget is not None and Spectra is None:
+            return FactorizedLeakageEngine._Chunked(
+                lambda J, B: FactorizedLeakageEngine.Leakage_pua(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, J, B, ReturnStages),
+                M, N, CurrentDensities, Bounds, ReturnStages, MemoryBudget)
+        if Spectra is None:
+            Spectra = FactorizedLeakageEngine.StackedSpectrum(M, N, WindowWidth, WindowHeight, Bounds)
+        checkpoint('spectra')
+        Grams = FactorizedLeakageEngine.Gram_pua(M, N, WindowWidth, WindowHeight, DiameterCentralLeg, Spectra)
+
+        return FactorizedLeakageEngine._Contract(Grams, CurrentDensities, (WindowHeight * (WindowWidth**2)) / (4 * I_ref**2), ReturnStages)
+
+    # Analytic gradients
+    @staticmethod
+    def _CurrentCoefficients(M, N, WindowWidth, WindowHeight, CurrentDensities, Bounds, n_count):
+        # Current-weighted coefficients of all blocks, alpha(m) of the m0 stage, beta(n) of the 0n stage and Gamma(m, n)
+        # (= J(m, n)) of the mn stage, with the per-block terms the chain rule goes back through
+        weights = FactorizedLeakageEngine.WindowWeights(M, N, WindowWidth, WindowHeight)
+        m, n, n_short = weights['m'], weights['n'][:n_count], weights['n_short']
+        k_m, k_n = m * np.pi / WindowWidth, n * np.pi / WindowHeight
+        Bounds = np.asarray(Bounds, dtype=np.float64).reshape(-1, 4)
+        J = np.asarray(CurrentDensities, dtype=np.float64)
+
+        # sin and cos of every block bound, (K, 2, harmonics): minus and plus
+        phase_x = np.multiply.outer(Bounds[:, :2], k_m)
+        phase_y = np.multiply.outer(Bounds[:, 2:], k_n)
+        sin_x, cos_x = np.sin(phase_x), np.cos(phase_x)
+        sin_y, cos_y = np.sin(phase_y), np.cos(phase_y)
+
+        widths, heights = Bounds[:, 1] - Bounds[:, 0], Bounds[:, 3] - Bounds[:, 2]
+        u = (sin_x[:, 1] - sin_x[:, 0]) / m
+        v = (sin_y[:, 1] - sin_y[:, 0]) / n
+        c_h = (2 * heights) / (WindowHeight * np.pi)
+        c_w = (2 * widths) / (WindowWidth * np.pi)
+
+        return {'weights': weights, 'J': J, 'u': u, 'v': v, 'c_h': c_h, 'c_w': c_w, 'k_m': k_m, 'k_n': k_n,
+                'cos_x': cos_x, 'cos_y': cos_y, 'short': n_short.size,
+                'alpha': J @ (c_h[:, np.newaxis] * u),
+                'beta': J @ (c_w[:, np.newaxis] * v[:, :n_short.size]),
+                'Gamma': (4 / np.pi**2) * (u.T * J) @ v}
+
+    @staticmethod
+    def _ChainRule(Terms, g_alpha, g_beta, g_Gamma, WindowWidth, WindowHeight):
+        # Gradients with respect to alpha, beta and Gamma -> current densities (K,) and block bounds (K, 4)
+        J, u, v, c_h, c_w, short = Terms['J'], Terms['u'], Terms['v'], Terms['c_h'], Terms['c_w'], Terms['short']
+        Gu = (4 / np.pi**2) * v @ g_Gamma.T # sum_n g_Gamma(m, n) v_k(n), (K, M-1)
+        Gv = (4 / np.pi**2) * u @ g_Gamma   # sum_m g_Gamma(m, n) u_k(m), (K, n_count)
+
+        d_J = c_h * (u @ g_alpha) + c_w * (v[:, :short] @ g_beta) + np.einsum('km,km->k', u, Gu)
+
+        g_u = J[:, np.newaxis] * (Gu + c_h[:, np.newaxis] * g_alpha)
+        g_v = J[:, np.newaxis] * Gv
+        g_v[:, :short] += (J * c_w)[:, np.newaxis] * g_beta
+        g_height = J * (2 / (WindowHeight * np.pi)) * (u @ g_alpha)
+        g_width = J * (2 / (WindowWidth * np.pi)) * (v[:, :short] @ g_beta)
+
+        # u = (sin(k_m x_plus) - sin(k_m x_minus)) / m, so du/dx_plus = (pi / W) cos(k_m x_plus) (and likewise for v)
+        g_x = (g_u * (np.pi / WindowWidth))[:, np.newaxis, :] * Terms['cos_x']
+        g_y = (g_v * (np.pi / WindowHeight))[:, np.newaxis, :] * Terms['cos_y']
+        d_Bounds = np.stack((-g_x[:, 0].sum(axis=1) - g_width, g_x[:, 1].sum(axis=1) + g_width,
+                             -g_y[:, 0].sum(axis=1) - g_height, g_y[:, 1].sum(axis=1) + g_height), axis=-1)
+
+        return d_J, d_Bounds
+
+    @staticmethod
+    def Leakage_pul_Gradient(M, N, I_ref, WindowWidth, WindowHeight, CurrentDensities, Bounds):
+        """
+        Leakage_pul together with its gradient with respect to the current density (K,) and to the
+        (Width_Minus, Width_Plus, Height_Minus, Height_Plus) bounds (K, 4) of every block, all in one pass.
+        """
+        mu_0 = FactorizedLeakageEngine.mu_0
+        terms = FactorizedLeakageEngine._CurrentCoefficients(M, N, WindowWidth, WindowHeight, CurrentDensities, Bounds, N)
+        weights, alpha, beta, Gamma = terms['weights'], terms['alpha'], terms['beta'], terms['Gamma']
+        scale = (WindowWidth * WindowHeight) / (2 * I_ref**2)
+
+        sum_m0 = mu_0 * weights['w_m0'] @ alpha**2
+        sum_0n = mu_0 * weights['w_0n'] @ beta**2
+        sum_mn = mu_0 * np.sum(weights['w_pul_mn'] * Gamma**2)
+        Leakage = scale * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        g_alpha = scale * 2 * mu_0 * weights['w_m0'] * alpha
+        g_beta = scale * 2 * mu_0 * weights['w_0n'] * beta
+        g_Gamma = scale * mu_0 * weights['w_pul_mn'] * Gamma
+
+        return (Leakage, *FactorizedLeakageEngine._ChainRule(terms, g_alpha, g_beta, g_Gamma, WindowWidth, WindowHeight))
+
+    @staticmethod
+    def Leakage_pua_Gradient(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, CurrentDensities, Bounds):
+        """
+        Leakage_pua together with its gradient (same outputs as Leakage_pul_Gradient).
+        """
+        mu_0 = FactorizedLeakageEngine.mu_0
+        terms = FactorizedLeakageEngine._CurrentCoefficients(M, N, WindowWidth, WindowHeight, CurrentDensities, Bounds, N - 1)
+        weights, alpha, beta, Gamma = terms['weights'], terms['alpha'], terms['beta'], terms['Gamma']
+        kappa = DiameterCentralLeg / WindowWidth + 1
+        scale = (WindowHeight * (WindowWidth**2)) / (4 * I_ref**2)
+        w_m0, w_0n, w_mn = weights['w_m0'], weights['w_0n'], weights['w_pua_mn']
+        C_mp, C_pn, C_m = weights['coeff_mp'], weights['coeff_pn'], weights['coeff_mnp_m']
+        C_n_even_p, C_n_odd_p = weights['coeff_mnp_n_even_p'], weights['coeff_mnp_n_odd_p']
+        m_odd, m_even = weights['m_odd'], weights['m_even']
+
+        # sum_m0 = alpha^T D (kappa alpha + C_mp alpha), D = diag(w_m0)
+        coupled_m0 = C_mp @ alpha
+        sum_m0 = mu_0 * w_m0 @ (alpha * (kappa * alpha + coupled_m0))
+
+        # sum_0n = sum_n w_0n beta (kappa beta + Y), Y(n) = sum_p C_pn(n, p) Gamma(p, n)
+        Y = np.einsum('np,pn->n', C_pn, Gamma)
+        sum_0n = mu_0 * w_0n @ (beta * (kappa * beta + Y))
+
+        # sum_mn = sum w_mn Gamma (kappa Gamma + T), with T the (m, n, p) coupling of Gamma split by the parity of m
+        Z_even_p = np.einsum('np,pn->n', C_n_even_p, Gamma)
+        Z_odd_p = np.einsum('np,pn->n', C_n_odd_p, Gamma)
+        T = C_m @ Gamma + np.outer(m_odd, Z_even_p) + np.outer(m_even, Z_odd_p)
+        P = w_mn * Gamma
+        sum_mn = mu_0 * np.sum(P * (kappa * Gamma + T))
+
+        Leakage = scale * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        g_alpha = scale * mu_0 * (2 * kappa * w_m0 * alpha + w_m0 * coupled_m0 + C_mp.T @ (w_m0 * alpha))
+        g_beta = scale * mu_0 * w_0n * (2 * kappa * beta + Y)
+        g_mn = (w_mn * (kappa * Gamma + T) + kappa * P + C_m.T @ P
+                + (C_n_even_p * (m_odd @ P)[:, np.newaxis]).T + (C_n_odd_p * (m_even @ P)[:, np.newaxis]).T)
+        g_Gamma = scale * mu_0 * (0.5 * g_mn + (C_pn * (w_0n * beta)[:, np.newaxis]).T)
+
+        return (Leakage, *FactorizedLeakageEngine._ChainRule(terms, g_alpha, g_beta, g_Gamma, WindowWidth, WindowHeight))
@@ -0,0 +1,115 @@
+import numpy as np
+
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+
+class LeakageFieldMap:
+    """
+    2D leakage field over the core window (inside-window p.u.l. problem) from the Fourier coefficients of the vector
+    potential (FactorizedLeakageEngine.FieldCoefficients), with the same excitation as LeakageInductanceCalculator
+    (I_ref = 1 A in the referred winding, ampere-turn balanced).
+
+    grid() synthesizes A, Bx = dA/dy and By = -dA/dx on a uniform grid of the whole window with one real FFT per axis
+    and field (the cos and sin sums of a uniform grid are the real and imaginary parts of the same DFT), so a G-point
+    grid costs O(G log G) instead of the O(G M N) of direct summation. at() evaluates the series exactly at arbitrary
+    points, e.g. the turn centers of WindingMaker (at_turns).
+    """
+    def __init__(self,
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 M=30, N=30):
+
+        self.WindowWidth = WindowWidth
+        self.WindowHeight = WindowHeight
+
+        match ReferredWinding:
+            case "Primary":
+                self.I_1, self.I_2 = 1, -NumberOfTurns_1/NumberOfTurns_2
+            case "Secondary":
+                self.I_1, self.I_2 = -NumberOfTurns_2/NumberOfTurns_1, 1
+
+        primary, secondary = EquivalentWindingsBlocks['primary'], EquivalentWindingsBlocks['secondary']
+        bounds = [(block['x'], block['x'] + block['width'], block['y'], block['y'] + block['height']) for block in (primary, secondary)]
+        CurrentDensities = [(NumberOfTurns_1 * self.I_1) / (primary['width'] * primary['height']),
+                            (NumberOfTurns_2 * self.I_2) / (secondary['width'] * secondary['height'])]
+        Spectra = [FactorizedLeakageEngine.BlockSpectrum(M, N, WindowWidth, WindowHeight, *b) for b in bounds]
+
+        self.Coefficients = FactorizedLeakageEngine.FieldCoefficients(M, N, WindowWidth, WindowHeight, CurrentDensities, Spectra)
+        self.k_m = self.Coefficients['m'] * np.pi / WindowWidth
+        self.k_n = self.Coefficients['n'] * np.pi / WindowHeight
+        self.k_n_short = self.Coefficients['n_short'] * np.pi / WindowHeight
+
+    @staticmethod
+    def _Synthesis(Coefficients, Points):
+        """
+        sum_k c_k cos(k pi i / (Points - 1)) and sum_k c_k sin(k pi i / (Points - 1)), i = 0..Points-1, for the harmonics
+        k = 1..K along the last axis of Coefficients. Harmonics beyond the DFT period are folded onto it (exact on the grid).
+        """
+        period = 2 * (Points - 1)
+        K = Coefficients.shape[-1]
+        padded = np.zeros(Coefficients.shape[:-1] + (-(-(K + 1) // period) * period,))
+        padded[..., 1:K + 1] = Coefficients
+        folded = padded.reshape(Coefficients.shape[:-1] + (-1, period)).sum(axis=-2)
+
+        # rfft holds exactly the Points samples 0..period/2
+        spectrum = np.fft.rfft(folded, axis=-1)
+        return spectrum.real, -spectrum.imag
+
+    def grid(self, Points=(129, 129)):
+        """
+        A (Wb/m), Bx, By and |B| (T) on a uniform (Points_y, Points_x) grid covering the window, rows along y.
+        Both axes need at least 2 points (the window edges).
+        """
+        Points_x, Points_y = Points
+        for name, value in (('Points_x', Points_x), ('Points_y', Points_y)):
+            if int(value) != value or value < 2:
+                raise ValueError(f"{name} must be an integer of at least 2, not {value}")
+        Points_x, Points_y = int(Points_x), int(Points_y)
+        coefficients = self.Coefficients
+        k_m, k_n, k_n_short = self.k_m, self.k_n, self.k_n_short
+        synthesis = self._Synthesis
+
+        # m axis first (for every n), then the n axis
+        cos_x_mn, _ = synthesis(coefficients['A_mn'].T, Points_x)                            # (N, Points_x)
+        _, sin_x_mn = synthesis((k_m[:, np.newaxis] * coefficients['A_mn']).T, Points_x)
+        cos_x_m0, _ = synthesis(coefficients['A_m0'], Points_x)
+        _, sin_x_m0 = synthesis(k_m * coefficients['A_m0'], Points_x)
+        cos_y_0n, _ = synthesis(coefficients['A_0n'], Points_y)
+        _, sin_y_0n = synthesis(k_n_short * coefficients['A_0n'], Points_y)
+
+        cos_xy, _ = synthesis(cos_x_mn.T, Points_y)                                          # (Points_x, Points_y)
+        _, sin_y_cos_x = synthesis((cos_x_mn * k_n[:, np.newaxis]).T, Points_y)
+        cos_y_sin_x, _ = synthesis(sin_x_mn.T, Points_y)
+
+        A = cos_xy + cos_x_m0[:, np.newaxis] + cos_y_0n[np.newaxis, :]
+        B_x = -sin_y_cos_x - sin_y_0n[np.newaxis, :]
+        B_y = cos_y_sin_x + sin_x_m0[:, np.newaxis]
+
+        return {'x': np.linspace(0, self.WindowWidth, Points_x), 'y': np.linspace(0, self.WindowHeight, Points_y),
+                'A': A.T, 'Bx': B_x.T, 'By': B_y.T, 'B': np.hypot(B_x, B_y).T}
+
+    def at(self, x, y):
+        """
+        A, Bx, By and |B| at the points (x, y), by direct summation of the series (separable cos/sin tables).
+        """
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        coefficients = self.Coefficients
+        k_m, k_n, k_n_short = self.k_m, self.k_n, self.k_n_short
+
+        cos_x, sin_x = np.cos(np.multiply.outer(x, k_m)), np.sin(np.multiply.outer(x, k_m))
+        cos_y, sin_y = np.cos(np.multiply.outer(y, k_n)), np.sin(np.multiply.outer(y, k_n))
+        short = k_n_short.size
+
+        A = (cos_x @ coefficients['A_m0'] + cos_y[..., :short] @ coefficients['A_0n']
+             + np.einsum('...n,...n->...', cos_x @ coefficients['A_mn'], cos_y))
+        B_x = -sin_y[..., :short] @ (k_n_short * coefficients['A_0n']) - np.einsum('...n,...n->...', cos_x @ (coefficients['A_mn'] * k_n), sin_y)
+        B_y = sin_x @ (k_m * coefficients['A_m0']) + np.einsum('...n,...n->...', sin_x @ (k_m[:, np.newaxis] * coefficients['A_mn']), cos_y)
+
+        return {'A': A, 'Bx': B_x, 'By': B_y, 'B': np.hypot(B_x, B_y)}
+
+    def at_turns(self, Turns):
+        """
+        Field at the center of every turn of WindingMaker.turns (same order as its 'x', 'y', 'winding' and 'turn' arrays).
+        """
+        return self.at(Turns['x'], Turns['y'])
@@ -0,0 +1,710 @@
+import numpy as np
+
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+from magnetics_modeling.leakage_inductance.OpenBoundaryLeakageEngine import OpenBoundaryLeakageEngine
+from magnetics_modeling.auxiliary_functions.profiling import profiled, checkpoint
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_series_weights
+
+class LeakageInductanceCalculator:
+
+    def __init__(self,
+                 SelectedCore, 
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 MemoryBudget=None, Tolerance=None, MaxHarmonics=640, Method='factorized', Cache=None, OutsideWindow='series',
+                 Gradient=False, Surrogate=None):
+
+        self._Geometry(EquivalentWindingsBlocks)
+
+        # A surrogate lookup (leakage_inductance.LeakageSurrogate) is cheaper than a cache lookup, so it bypasses Cache
+        if Cache is None or Surrogate is not None:
+            self.LeakageInductance = self._LeakageScaler(
+                     SelectedCore, 
+                     ReferredWinding,
+                     WindowWidth, WindowHeight,
+                     EquivalentWindingsBlocks,
+                     NumberOfTurns_1, NumberOfTurns_2,
+                     MemoryBudget, Tolerance, MaxHarmonics, Method, OutsideWindow, Gradient, Surrogate)
+            return
+
+        # Opt-in memoization (auxiliary_functions.result_cache.ResultCache): the key holds every input the result
+        # depends on; MemoryBudget and Method only change how the same series are evaluated
+        def Compute():
+            self._LeakageScaler(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, EquivalentWindingsBlocks,
+                                NumberOfTurns_1, NumberOfTurns_2, MemoryBudget, Tolerance, MaxHarmonics, Method, OutsideWindow, Gradient)
+            return {name: getattr(self, name) for name in self.CACHED_RESULTS}
+
+        Parameters = {'core': {key: SelectedCore[key] for key in ('family', 'A', 'B', 'C', 'D', 'E', 'F', 'F2') if key in SelectedCore},
+                      'ReferredWinding': ReferredWinding,
+                      'WindowWidth': WindowWidth, 'WindowHeight': WindowHeight,
+                      'blocks': {winding: {key: EquivalentWindingsBlocks[winding][key] for key in ('x', 'y', 'width', 'height')}
+                                 for winding in ('primary', 'secondary')},
+                      'NumberOfTurns': (NumberOfTurns_1, NumberOfTurns_2),
+                      'Harmonics': (30, 150), 'Tolerance': Tolerance, 'MaxHarmonics': MaxHarmonics, 'OutsideWindow': OutsideWindow,
+                      'Gradient': Gradient}
+        self.__dict__.update(Cache.get_or_compute('LeakageInductanceCalculator/2', Parameters, Compute))
+
+    def _Geometry(self, EquivalentWindingsBlocks):
+        # Defines each winding block size and position (also on a cache hit, which only restores CACHED_RESULTS)
+        self.Height_1   = EquivalentWindingsBlocks['primary']['height']
+        self.Width_1    = EquivalentWindingsBlocks['primary']['width']
+        
+        self.Height_2   = EquivalentWindingsBlocks['secondary']['height']
+        self.Width_2    = EquivalentWindingsBlocks['secondary']['width']
+
+        self.Height_1_Minus  = EquivalentWindingsBlocks['primary']['y']
+        self.Height_1_Plus   = EquivalentWindingsBlocks['primary']['y'] + EquivalentWindingsBlocks['primary']['height']
+
+        self.Height_2_Minus  = EquivalentWindingsBlocks['secondary']['y']
+        self.Height_2_Plus   = EquivalentWindingsBlocks['secondary']['y'] + EquivalentWindingsBlocks['secondary']['height']
+
+        self.Width_1_Minus   = EquivalentWindingsBlocks['primary']['x']
+        self.Width_1_Plus    = EquivalentWindingsBlocks['primary']['x'] + EquivalentWindingsBlocks['primary']['width']
+
+        self.Width_2_Minus   = EquivalentWindingsBlocks['secondary']['x']
+        self.Width_2_Plus    = EquivalentWindingsBlocks['secondary']['x'] + EquivalentWindingsBlocks['secondary']['width']
+
+    # Attributes restored from a ResultCache hit
+    CACHED_RESULTS = ('LeakageInductance', 'HarmonicCounts', 'ErrorEstimates', 'ErrorEstimate', 'Tolerance', 'MaxHarmonics',
+                      'I_ref', 'I_1', 'I_2', 'Gradient')
+
+    # Block bounds reported in Gradient, in the (Width_Minus, Width_Plus, Height_Minus, Height_Plus) order of each block
+    GRADIENT_BOUNDS = (('Width_1_Minus', 'Width_1_Plus', 'Height_1_Minus', 'Height_1_Plus'),
+                       ('Width_2_Minus', 'Width_2_Plus', 'Height_2_Minus', 'Height_2_Plus'))
+
+
+
+    # 2D Leakage Inductance Functions
+    @staticmethod
+    @profiled('pul_IW')
+    def Leakage_pul_IW(M, N, I_ref, WindowWidth, WindowHeight,
+                                    NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2,
+                                    Height_1_Minus, Height_1_Plus, Height_2_Minus, Height_2_Plus,
+                                    Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus,
+                                    ReturnStages=False, Method='factorized'):
+
+        mu_0 = 4 * np.pi * 1e-7  # Vacuum Permeability
+        J_1 = (NumberOfTurns_1 * I_1) / (Width_1 * Height_1) # Current Density
+        J_2 = (NumberOfTurns_2 * I_2) / (Width_2 * Height_2) # Current Density
+
+        if Method == 'factorized':
+            return FactorizedLeakageEngine.Leakage_pul(M, N, I_ref, WindowWidth, WindowHeight, [J_1, J_2],
+                                                       [(Width_1_Minus, Width_1_Plus, Height_1_Minus, Height_1_Plus),
+                                                        (Width_2_Minus, Width_2_Plus, Height_2_Minus, Height_2_Plus)],
+                                                       ReturnStages)
+
+        # Dense reference path
+        ### Somatório em m (vetorizado)
+        m_vec = np.arange(1, M, dtype=np.float64)
+        
+        J1_m0 = ((2 * J_1) / (m_vec * WindowHeight * np.pi)) * (np.sin((m_vec * np.pi * Width_1_Plus) / WindowWidth) - np.sin((m_vec * np.pi * Width_1_Minus) / WindowWidth)) * (Height_1_Plus - Height_1_Minus)
+        A1_m0 = (mu_0 * J1_m0) / (((m_vec * np.pi) / WindowWidth)**2)
+        J2_m0 = ((2 * J_2) / (m_vec * WindowHeight * np.pi)) * (np.sin((m_vec * np.pi * Width_2_Plus) / WindowWidth) - np.sin((m_vec * np.pi * Width_2_Minus) / WindowWidth)) * (Height_2_Plus - Height_2_Minus)
+        A2_m0 = (mu_0 * J2_m0) / (((m_vec * np.pi) / WindowWidth)**2)
+        
+        sum_m0 = np.sum((A1_m0 + A2_m0) * (J1_m0 + J2_m0))
+        checkpoint('m0', A1_m0, A2_m0)
+
+        ### Somatório em n (vetorizado)
+        n_vec = np.arange(1, N, dtype=np.float64)
+
+        J1_0n = ((2 * J_1) / (n_vec * WindowWidth * np.pi)) * (np.sin((n_vec * np.pi * Height_1_Plus) / WindowHeight) - np.sin((n_vec * np.pi * Height_1_Minus) / WindowHeight)) * (Width_1_Plus - Width_1_Minus)
+        A1_0n = (mu_0 * J1_0n) / (((n_vec * np.pi) / WindowHeight)**2)
+        J2_0n = ((2 * J_2) / (n_vec * WindowWidth * np.pi)) * (np.sin((n_vec * np.pi * Height_2_Plus) / WindowHeight) - np.sin((n_vec * np.pi * Height_2_Minus) / WindowHeight)) * (Width_2_Plus - Width_2_Minus)
+        A2_0n = (mu_0 * J2_0n) / (((n_vec * np.pi) / WindowHeight)**2)
+        
+        sum_0n = np.sum((A1_0n + A2_0n) * (J1_0n + J2_0n))
+        checkpoint('0n', A1_0n, A2_0n)
+
+        ### Somatório duplo em m e n (vetorizado com broadcasting)
+        m = np.arange(1, M, dtype=np.float64)[:, np.newaxis]
+        n = np.arange(1, N + 1, dtype=np.float64)
+        
+        term_m1 = np.sin((m * np.pi * Width_1_Plus) / WindowWidth) - np.sin((m * np.pi * Width_1_Minus) / WindowWidth)
+        term_n1 = np.sin((n * np.pi * Height_1_Plus) / WindowHeight) - np.sin((n * np.pi * Height_1_Minus) / WindowHeight)
+        J1_mn = ((4 * J_1) / (m * n * np.pi**2)) * term_m1 * term_n1
+        
+        term_m2 = np.sin((m * np.pi * Width_2_Plus) / WindowWidth) - np.sin((m * np.pi * Width_2_Minus) / WindowWidth)
+        term_n2 = np.sin((n * np.pi * Height_2_Plus) / WindowHeight) - np.sin((n * np.pi * Height_2_Minus) / WindowHeight)
+        J2_mn = ((4 * J_2) / (m * n * np.pi**2)) * term_m2 * term_n2
+
+        denominator_mn = ((m * np.pi) / WindowWidth)**2 + ((n * np.pi) / WindowHeight)**2
+        A1_mn = (mu_0 * J1_mn) / denominator_mn
+        A2_mn = (mu_0 * J2_mn) / denominator_mn
+        
+        sum_mn = np.sum((A1_mn + A2_mn) * (J1_mn + J2_mn))
+        checkpoint('mn', A1_mn, A2_mn)
+
+        ### Leakage Inductance p.u.l. (Inside Window)
+        Leakage_pul_IW = ((WindowWidth * WindowHeight) / (2 * I_ref**2)) * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        if ReturnStages:
+            # Contribution of each stage, in the same units as the result
+            scale = (WindowWidth * WindowHeight) / (2 * I_ref**2)
+            return Leakage_pul_IW, (scale * sum_m0, scale * sum_0n, scale * 0.5 * sum_mn)
+
+        return Leakage_pul_IW
+    
+    @staticmethod
+    @profiled('pul_OW')
+    def Leakage_pul_OW(M, N, I_ref, WindowWidth, WindowHeight,
+                                    NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2,
+                                    Height_1_Minus, Height_1_Plus, Height_2_Minus, Height_2_Plus,
+                                    Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus,
+                                    ReturnStages=False, Method='factorized'):
+
+        mu_0 = 4 * np.pi * 1e-7
+        J_1 = (NumberOfTurns_1 * I_1) / (Width_1 * Height_1)
+        J_2 = (NumberOfTurns_2 * I_2) / (Width_2 * Height_2)
+
+        if Method == 'open':
+            # Closed-form open-boundary model (M and N are not used)
+            return OpenBoundaryLeakageEngine.Leakage_pul(I_ref, [J_1, J_2],
+                                                         [(Width_1_Minus, Width_1_Plus, Height_1_Minus, Height_1_Plus),
+                                                          (Width_2_Minus, Width_2_Plus, Height_2_Minus, Height_2_Plus)])
+
+        if Method == 'factorized':
+            w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+            return FactorizedLeakageEngine.Leakage_pul(M, N, I_ref, w_w_inf, h_w_inf, [J_1, J_2],
+                                                       [(Width_1_Minus, Width_1_Plus, Height_1_Minus + shift, Height_1_Plus + shift),
+                                                        (Width_2_Minus, Width_2_Plus, Height_2_Minus + shift, Height_2_Plus + shift)],
+                                                       ReturnStages)
+
+        # Dense reference path
+        # --- Parâmetros da "Janela Infinita" ---
+        w_w_inf = WindowWidth * 10
+        h_w_inf = WindowHeight * 10
+        h_1_minus_inf = Height_1_Minus + (h_w_inf / 2 - WindowHeight / 2)
+        h_1_plus_inf = Height_1_Plus + (h_w_inf / 2 - WindowHeight / 2)
+        h_2_minus_inf = Height_2_Minus + (h_w_inf / 2 - WindowHeight / 2)
+        h_2_plus_inf = Height_2_Plus + (h_w_inf / 2 - WindowHeight / 2)
+
+        # --- Vetores para os índices ---
+        m_vec = np.arange(1, M, dtype=np.float64)
+        n_vec = np.arange(1, N, dtype=np.float64)
+
+        # --- Somatório em m (vetorizado) ---
+        J1_m0 = ((2 * J_1) / (m_vec * h_w_inf * np.pi)) * (np.sin((m_vec * np.pi * Width_1_Plus) / w_w_inf) - np.sin((m_vec * np.pi * Width_1_Minus) / w_w_inf)) * (h_1_plus_inf - h_1_minus_inf)
+        A1_m0 = (mu_0 * J1_m0) / (((m_vec * np.pi) / w_w_inf)**2)
+        J2_m0 = ((2 * J_2) / (m_vec * h_w_inf * np.pi)) * (np.sin((m_vec * np.pi * Width_2_Plus) / w_w_inf) - np.sin((m_vec * np.pi * Width_2_Minus) / w_w_inf)) * (h_2_plus_inf - h_2_minus_inf)
+        A2_m0 = (mu_0 * J2_m0) / (((m_vec * np.pi) / w_w_inf)**2)
+        sum_m0 = np.sum((A1_m0 + A2_m0) * (J1_m0 + J2_m0))
+        checkpoint('m0', A1_m0, A2_m0)
+
+        # --- Somatório em n (vetorizado) ---
+        J1_0n = ((2 * J_1) / (n_vec * w_w_inf * np.pi)) * (np.sin((n_vec * np.pi * h_1_plus_inf) / h_w_inf) - np.sin((n_vec * np.pi * h_1_minus_inf) / h_w_inf)) * (Width_1_Plus - Width_1_Minus)
+        A1_0n = (mu_0 * J1_0n) / (((n_vec * np.pi) / h_w_inf)**2)
+        J2_0n = ((2 * J_2) / (n_vec * w_w_inf * np.pi)) * (np.sin((n_vec * np.pi * h_2_plus_inf) / h_w_inf) - np.sin((n_vec * np.pi * h_2_minus_inf) / h_w_inf)) * (Width_2_Plus - Width_2_Minus)
+        A2_0n = (mu_0 * J2_0n) / (((n_vec * np.pi) / h_w_inf)**2)
+        sum_0n = np.sum((A1_0n + A2_0n) * (J1_0n + J2_0n))
+        checkpoint('0n', A1_0n, A2_0n)
+
+        # --- Somatório duplo em m e n (vetorizado com broadcasting) ---
+        m = np.arange(1, M, dtype=np.float64)[:, np.newaxis]
+        n = np.arange(1, N + 1, dtype=np.float64)
+
+        term_m1 = np.sin((m * np.pi * Width_1_Plus) / w_w_inf) - np.sin((m * np.pi * Width_1_Minus) / w_w_inf)
+        term_n1 = np.sin((n * np.pi * h_1_plus_inf) / h_w_inf) - np.sin((n * np.pi * h_1_minus_inf) / h_w_inf)
+        J1_mn = ((4 * J_1) / (m * n * np.pi**2)) * term_m1 * term_n1
+
+        term_m2 = np.sin((m * np.pi * Width_2_Plus) / w_w_inf) - np.sin((m * np.pi * Width_2_Minus) / w_w_inf)
+        term_n2 = np.sin((n * np.pi * h_2_plus_inf) / h_w_inf) - np.sin((n * np.pi * h_2_minus_inf) / h_w_inf)
+        J2_mn = ((4 * J_2) / (m * n * np.pi**2)) * term_m2 * term_n2
+
+        denominator_mn = ((m * np.pi) / w_w_inf)**2 + ((n * np.pi) / h_w_inf)**2
+        A1_mn = (mu_0 * J1_mn) / denominator_mn
+        A2_mn = (mu_0 * J2_mn) / denominator_mn
+        sum_mn = np.sum((A1_mn + A2_mn) * (J1_mn + J2_mn))
+        checkpoint('mn', A1_mn, A2_mn)
+
+        # --- Resultado Final ---
+        Leakage_pul_OW = ((w_w_inf * h_w_inf) / (2 * I_ref**2)) * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        if ReturnStages:
+            # Contribution of each stage, in the same units as the result
+            scale = (w_w_inf * h_w_inf) / (2 * I_ref**2)
+            return Leakage_pul_OW, (scale * sum_m0, scale * sum_0n, scale * 0.5 * sum_mn)
+
+        return Leakage_pul_OW
+    
+    @staticmethod
+    @profiled('pua_IW')
+    def Leakage_pua_IW(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg,
+                                    NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2,
+                                    Height_1_Minus, Height_1_Plus, Height_2_Minus, Height_2_Plus,
+                                    Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus,
+                                    MemoryBudget=None, ReturnStages=False, Method='factorized'):
+
+        mu_0 = 4 * np.pi * 1e-7
+        J_1 = (NumberOfTurns_1 * I_1) / (Width_1 * Height_1)
+        J_2 = (NumberOfTurns_2 * I_2) / (Width_2 * Height_2)
+
+        if Method == 'factorized':
+            return FactorizedLeakageEngine.Leakage_pua(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, [J_1, J_2],
+                                                       [(Width_1_Minus, Width_1_Plus, Height_1_Minus, Height_1_Plus),
+                                                        (Width_2_Minus, Width_2_Plus, Height_2_Minus, Height_2_Plus)],
+                                                       ReturnStages, MemoryBudget=MemoryBudget)
+
+        # Dense reference path
+        # --- 1. Pré-cálculo dos termos J (substituindo os dicionários) ---
+        m_range = np.arange(1, M, dtype=np.float64)
+        n_range = np.arange(1, N + 1, dtype=np.float64)
+        n_short_range = np.arange(1, N, dtype=np.float64)
+
+        # J(m, 0)
+        J1_m0 = ((2 * J_1) / (m_range * WindowHeight * np.pi)) * (np.sin((m_range * np.pi * Width_1_Plus) / WindowWidth) - np.sin((m_range * np.pi * Width_1_Minus) / WindowWidth)) * (Height_1_Plus - Height_1_Minus)
+        J2_m0 = ((2 * J_2) / (m_range * WindowHeight * np.pi)) * (np.sin((m_range * np.pi * Width_2_Plus) / WindowWidth) - np.sin((m_range * np.pi * Width_2_Minus) / WindowWidth)) * (Height_2_Plus - Height_2_Minus)
+        J_m0_vals = J1_m0 + J2_m0
+
+        # J(0, n)
+        J1_0n = ((2 * J_1) / (n_short_range * WindowWidth * np.pi)) * (np.sin((n_short_range * np.pi * Height_1_Plus) / WindowHeight) - np.sin((n_short_range * np.pi * Height_1_Minus) / WindowHeight)) * (Width_1_Plus - Width_1_Minus)
+        J2_0n = ((2 * J_2) / (n_short_range * WindowWidth * np.pi)) * (np.sin((n_short_range * np.pi * Height_2_Plus) / WindowHeight) - np.sin((n_short_range * np.pi * Height_2_Minus) / WindowHeight)) * (Width_2_Plus - Width_2_Minus)
+        J_0n_vals = J1_0n + J2_0n
+
+        # J(p, n)
+        p_grid_pn = m_range[:, np.newaxis]
+        n_grid_pn = n_range[np.newaxis, :]
+        term_p1 = np.sin((p_grid_pn * np.pi * Width_1_Plus) / WindowWidth) - np.sin((p_grid_pn * np.pi * Width_1_Minus) / WindowWidth)
+        term_n1 = np.sin((n_grid_pn * np.pi * Height_1_Plus) / WindowHeight) - np.sin((n_grid_pn * np.pi * Height_1_Minus) / WindowHeight)
+        J1_pn_mat = ((4 * J_1) / (p_grid_pn * n_grid_pn * np.pi**2)) * term_p1 * term_n1
+        term_p2 = np.sin((p_grid_pn * np.pi * Width_2_Plus) / WindowWidth) - np.sin((p_grid_pn * np.pi * Width_2_Minus) / WindowWidth)
+        term_n2 = np.sin((n_grid_pn * np.pi * Height_2_Plus) / WindowHeight) - np.sin((n_grid_pn * np.pi * Height_2_Minus) / WindowHeight)
+        J2_pn_mat = ((4 * J_2) / (p_grid_pn * n_grid_pn * np.pi**2)) * term_p2 * term_n2
+        J_pn_mat = J1_pn_mat + J2_pn_mat
+        checkpoint('J', J_pn_mat)
+
+        # --- 2. Cálculo de sum_m0 ---
+        m = m_range[:, np.newaxis]
+        p = m_range[np.newaxis, :]
+        A_m0 = (mu_0 * J_m0_vals) / (((m_range * np.pi) / WindowWidth)**2)
+        J_til_m0 = (DiameterCentralLeg / WindowWidth + 1) * J_m0_vals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coeff_mp = (8 / np.pi**2) * (1 / (2 * p**2) - (m**2 + p**2) / ((m**2 - p**2)**2))
+        mask = (m + p) % 2 == 1
+        J_til_m0_temp = np.sum(np.where(mask, coeff_mp * J_m0_vals, 0), axis=1)
+        sum_m0 = np.sum(A_m0 * (J_til_m0 + J_til_m0_temp))
+        checkpoint('m0', coeff_mp)
+
+        # --- 3. Cálculo de sum_0n ---
+        n = n_short_range[:, np.newaxis]
+        A_0n = (mu_0 * J_0n_vals) / (((n_short_range * np.pi) / WindowHeight)**2)
+        J_til_0n = (DiameterCentralLeg / WindowWidth + 1) * J_0n_vals
+        den_pn = p**2 * WindowHeight**2 + n**2 * WindowWidth**2
+        coeff_pn = (8 / np.pi**2) * (WindowHeight**2 / den_pn - (1 / p**2) * (1 + (n**2 * WindowWidth**2) / den_pn))
+        J_pn_slice_0n = J_pn_mat[:, :N-1]
+        mask_p_odd = p % 2 == 1
+        J_til_0n_temp = 0.5 * np.sum(np.where(mask_p_odd, coeff_pn * J_pn_slice_0n.T, 0), axis=1)
+        sum_0n = np.sum(A_0n * (J_til_0n + J_til_0n_temp))
+        checkpoint('0n', coeff_pn)
+
+        # --- 4. Cálculo de sum_mn (CORRIGIDO) ---
+        m_3d = m_range[:, np.newaxis, np.newaxis]      # Shape: (M-1, 1, 1)
+        n_3d = n_short_range[np.newaxis, :, np.newaxis] # Shape: (1, N-1, 1)
+        p_3d = m_range[np.newaxis, np.newaxis, :]      # Shape: (1, 1, M-1)
+
+        J_mn_mat = J_pn_mat[:, :N-1] # Esta é a matriz J(m,n) com shape (M-1, N-1)
+        A_mn = (mu_0 * J_mn_mat) / (((m_range[:, np.newaxis] * np.pi) / WindowWidth)**2 + ((n_short_range[np.newaxis, :] * np.pi) / WindowHeight)**2)
+        J_til_mn = (DiameterCentralLeg / WindowWidth + 1) * J_mn_mat
+        
+        # Preparar J(p,n) para broadcast no espaço (m,n,p)
+        J_pn_for_mn_sum = J_pn_mat[:, :N-1] # Shape (p, n) -> (M-1, N-1)
+        # Transpor para (n,p) e adicionar eixo 'm' para obter (1, N-1, M-1)
+        J_pn_broadcastable = J_pn_for_mn_sum.T[np.newaxis, :, :]
+
+        if MemoryBudget is None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                den_p_n_3d = p_3d**2 * WindowHeight**2 + n_3d**2 * WindowWidth**2
+                term1 = 0.5 * (WindowHeight**2 / den_p_n_3d)
+                term2 = -(m_3d**2 + p_3d**2) / (m_3d**2 - p_3d**2)**2
+                coeff_mnp = (8 / np.pi**2) * (term1 + term2)
+            
+            mask_3d = (m_3d + p_3d) % 2 == 1
+            
+            # Multiplicar e somar sobre o eixo 'p' (axis=2)
+            J_til_mn_temp_mat = np.sum(np.where(mask_3d, coeff_mnp * J_pn_broadcastable, 0), axis=2)
+        else:
+            J_til_mn_temp_mat = LeakageInductanceCalculator._ChunkedSum_mnp(m_range, n_short_range, J_pn_for_mn_sum,
+                                                                            WindowWidth, WindowHeight, MemoryBudget)
+        sum_mn = np.sum(A_mn * (J_til_mn + J_til_mn_temp_mat))
+        checkpoint('mn', A_mn, J_til_mn_temp_mat)
+
+        # --- 5. Resultado Final ---
+        Leakage_pua_IW = ((WindowHeight * (WindowWidth**2)) / (4 * I_ref**2)) * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        if ReturnStages:
+            # Contribution of each stage, in the same units as the result
+            scale = (WindowHeight * (WindowWidth**2)) / (4 * I_ref**2)
+            return Leakage_pua_IW, (scale * sum_m0, scale * sum_0n, scale * 0.5 * sum_mn)
+
+        return Leakage_pua_IW
+    
+    @staticmethod
+    @profiled('pua_OW')
+    def Leakage_pua_OW(M, N, I_ref, WindowWidth, WindowHeight, DiameterCentralLeg,
+                                    NumberOfTurns_1, I_1, Width_1, Height_1, NumberOfTurns_2, I_2, Width_2, Height_2,
+                                    Height_1_Minus, Height_1_Plus, Height_2_Minus, Height_2_Plus,
+                                    Width_1_Minus, Width_1_Plus, Width_2_Minus, Width_2_Plus,
+                                    MemoryBudget=None, ReturnStages=False, Method='factorized'):
+
+        mu_0 = 4 * np.pi * 1e-7
+        J_1 = (NumberOfTurns_1 * I_1) / (Width_1 * Height_1)
+        J_2 = (NumberOfTurns_2 * I_2) / (Width_2 * Height_2)
+
+        if Method == 'open':
+            # Closed-form open-boundary model (M and N are not used)
+            return OpenBoundaryLeakageEngine.Leakage_pua(I_ref, DiameterCentralLeg, [J_1, J_2],
+                                                         [(Width_1_Minus, Width_1_Plus, Height_1_Minus, Height_1_Plus),
+                                                          (Width_2_Minus, Width_2_Plus, Height_2_Minus, Height_2_Plus)])
+
+        if Method == 'factorized':
+            w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+            return FactorizedLeakageEngine.Leakage_pua(M, N, I_ref, w_w_inf, h_w_inf, DiameterCentralLeg, [J_1, J_2],
+                                                       [(Width_1_Minus, Width_1_Plus, Height_1_Minus + shift, Height_1_Plus + shift),
+                                                        (Width_2_Minus, Width_2_Plus, Height_2_Minus + shift, Height_2_Plus + shift)],
+                                                       ReturnStages, MemoryBudget=MemoryBudget)
+
+        # Dense reference path
+        # --- Parâmetros da "Janela Infinita" ---
+        w_w_inf = WindowWidth * 10
+        h_w_inf = WindowHeight * 10
+        h_1_minus_inf = Height_1_Minus + (h_w_inf / 2 - WindowHeight / 2)
+        h_1_plus_inf = Height_1_Plus + (h_w_inf / 2 - WindowHeight / 2)
+        h_2_minus_inf = Height_2_Minus + (h_w_inf / 2 - WindowHeight / 2)
+        h_2_plus_inf = Height_2_Plus + (h_w_inf / 2 - WindowHeight / 2)
+
+        # --- 1. Pré-cálculo dos termos J ---
+        m_range = np.arange(1, M, dtype=np.float64)
+        n_range = np.arange(1, N + 1, dtype=np.float64)
+        n_short_range = np.arange(1, N, dtype=np.float64)
+
+        J1_m0 = ((2 * J_1) / (m_range * h_w_inf * np.pi)) * (np.sin((m_range * np.pi * Width_1_Plus) / w_w_inf) - np.sin((m_range * np.pi * Width_1_Minus) / w_w_inf)) * (h_1_plus_inf - h_1_minus_inf)
+        J2_m0 = ((2 * J_2) / (m_range * h_w_inf * np.pi)) * (np.sin((m_range * np.pi * Width_2_Plus) / w_w_inf) - np.sin((m_range * np.pi * Width_2_Minus) / w_w_inf)) * (h_2_plus_inf - h_2_minus_inf)
+        J_m0_vals = J1_m0 + J2_m0
+
+        J1_0n = ((2 * J_1) / (n_short_range * w_w_inf * np.pi)) * (np.sin((n_short_range * np.pi * h_1_plus_inf) / h_w_inf) - np.sin((n_short_range * np.pi * h_1_minus_inf) / h_w_inf)) * (Width_1_Plus - Width_1_Minus)
+        J2_0n = ((2 * J_2) / (n_short_range * w_w_inf * np.pi)) * (np.sin((n_short_range * np.pi * h_2_plus_inf) / h_w_inf) - np.sin((n_short_range * np.pi * h_2_minus_inf) / h_w_inf)) * (Width_2_Plus - Width_2_Minus)
+        J_0n_vals = J1_0n + J2_0n
+
+        p_grid_pn = m_range[:, np.newaxis]
+        n_grid_pn = n_range[np.newaxis, :]
+        term_p1 = np.sin((p_grid_pn * np.pi * Width_1_Plus) / w_w_inf) - np.sin((p_grid_pn * np.pi * Width_1_Minus) / w_w_inf)
+        term_n1 = np.sin((n_grid_pn * np.pi * h_1_plus_inf) / h_w_inf) - np.sin((n_grid_pn * np.pi * h_1_minus_inf) / h_w_inf)
+        J1_pn_mat = ((4 * J_1) / (p_grid_pn * n_grid_pn * np.pi**2)) * term_p1 * term_n1
+        term_p2 = np.sin((p_grid_pn * np.pi * Width_2_Plus) / w_w_inf) - np.sin((p_grid_pn * np.pi * Width_2_Minus) / w_w_inf)
+        term_n2 = np.sin((n_grid_pn * np.pi * h_2_plus_inf) / h_w_inf) - np.sin((n_grid_pn * np.pi * h_2_minus_inf) / h_w_inf)
+        J2_pn_mat = ((4 * J_2) / (p_grid_pn * n_grid_pn * np.pi**2)) * term_p2 * term_n2
+        J_pn_mat = J1_pn_mat + J2_pn_mat
+        checkpoint('J', J_pn_mat)
+
+        # --- 2. Cálculo de sum_m0 ---
+        m = m_range[:, np.newaxis]
+        p = m_range[np.newaxis, :]
+        A_m0 = (mu_0 * J_m0_vals) / (((m_range * np.pi) / w_w_inf)**2)
+        J_til_m0 = (DiameterCentralLeg / w_w_inf + 1) * J_m0_vals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coeff_mp = (8 / np.pi**2) * (1 / (2 * p**2) - (m**2 + p**2) / ((m**2 - p**2)**2))
+        mask = (m + p) % 2 == 1
+        J_til_m0_temp = np.sum(np.where(mask, coeff_mp * J_m0_vals, 0), axis=1)
+        sum_m0 = np.sum(A_m0 * (J_til_m0 + J_til_m0_temp))
+        checkpoint('m0', coeff_mp)
+
+        # --- 3. Cálculo de sum_0n ---
+        n = n_short_range[:, np.newaxis]
+        A_0n = (mu_0 * J_0n_vals) / (((n_short_range * np.pi) / h_w_inf)**2)
+        J_til_0n = (DiameterCentralLeg / w_w_inf + 1) * J_0n_vals
+        den_pn = p**2 * h_w_inf**2 + n**2 * w_w_inf**2
+        coeff_pn = (8 / np.pi**2) * (h_w_inf**2 / den_pn - (1 / p**2) * (1 + (n**2 * w_w_inf**2) / den_pn))
+        J_pn_slice_0n = J_pn_mat[:, :N-1]
+        mask_p_odd = p % 2 == 1
+        J_til_0n_temp = 0.5 * np.sum(np.where(mask_p_odd, coeff_pn * J_pn_slice_0n.T, 0), axis=1)
+        sum_0n = np.sum(A_0n * (J_til_0n + J_til_0n_temp))
+        checkpoint('0n', coeff_pn)
+
+        # --- 4. Cálculo de sum_mn ---
+        m_3d = m_range[:, np.newaxis, np.newaxis]
+        n_3d = n_short_range[np.newaxis, :, np.newaxis]
+        p_3d = m_range[np.newaxis, np.newaxis, :]
+
+        J_mn_mat = J_pn_mat[:, :N-1]
+        A_mn = (mu_0 * J_mn_mat) / (((m_range[:, np.newaxis] * np.pi) / w_w_inf)**2 + ((n_short_range[np.newaxis, :] * np.pi) / h_w_inf)**2)
+        J_til_mn = (DiameterCentralLeg / w_w_inf + 1) * J_mn_mat
+        
+        J_pn_for_mn_sum = J_pn_mat[:, :N-1]
+        J_pn_broadcastable = J_pn_for_mn_sum.T[np.newaxis, :, :]
+
+        if MemoryBudget is None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                den_p_n_3d = p_3d**2 * h_w_inf**2 + n_3d**2 * w_w_inf**2
+                term1 = 0.5 * (h_w_inf**2 / den_p_n_3d)
+                term2 = -(m_3d**2 + p_3d**2) / (m_3d**2 - p_3d**2)**2
+                coeff_mnp = (8 / np.pi**2) * (term1 + term2)
+            
+            mask_3d = (m_3d + p_3d) % 2 == 1
+            J_til_mn_temp_mat = np.sum(np.where(mask_3d, coeff_mnp * J_pn_broadcastable, 0), axis=2)
+        else:
+            J_til_mn_temp_mat = LeakageInductanceCalculator._ChunkedSum_mnp(m_range, n_short_range, J_pn_for_mn_sum,
+                                                                            w_w_inf, h_w_inf, MemoryBudget)
+        sum_mn = np.sum(A_mn * (J_til_mn + J_til_mn_temp_mat))
+        checkpoint('mn', A_mn, J_til_mn_temp_mat)
+
+        # --- 5. Resultado Final ---
+        Leakage_pua_OW = ((h_w_inf * (w_w_inf**2)) / (4 * I_ref**2)) * (sum_m0 + sum_0n + 0.5 * sum_mn)
+
+        if ReturnStages:
+            # Contribution of each stage, in the same units as the result
+            scale = (h_w_inf * (w_w_inf**2)) / (4 * I_ref**2)
+            return Leakage_pua_OW, (scale * sum_m0, scale * sum_0n, scale * 0.5 * sum_mn)
+
+        return Leakage_pua_OW
+
+    @staticmethod
+    def _ChunkedSum_mnp(m_range, n_short_range, J_pn, WindowWidth, WindowHeight, MemoryBudget):
+        """
+        Blocked evaluation of sum_p coeff(m, n, p) * J(p, n) for the sum_mn stage of Leakage_pua_IW/OW.
+        Only the (m + p) odd entries are visited: rows of one m parity are paired with the p columns of the other parity,
+        and the rows are processed in blocks sized so that the temporaries of each block stay within MemoryBudget bytes.
+        """
+        J_til_mn_temp_mat = np.zeros((m_range.size, n_short_range.size))
+        n_2d = n_short_range[:, np.newaxis]
+
+        for parity in (0, 1):
+            m_rows = np.flatnonzero(m_range % 2 == parity)
+            p_cols = np.flatnonzero(m_range % 2 != parity)
+            if m_rows.size == 0 or p_cols.size == 0:
+                continue
+
+            p_vals = m_range[p_cols]
+            J_np = J_pn[p_cols, :].T # Shape (N-1, P)
+            term1 = 0.5 * (WindowHeight**2 / (p_vals**2 * WindowHeight**2 + n_2d**2 * WindowWidth**2)) # Does not depend on m
+
+            # Each block row holds the coefficient tensor and one temporary of shape (N-1, P)
+            bytes_per_row = 2 * J_np.size * J_np.itemsize
+            rows_per_block = max(1, int((MemoryBudget - 2 * term1.nbytes) // bytes_per_row))
+
+            for start in range(0, m_rows.size, rows_per_block):
+                rows = m_rows[start:start + rows_per_block]
+                m_vals = m_range[rows][:, np.newaxis, np.newaxis]
+                term2 = -(m_vals**2 + p_vals**2) / (m_vals**2 - p_vals**2)**2
+                coeff_mnp = (8 / np.pi**2) * (term1 + term2)
+                J_til_mn_temp_mat[rows] = np.einsum('mnp,np->mn', coeff_mnp, J_np)
+
+        return J_til_mn_temp_mat
+
+    @staticmethod
+    def _AdaptiveSeries(Kernel, args, kwargs, Tolerance, StartHarmonics, MaxHarmonics):
+        """
+        Doubles M = N from StartHarmonics until the sum_m0, sum_0n and sum_mn contributions settle within Tolerance
+        (relative to the total) or MaxHarmonics is reached. Returns the extrapolated value, the harmonic count used and the error estimate.
+        """
+        history = []
+        Harmonics = StartHarmonics
+
+        while True:
+            _, stages = Kernel(Harmonics, Harmonics, *args, ReturnStages=True, **kwargs)
+            history.append(np.array(stages))
+
+            Value, Error = LeakageInductanceCalculator._ExtrapolateStages(history)
+            if (len(history) >= 2 and Error <= Tolerance * abs(Value)) or 2 * Harmonics > MaxHarmonics:
+                return Value, Harmonics, Error
+
+            Harmonics *= 2
+
+    @staticmethod
+    def _ExtrapolateStages(history):
+        """
+        Aitken delta-squared extrapolation of the last three partial sums of each stage. The truncation error of a rectangular
+        block series decays as a power of the harmonic count, so with a doubling sequence the tail is close to geometric.
+        Stages whose increments are not monotonically shrinking keep the last partial sum and report the last increment as error.
+        """
+        if len(history) == 1:
+            return np.sum(history[-1]), np.inf
+        if len(history) == 2:
+            return np.sum(history[-1]), np.sum(np.abs(history[-1] - history[-2]))
+
+        x0, x1, x2 = history[-3:]
+        d1, d2 = x1 - x0, x2 - x1
+        accelerate = (d1 * d2 > 0) & (np.abs(d2) < np.abs(d1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            extrapolated = np.where(accelerate, x2 - d2**2 / (d2 - d1), x2)
+
+        error = np.where(accelerate, np.abs(extrapolated - x2), np.abs(d2))
+
+        return np.sum(extrapolated), np.sum(error)
+
+    def _Series(self, Name, Harmonics, *args, **kwargs):
+        """
+        Evaluates the Leakage_<Name> series with the fixed harmonic count or, when a tolerance is set, with adaptive truncation.
+        The harmonic count and the error estimate used are recorded under Name.
+        """
+        Kernel = getattr(self, 'Leakage_' + Name)
+
+        if kwargs.get('Method') == 'open':
+            self.HarmonicCounts[Name] = (0, 0)
+            self.ErrorEstimates[Name] = 0.0
+            return Kernel(0, 0, *args, **kwargs)
+
+        if self.Tolerance is None:
+            self.HarmonicCounts[Name] = (Harmonics, Harmonics)
+            return Kernel(Harmonics, Harmonics, *args, **kwargs)
+
+        # Large harmonic counts are only reached here, so the dense p.u.a. triple sum is always evaluated in blocks
+        if kwargs.get('MemoryBudget', 0) is None:
+            kwargs['MemoryBudget'] = 64 * 2**20
+
+        # The fixed counts are already converged for typical designs, so the search starts well below them
+        Value, Used, Error = self._AdaptiveSeries(Kernel, args, kwargs, self.Tolerance, max(4, Harmonics // 4), self.MaxHarmonics)
+        self.HarmonicCounts[Name] = (Used, Used)
+        self.ErrorEstimates[Name] = Error
+
+        return Value
+
+
+
+    def _LeakageGradient(self, SelectedCore, ReferredWinding, WindowWidth, WindowHeight, NumberOfTurns_1, NumberOfTurns_2):
+        """
+        Leakage inductance with its gradient (self.Gradient) with respect to every block bound and turn count, in the same
+        pass as the value (FactorizedLeakageEngine.Leakage_pu*_Gradient, fixed harmonic counts). The series gradients
+        with respect to the current densities are then chained through J = N I / (width height) and the excitation.
+        """
+        Bounds = np.array([(self.Width_1_Minus, self.Width_1_Plus, self.Height_1_Minus, self.Height_1_Plus),
+                           (self.Width_2_Minus, self.Width_2_Plus, self.Height_2_Minus, self.Height_2_Plus)], dtype=np.float64)
+        widths, heights = Bounds[:, 1] - Bounds[:, 0], Bounds[:, 3] - Bounds[:, 2]
+        areas = np.array([self.Width_1 * self.Height_1, self.Width_2 * self.Height_2], dtype=np.float64)
+        J = np.array([NumberOfTurns_1 * self.I_1, NumberOfTurns_2 * self.I_2], dtype=np.float64) / areas
+
+        w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+        Bounds_OW = Bounds + np.array([0, 0, shift, shift])
+
+        def pul(Harmonics, Window, Bounds):
+            self.HarmonicCounts['pul_IW' if Harmonics == 30 else 'pul_OW'] = (Harmonics, Harmonics)
+            return FactorizedLeakageEngine.Leakage_pul_Gradient(Harmonics, Harmonics, self.I_ref, *Window, J, Bounds)
+
+        def pua(Harmonics, Window, Bounds, DiameterCentralLeg):
+            self.HarmonicCounts['pua_IW' if Harmonics == 30 else 'pua_OW'] = (Harmonics, Harmonics)
+            return FactorizedLeakageEngine.Leakage_pua_Gradient(Harmonics, Harmonics, self.I_ref, *Window, DiameterCentralLeg, J, Bounds)
+
+        # Core-Specific Leakage Expressions (weights of each series, as in _LeakageScaler)
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+        windows = {'IW': (30, (WindowWidth, WindowHeight), Bounds), 'OW': (150, (w_w_inf, h_w_inf), Bounds_OW)}
+        series = [(weight, pul(*windows[name[-2:]]) if name.startswith('pul') else pua(*windows[name[-2:]], DiameterCentralLeg))
+                  for name, weight in Weights.items()]
+
+        LeakageInductance = sum(weight * value for weight, (value, _, _) in series)
+        d_J = sum(weight * d_J for weight, (_, d_J, _) in series)
+        d_Bounds = sum(weight * d_Bounds for weight, (_, _, d_Bounds) in series)
+
+        # J = N I / (width height): dJ/dWidth_Plus = -J / width, dJ/dWidth_Minus = J / width (and likewise for the heights)
+        d_Bounds += (d_J * J)[:, np.newaxis] * np.stack((1 / widths, -1 / widths, 1 / heights, -1 / heights), axis=-1)
+
+        # Ampere-turns N I of each winding as a function of the turn counts (the referred winding carries I_ref)
+        match ReferredWinding:
+            case "Primary":
+                d_AmpereTurns = {'NumberOfTurns_1': (1, -1), 'NumberOfTurns_2': (0, 0)}
+            case "Secondary":
+                d_AmpereTurns = {'NumberOfTurns_1': (0, 0), 'NumberOfTurns_2': (-1, 1)}
+
+        self.Gradient = {name: float(d_Bounds[block, index])
+                         for block, names in enumerate(self.GRADIENT_BOUNDS) for index, name in enumerate(names)}
+        self.Gradient.update({name: float((d_J / areas) @ np.array(value, dtype=np.float64)) for name, value in d_AmpereTurns.items()})
+
+        return LeakageInductance
+
+
+
+    @profiled('leakage')
+    def _LeakageScaler(self,
+                 SelectedCore, 
+                 ReferredWinding,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns_1, NumberOfTurns_2,
+                 MemoryBudget=None, Tolerance=None, MaxHarmonics=640, Method='factorized', OutsideWindow='series', Gradient=False,
+                 Surrogate=None):
+        
+        if Gradient and (Tolerance is not None or OutsideWindow == 'open'):
+            raise ValueError("Gradients are only available with the fixed harmonic counts and the series outside-window model")
+        if Surrogate is not None and (Gradient or Tolerance is not None or OutsideWindow == 'open'):
+            raise ValueError("The surrogate only tabulates the fixed harmonic counts and the series outside-window model")
+
+        # Harmonic truncation settings and the counts/error estimates reported with the result
+        self.Tolerance = Tolerance
+        self.MaxHarmonics = MaxHarmonics
+        self.HarmonicCounts = {}
+        self.ErrorEstimates = {}
+        self.ErrorEstimate = None
+
+        # Outside-window model: the "infinite window" series or the closed-form open boundary (OpenBoundaryLeakageEngine)
+        MethodOW = 'open' if OutsideWindow == 'open' else Method
+
+        # Defines the primary and secondary windings current excitation according to the chosen reference of measurement/calculation
+        match ReferredWinding:
+
+            case "Primary":
+                self.I_ref = 1
+                self.I_1 = 1
+                self.I_2 = -NumberOfTurns_1/NumberOfTurns_2
+                
+            case "Secondary":
+                self.I_ref = 1
+                self.I_2 = 1
+                self.I_1 = -NumberOfTurns_2/NumberOfTurns_1
+
+        
+
+        self.Gradient = None
+        if Gradient:
+            self.LeakageInductance = self._LeakageGradient(SelectedCore, ReferredWinding, WindowWidth, WindowHeight,
+                                                           NumberOfTurns_1, NumberOfTurns_2)
+            return self.LeakageInductance
+
+        # Surrogate table: ErrorEstimate is its sampled error estimate (not a guaranteed bound); designs it does not cover use the series below
+        if Surrogate is not None:
+            Result = Surrogate.query(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, EquivalentWindingsBlocks,
+                                     NumberOfTurns_1, NumberOfTurns_2, Fallback=False)
+            if Result['InDomain'][0]:
+                self.LeakageInductance = float(Result['LeakageInductance'][0])
+                self.ErrorEstimate = float(Result['ErrorEstimate'][0]) * self.LeakageInductance
+                return self.LeakageInductance
+    
+
+        # Core-Specific Leakage Expressions: weighted sum of the 2D series
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+        Windings = (NumberOfTurns_1, self.I_1, self.Width_1, self.Height_1, NumberOfTurns_2, self.I_2, self.Width_2, self.Height_2,
+                    self.Height_1_Minus, self.Height_1_Plus, self.Height_2_Minus, self.Height_2_Plus,
+                    self.Width_1_Minus, self.Width_1_Plus, self.Width_2_Minus, self.Width_2_Plus)
+        series = {'pul_IW': lambda: self._Series('pul_IW', 30, self.I_ref, WindowWidth, WindowHeight, *Windings, Method=Method),
+                  'pul_OW': lambda: self._Series('pul_OW', 150, self.I_ref, WindowWidth, WindowHeight, *Windings, Method=MethodOW),
+                  'pua_IW': lambda: self._Series('pua_IW', 30, self.I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *Windings,
+                                                 MemoryBudget=MemoryBudget, Method=Method),
+                  'pua_OW': lambda: self._Series('pua_OW', 150, self.I_ref, WindowWidth, WindowHeight, DiameterCentralLeg, *Windings,
+                                                 MemoryBudget=MemoryBudget, Method=MethodOW)}
+
+        LeakageInductance = sum(series[name]()*weight for name, weight in Weights.items())
+
+        if Tolerance is not None:
+            self.ErrorEstimate = sum(self.ErrorEstimates[name]*weight for name, weight in Weights.items())
+
+
+        self.LeakageInductance = LeakageInductance
+
+        return LeakageInductance
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
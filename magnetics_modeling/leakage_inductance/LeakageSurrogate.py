@@ -0,0 +1,418 @@
+"""
+Precomputed surrogate of the leakage inductance series for screening large numbers of designs.
+
+    python -m magnetics_modeling.leakage_inductance.LeakageSurrogate surrogate_table --tolerance 0.05
+
+builds the table offline; LeakageSurrogate(Path).query(...) then evaluates whole batches of designs in microseconds
+each, with a relative error estimate per design and the exact series for the designs the table does not cover.
+"""
+import os
+import sys
+import json
+import argparse
+import itertools
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions import versioned_directory
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_series_weights
+from magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator import BatchLeakageInductanceCalculator
+
+
+# Normalized features of a design (x over WindowWidth, y over WindowHeight) for each block arrangement WindingMaker
+# produces: 'Normal' bobbins put the secondary beside the primary, 'Split' bobbins above it. The gap between the blocks
+# is a feature, so every box of features holds non-overlapping blocks, and so are the offsets between the block ends
+# that line up across the gap: the series bends sharply where two ends are aligned, so no leaf straddles an alignment.
+FEATURES = {'Normal': ('Width_1_Minus', 'Width_1', 'Gap_x', 'Width_2', 'Height_1_Minus', 'Height_1', 'Offset_y_Minus', 'Offset_y_Plus', 'AspectRatio'),
+            'Split': ('Width_1_Minus', 'Width_1', 'Offset_x_Minus', 'Offset_x_Plus', 'Height_1_Minus', 'Height_1', 'Gap_y', 'Height_2', 'AspectRatio')}
+ALIGNMENTS = {'Normal': (6, 7), 'Split': (2, 3)}
+TOPOLOGIES = tuple(FEATURES)
+# The domains cover the blocks WindingMaker builds on bobbins of the catalog cores (ETD and EFD window aspect ratios)
+DOMAINS = {'Normal': ((0.0, 0.05, 0.0, 0.05, 0.0, 0.7, -0.1, -0.1, 3.0),
+                      (0.3, 0.6, 0.3, 0.6, 0.15, 1.0, 0.1, 0.1, 6.0)),
+           'Split': ((0.0, 0.3, -0.2, -0.2, 0.0, 0.05, 0.0, 0.05, 3.0),
+                     (0.3, 0.95, 0.2, 0.2, 0.15, 0.9, 0.3, 0.9, 6.0))}
+# Smallest normalized width and height of a block in the domain
+MIN_SIZE = 0.03
+
+# Tabulated series per unit of ampere-turns squared (I_ref = 1, balanced windings), with WindowWidth = 1. The p.u.a.
+# series are linear in the central leg diameter D, so they are stored at D = 0 plus their slope in D ('_D'):
+#   pul(W, H) = pul,  pua(W, H, D) = W * pua + D * pua_D
+OUTPUTS = ('pul_IW', 'pul_OW', 'pua_IW', 'pua_OW', 'pua_IW_D', 'pua_OW_D')
+FAMILY_OUTPUTS = {'ETD': ('pua_IW', 'pua_OW', 'pua_IW_D', 'pua_OW_D'),
+                  'EFD': ('pul_IW', 'pul_OW', 'pua_IW', 'pua_OW')}
+
+# Aspect ratios are sampled on this lattice so the samples of a leaf share a few harmonic grids
+ASPECT_STEP = 0.05
+
+
+class LeakageSurrogate:
+    """
+    Piecewise polynomial surrogate of the fixed-harmonic series of LeakageInductanceCalculator (Method='factorized',
+    OutsideWindow='series').
+
+    Every block arrangement is a box of normalized features (DOMAINS) split into a k-d tree of leaves; each leaf holds a
+    Chebyshev polynomial of total degree Degree fitted to the logarithm of every tabulated series (OUTPUTS), and the
+    relative error estimate of each series, SafetyFactor times the largest error on held-out samples of the leaf (inside
+    it and on its faces, where polynomial fits are worst). Leaves
+    are split until their estimates are within Tolerance (or MaxDepth is reached). The leakage inductance is a positive
+    combination of these series, so its relative error follows the largest estimate of the series it uses. The
+    estimates are sampled, not guaranteed: a few designs between the samples of a leaf can exceed them.
+
+    The table is a directory of .npy files, memory-mapped when opened. Designs outside the domain, or in a leaf whose
+    estimate exceeds the tolerance, are evaluated with the exact series (BatchLeakageInductanceCalculator).
+    """
+    def __init__(self, Path):
+
+        version = versioned_directory.current(Path)
+        with open(os.path.join(version, 'manifest.json')) as file:
+            self.Manifest = json.load(file)
+
+        self.Path = Path
+        self.Tolerance = self.Manifest['tolerance']
+        self.Arrays = {name: np.load(os.path.join(version, f'{name}.npy'), mmap_mode='r')
+                       for name in ('exponents', 'split_dim', 'split_value', 'children', 'leaf', 'lower', 'upper', 'coefficients', 'bounds')}
+        self.Exponents = np.asarray(self.Arrays['exponents'])
+
+    # Features and basis
+    @staticmethod
+    def _Features(Topology, Bounds, AspectRatio):
+        # Bounds: (B, 8) normalized (Width_1_Minus, Width_1_Plus, Height_1_Minus, Height_1_Plus, same for block 2)
+        x1m, x1p, y1m, y1p, x2m, x2p, y2m, y2p = Bounds.T
+        match Topology:
+            case 'Normal':
+                return np.column_stack((x1m, x1p - x1m, x2m - x1p, x2p - x2m, y1m, y1p - y1m, y2m - y1m, y2p - y1p, AspectRatio))
+            case 'Split':
+                return np.column_stack((x1m, x1p - x1m, x2m - x1m, x2p - x1p, y1m, y1p - y1m, y2m - y1p, y2p - y2m, AspectRatio))
+
+    @staticmethod
+    def _Bounds(Topology, Features):
+        # Inverse of _Features
+        match Topology:
+            case 'Normal':
+                x1m, w1, gap, w2, y1m, h1, offset_minus, offset_plus, _ = Features.T
+                x2m = x1m + w1 + gap
+                return np.column_stack((x1m, x1m + w1, y1m, y1m + h1, x2m, x2m + w2, y1m + offset_minus, y1m + h1 + offset_plus))
+            case 'Split':
+                x1m, w1, offset_minus, offset_plus, y1m, h1, gap, h2, _ = Features.T
+                y2m = y1m + h1 + gap
+                return np.column_stack((x1m, x1m + w1, y1m, y1m + h1, x1m + offset_minus, x1m + w1 + offset_plus, y2m, y2m + h2))
+
+    @staticmethod
+    def _Valid(Bounds):
+        # Both blocks inside the window and at least MIN_SIZE wide and high
+        sizes = Bounds[:, 1::2] - Bounds[:, 0::2]
+        return (Bounds >= 0).all(axis=1) & (Bounds <= 1).all(axis=1) & (sizes >= MIN_SIZE).all(axis=1)
+
+    @staticmethod
+    def _Basis(Z, Exponents):
+        # Products of Chebyshev polynomials T_k(z_j) of Z in [-1, 1], one column per row of Exponents
+        degree = int(Exponents.max())
+        T = np.empty((degree + 1,) + Z.shape)
+        T[0] = 1
+        if degree:
+            T[1] = Z
+        for k in range(2, degree + 1):
+            T[k] = 2 * Z * T[k - 1] - T[k - 2]
+        basis = T[Exponents[:, 0], :, 0].T.copy()
+        for j in range(1, Z.shape[1]):
+            basis *= T[Exponents[:, j], :, j].T
+        return basis
+
+    @staticmethod
+    def _Local(Features, Lower, Upper):
+        return 2 * (Features - Lower) / (Upper - Lower) - 1
+
+    # Query
+    def _Leaves(self, Topology, Features):
+        # Leaf of every design, descending the tree of the arrangement
+        split_dim, split_value, children = self.Arrays['split_dim'], self.Arrays['split_value'], self.Arrays['children']
+        node = np.full(len(Features), self.Manifest['roots'][Topology], dtype=np.int64)
+        rows = np.arange(len(Features))
+        while True:
+            dim = split_dim[node]
+            internal = dim >= 0
+            if not internal.any():
+                break
+            right = Features[rows[internal], dim[internal]] >= split_value[node[internal]]
+            node[internal] = children[node[internal], right.astype(np.int64)]
+        return self.Arrays['leaf'][node]
+
+    def _Evaluate(self, Topology, Features, Outputs):
+        """
+        Tabulated series (B, len(Outputs)) and their relative error bounds (B,) for features inside the domain of Topology.
+        """
+        columns = [OUTPUTS.index(name) for name in Outputs]
+        leaves = self._Leaves(Topology, Features)
+        values = np.empty((len(Features), len(columns)))
+        bounds = np.asarray(self.Arrays['bounds'])[leaves][:, columns].max(axis=1)
+
+        order = np.argsort(leaves, kind='stable')
+        unique, starts = np.unique(leaves[order], return_index=True)
+        for leaf, rows in zip(unique, np.split(order, starts[1:])):
+            Z = self._Local(Features[rows], self.Arrays['lower'][leaf], self.Arrays['upper'][leaf])
+            values[rows] = np.exp(self._Basis(Z, self.Exponents) @ self.Arrays['coefficients'][leaf][:, columns])
+        return values, bounds
+
+    def query(self, SelectedCore, ReferredWinding, WindowWidth, WindowHeight, EquivalentWindingsBlocks,
+              NumberOfTurns_1, NumberOfTurns_2, Fallback=True, ChunkSize=65536):
+        """
+        Leakage inductance of a batch of designs sharing one core (arguments as in BatchLeakageInductanceCalculator).
+        Returns {'LeakageInductance', 'ErrorEstimate' (relative, 0 for exact results), 'InDomain'}; designs outside the
+        leaves within tolerance are evaluated with the exact series, or left as NaN when Fallback is False.
+        """
+        primary, secondary = EquivalentWindingsBlocks['primary'], EquivalentWindingsBlocks['secondary']
+        (NumberOfTurns_1, NumberOfTurns_2, x_1, y_1, w_1, h_1, x_2, y_2, w_2, h_2) = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (
+                NumberOfTurns_1, NumberOfTurns_2, primary['x'], primary['y'], primary['width'], primary['height'],
+                secondary['x'], secondary['y'], secondary['width'], secondary['height'])])
+
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+        Outputs = FAMILY_OUTPUTS[SelectedCore["family"]]
+        bounds = np.column_stack((x_1 / WindowWidth, (x_1 + w_1) / WindowWidth, y_1 / WindowHeight, (y_1 + h_1) / WindowHeight,
+                                  x_2 / WindowWidth, (x_2 + w_2) / WindowWidth, y_2 / WindowHeight, (y_2 + h_2) / WindowHeight))
+        AspectRatio = np.full(len(bounds), WindowHeight / WindowWidth)
+
+        LeakageInductance = np.full(len(bounds), np.nan)
+        ErrorEstimate = np.zeros(len(bounds))
+        InDomain = np.zeros(len(bounds), dtype=bool)
+
+        # Ampere-turns of the referred winding (the other winding balances it)
+        match ReferredWinding:
+            case "Primary":
+                AmpereTurns = NumberOfTurns_1
+            case "Secondary":
+                AmpereTurns = NumberOfTurns_2
+            case _:
+                raise ValueError(f"ReferredWinding must be 'Primary' or 'Secondary', not {ReferredWinding!r}")
+
+        # Core-Specific Leakage Expressions (same weighting as LeakageInductanceCalculator._LeakageScaler); the tabulated
+        # p.u.a. series are per unit window width, plus a part per unit central-leg diameter (_D) for cores that have one
+        def combine(series):
+            columns = dict(zip(Outputs, series.T))
+            return sum(weight * (columns[name] if name.startswith('pul')
+                                 else WindowWidth * columns[name] + DiameterCentralLeg * columns.get(name + '_D', 0))
+                       for name, weight in Weights.items())
+
+        assigned = np.zeros(len(bounds), dtype=bool)
+        inside = self._Valid(bounds)
+        for Topology in TOPOLOGIES:
+            lower, upper = (np.asarray(limits) for limits in self.Manifest['domains'][Topology])
+            features = self._Features(Topology, bounds, AspectRatio)
+            rows = np.flatnonzero(inside & ~assigned & ((features >= lower) & (features <= upper)).all(axis=1))
+            assigned[rows] = True
+            for start in range(0, len(rows), ChunkSize):
+                chunk = rows[start:start + ChunkSize]
+                series, error = self._Evaluate(Topology, features[chunk], Outputs)
+                accepted = error <= self.Tolerance
+                chunk, series, error = chunk[accepted], series[accepted], error[accepted]
+                LeakageInductance[chunk] = AmpereTurns[chunk]**2 * combine(series)
+                ErrorEstimate[chunk] = error
+                InDomain[chunk] = True
+
+        if Fallback and not InDomain.all():
+            exact = np.flatnonzero(~InDomain)
+            blocks = {winding: {'x': x[exact], 'y': y[exact], 'width': w[exact], 'height': h[exact]}
+                      for winding, (x, y, w, h) in (('primary', (x_1, y_1, w_1, h_1)), ('secondary', (x_2, y_2, w_2, h_2)))}
+            LeakageInductance[exact] = BatchLeakageInductanceCalculator(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, blocks,
+                                                                        NumberOfTurns_1[exact], NumberOfTurns_2[exact]).LeakageInductance
+
+        return {'LeakageInductance': LeakageInductance, 'ErrorEstimate': ErrorEstimate, 'InDomain': InDomain}
+
+    # Offline construction
+    @staticmethod
+    def _Exact(Topology, Features):
+        """
+        Exact OUTPUTS (B, 6) of normalized features whose aspect ratios lie on the ASPECT_STEP lattice.
+        """
+        bounds = LeakageSurrogate._Bounds(Topology, Features)
+        values = np.empty((len(Features), len(OUTPUTS)))
+        for AspectRatio in np.unique(Features[:, -1]):
+            rows = Features[:, -1] == AspectRatio
+            x1m, x1p, y1m, y1p, x2m, x2p, y2m, y2p = bounds[rows].T
+            y1m, y1p, y2m, y2p = (value * AspectRatio for value in (y1m, y1p, y2m, y2p))
+            ones = np.ones(len(x1m))
+            args = (ones, ones, x1p - x1m, y1p - y1m, ones, -ones, x2p - x2m, y2p - y2m,
+                    y1m, y1p, y2m, y2p, x1m, x1p, x2m, x2p)
+            batch = BatchLeakageInductanceCalculator
+            pua_IW, pua_OW = (batch.Leakage_pua_IW(30, 30, 1, 1.0, AspectRatio, 0.0, *args),
+                              batch.Leakage_pua_OW(150, 150, 1, 1.0, AspectRatio, 0.0, *args))
+            values[rows] = np.column_stack((batch.Leakage_pul_IW(30, 30, 1, 1.0, AspectRatio, *args),
+                                            batch.Leakage_pul_OW(150, 150, 1, 1.0, AspectRatio, *args),
+                                            pua_IW, pua_OW,
+                                            batch.Leakage_pua_IW(30, 30, 1, 1.0, AspectRatio, 1.0, *args) - pua_IW,
+                                            batch.Leakage_pua_OW(150, 150, 1, 1.0, AspectRatio, 1.0, *args) - pua_OW))
+        if not (values > 0).all():
+            raise ValueError("Non-positive series in the surrogate domain")
+        return values
+
+    @staticmethod
+    def _Draw(Rng, Topology, Lower, Upper, Count, Faces=False):
+        """
+        Uniform samples of the box with valid blocks (_Valid), aspect ratios snapped to the lattice. With Faces, every
+        feature is moved to the lower or upper face of the box with probability 1/4 each, so the samples also cover the
+        faces, edges and corners, where the fit errors peak.
+        """
+        samples, drawn = [], 0
+        while sum(map(len, samples)) < Count and drawn < 1000 * Count:
+            features = Rng.uniform(Lower, Upper, size=(4 * Count, len(Lower)))
+            if Faces:
+                face = Rng.integers(0, 4, size=features.shape)
+                features = np.where(face == 0, Lower, np.where(face == 1, Upper, features))
+            features[:, -1] = np.clip(np.round(features[:, -1] / ASPECT_STEP) * ASPECT_STEP, Lower[-1], Upper[-1])
+            samples.append(features[LeakageSurrogate._Valid(LeakageSurrogate._Bounds(Topology, features))])
+            drawn += 4 * Count
+        return np.concatenate(samples)[:Count]
+
+    @staticmethod
+    def _Fit(Features, LogValues, Lower, Upper, Exponents):
+        A = LeakageSurrogate._Basis(LeakageSurrogate._Local(Features, Lower, Upper), Exponents)
+        coefficients = np.linalg.lstsq(A, LogValues, rcond=None)[0]
+        return coefficients, np.abs(A @ coefficients - LogValues).max()
+
+    @staticmethod
+    def build(Path, Tolerance=0.05, Degree=3, SafetyFactor=2.0, MaxDepth=12, Seed=0, Domains=DOMAINS, Verbose=False):
+        """
+        Builds the table in Path, published atomically as a new version (see versioned_directory); Path must be absent,
+        empty or hold a previous table. Every leaf is fitted on 2 T samples and
+        validated on T fresh ones plus T on the faces of its box (T polynomial terms); the samples of a split leaf that
+        fall in a child are reused.
+        The cost is dominated by the exact outside-window series (about 0.3 ms per sample); leaves left above Tolerance at
+        MaxDepth are kept but fall back to the exact series in query().
+        """
+        if os.path.exists(Path) and os.listdir(Path):
+            try:
+                with open(os.path.join(versioned_directory.current(Path), 'manifest.json')) as file:
+                    previous = json.load(file)
+            except (OSError, ValueError):
+                previous = None
+            if not isinstance(previous, dict) or 'features' not in previous or 'outputs' not in previous:
+                raise FileExistsError(f"{Path} exists and does not hold a leakage surrogate table")
+
+        rng = np.random.default_rng(Seed)
+        dimensions = len(FEATURES[TOPOLOGIES[0]])
+        exponents = np.array([e for e in itertools.product(range(Degree + 1), repeat=dimensions) if sum(e) <= Degree],
+                             dtype=np.int64)
+        n_fit, n_validation = 2 * len(exponents), len(exponents)
+
+        nodes = {'split_dim': [], 'split_value': [], 'children': [], 'leaf': []}
+        leaves = {'lower': [], 'upper': [], 'coefficients': [], 'bounds': []}
+        roots = {}
+
+        def add_node():
+            for values in nodes.values():
+                values.append(None)
+            return len(nodes['leaf']) - 1
+
+        def add_leaf(node, lower, upper, coefficients, bounds):
+            nodes['split_dim'][node], nodes['split_value'][node] = -1, np.nan
+            nodes['children'][node], nodes['leaf'][node] = (-1, -1), len(leaves['lower'])
+            for name, value in (('lower', lower), ('upper', upper), ('coefficients', coefficients), ('bounds', bounds)):
+                leaves[name].append(value)
+
+        def halves(features, lower, upper, dim, middle):
+            upper_left, lower_right = upper.copy(), lower.copy()
+            upper_left[dim] = lower_right[dim] = middle
+            return (features[:, dim] < middle, lower, upper_left), (features[:, dim] >= middle, lower_right, upper)
+
+        for Topology in TOPOLOGIES:
+            lower, upper = (np.asarray(limits, dtype=np.float64) for limits in Domains[Topology])
+            roots[Topology] = add_node()
+            queue = [(roots[Topology], lower, upper, 0, np.empty((0, dimensions)), np.empty((0, len(OUTPUTS))))]
+            while queue:
+                node, lower, upper, depth, features, log_values = queue.pop(0)
+
+                # Boxes that straddle an alignment of the block ends are split there first
+                straddled = [dim for dim in ALIGNMENTS[Topology] if lower[dim] < 0 < upper[dim]]
+                if straddled:
+                    dim, middle = straddled[0], 0.0
+                else:
+                    # Fit samples (reused from the parent and topped up) and fresh validation samples, inside the box
+                    # and on its faces
+                    new = LeakageSurrogate._Draw(rng, Topology, lower, upper, max(n_fit - len(features), 0) + n_validation)
+                    if len(features) + len(new) < n_fit + n_validation:
+                        # (Almost) no valid blocks in this box
+                        add_leaf(node, lower, upper, np.zeros((len(exponents), len(OUTPUTS))), np.full(len(OUTPUTS), np.inf))
+                        continue
+                    new = np.concatenate((new, LeakageSurrogate._Draw(rng, Topology, lower, upper, n_validation, Faces=True)))
+                    features = np.concatenate((features, new))
+                    log_values = np.concatenate((log_values, np.log(LeakageSurrogate._Exact(Topology, new))))
+                    fit, validation = slice(0, n_fit), slice(n_fit, None)
+
+                    coefficients, _ = LeakageSurrogate._Fit(features[fit], log_values[fit], lower, upper, exponents)
+                    Z = LeakageSurrogate._Local(features[validation], lower, upper)
+                    error = np.abs(np.expm1(LeakageSurrogate._Basis(Z, exponents) @ coefficients - log_values[validation])).max(axis=0)
+                    bounds = SafetyFactor * error
+
+                    if bounds.max() <= Tolerance or depth >= MaxDepth:
+                        add_leaf(node, lower, upper, coefficients, bounds)
+                        if Verbose:
+                            print(f"{Topology} leaf {len(leaves['lower'])}: depth {depth}, estimate {bounds.max():.2e}", flush=True)
+                        continue
+
+                    # Split at the midpoint of the dimension whose halves are fitted best by the samples at hand (the
+                    # aspect ratio only while the halves still span a few lattice steps)
+                    def score(dim):
+                        if dim == dimensions - 1 and upper[dim] - lower[dim] < 8 * ASPECT_STEP:
+                            return np.inf
+                        worst = 0
+                        for side, low, high in halves(features, lower, upper, dim, (lower[dim] + upper[dim]) / 2):
+                            if side.sum() <= len(exponents):
+                                return np.inf
+                            worst = max(worst, LeakageSurrogate._Fit(features[side], log_values[side], low, high, exponents)[1])
+                        return worst
+                    dim = min(range(dimensions), key=score)
+                    middle = (lower[dim] + upper[dim]) / 2
+
+                children = add_node(), add_node()
+                nodes['split_dim'][node], nodes['split_value'][node] = dim, middle
+                nodes['children'][node], nodes['leaf'][node] = children, -1
+                for child, (side, low, high) in zip(children, halves(features, lower, upper, dim, middle)):
+                    queue.append((child, low, high, depth + 1, features[side][:n_fit], log_values[side][:n_fit]))
+
+        arrays = {'exponents': exponents,
+                  'split_dim': np.array(nodes['split_dim'], dtype=np.int64),
+                  'split_value': np.array(nodes['split_value'], dtype=np.float64),
+                  'children': np.array(nodes['children'], dtype=np.int64),
+                  'leaf': np.array(nodes['leaf'], dtype=np.int64),
+                  **{name: np.array(values, dtype=np.float64) for name, values in leaves.items()}}
+        within_tolerance = int((arrays['bounds'].max(axis=1) <= Tolerance).sum())
+        manifest = {'version': 2, 'features': FEATURES, 'outputs': OUTPUTS, 'harmonics': (30, 150),
+                    'domains': {name: [list(limits) for limits in Domains[name]] for name in TOPOLOGIES}, 'roots': roots,
+                    'degree': Degree, 'tolerance': Tolerance, 'safety_factor': SafetyFactor, 'max_depth': MaxDepth,
+                    'leaves': len(leaves['lower']), 'leaves_within_tolerance': within_tolerance}
+
+        version = versioned_directory.new_version(Path)
+        try:
+            for name, values in arrays.items():
+                np.save(os.path.join(version, f'{name}.npy'), values)
+            with open(os.path.join(version, 'manifest.json'), 'w') as file:
+                json.dump(manifest, file, indent=2)
+        except BaseException:
+            versioned_directory.discard(version)
+            raise
+        versioned_directory.publish(Path, version)
+
+        return LeakageSurrogate(Path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path', help="directory of the table (a previous table there is replaced)")
+    parser.add_argument('--tolerance', type=float, default=0.05, help="largest relative error estimate of a leaf used by query()")
+    parser.add_argument('--degree', type=int, default=3)
+    parser.add_argument('--safety-factor', type=float, default=2.0)
+    parser.add_argument('--max-depth', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        surrogate = LeakageSurrogate.build(args.path, args.tolerance, args.degree, args.safety_factor, args.max_depth, args.seed,
+                                           Verbose=True)
+    except FileExistsError as error:
+        parser.error(str(error))
+    print(f"{surrogate.Manifest['leaves_within_tolerance']} of {surrogate.Manifest['leaves']} leaves within {args.tolerance:g}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import numpy as np
+
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_series_weights
+
+class MultiWindingLeakageCalculator:
+    """
+    Leakage inductance of transformers with any number of winding blocks (multi-output flyback, interleaved P-S-P, ...).
+    The Fourier current coefficients of each block are computed once per window and every pairwise energy term is
+    assembled as a Gram-matrix contraction against the shared window weights, so the whole K x K matrix costs about
+    as much as one two-winding evaluation.
+
+    EquivalentWindingsBlocks maps each block name to its {'x', 'y', 'width', 'height'} dict (as returned by WindingMaker)
+    and NumberOfTurns maps the same names to the turns of each block. Sections of the same winding (e.g. the two halves of
+    an interleaved primary) are separate blocks that receive the same current in the excitation vector.
+    """
+    def __init__(self,
+                 SelectedCore,
+                 WindowWidth, WindowHeight,
+                 EquivalentWindingsBlocks,
+                 NumberOfTurns):
+
+        self.Blocks = list(EquivalentWindingsBlocks)
+        self.NumberOfTurns = np.array([NumberOfTurns[block] for block in self.Blocks], dtype=np.float64)
+
+        # Energy matrix per ampere-turn: L = (N*I)^T EnergyMatrix (N*I) / I_ref^2
+        self.EnergyMatrix = self._EnergyMatrix(SelectedCore, WindowWidth, WindowHeight, EquivalentWindingsBlocks)
+
+        # Self/mutual inductance contributions of the leakage field, in H
+        self.InductanceMatrix = np.outer(self.NumberOfTurns, self.NumberOfTurns) * self.EnergyMatrix
+
+        # Short-circuit leakage between each pair of blocks, referred to the row block
+        diagonal = np.diag(self.EnergyMatrix)
+        self.LeakageMatrix = self.NumberOfTurns[:, np.newaxis]**2 * (diagonal[:, np.newaxis] + diagonal[np.newaxis, :] - 2 * self.EnergyMatrix)
+
+
+
+    def LeakageInductance(self, Excitation, I_ref=1):
+        """
+        Leakage inductance for a vector of block currents (one entry per block, in the order of self.Blocks),
+        or for a 2-D array holding one excitation per row.
+        """
+        AmpereTurns = np.asarray(Excitation, dtype=np.float64) * self.NumberOfTurns
+
+        return np.einsum('...k,kl,...l->...', AmpereTurns, self.EnergyMatrix, AmpereTurns) / I_ref**2
+
+    @staticmethod
+    def _StageSum(Grams, scale, Areas):
+        # Symmetric energy matrix of one series, per ampere-turn of each block
+        G_m0, G_0n, G_mn = Grams
+        G = scale * (G_m0 + G_0n + 0.5 * G_mn)
+
+        return 0.5 * (G + G.T) / np.outer(Areas, Areas)
+
+    def _EnergyMatrix(self, SelectedCore, WindowWidth, WindowHeight, EquivalentWindingsBlocks):
+
+        # Defines each winding block position, inside the window and in the "infinite window" of the outside-window series
+        bounds = [(block['x'], block['x'] + block['width'], block['y'], block['y'] + block['height'])
+                  for block in (EquivalentWindingsBlocks[name] for name in self.Blocks)]
+        Areas = np.array([(w_plus - w_minus) * (h_plus - h_minus) for w_minus, w_plus, h_minus, h_plus in bounds])
+
+        w_w_inf, h_w_inf, shift = FactorizedLeakageEngine.OutsideWindow(WindowWidth, WindowHeight)
+
+        # Per-block spectral coefficients, computed once and shared by the p.u.l. and p.u.a. series
+        spectra_IW = [FactorizedLeakageEngine.BlockSpectrum(30, 30, WindowWidth, WindowHeight, *b) for b in bounds]
+        spectra_OW = [FactorizedLeakageEngine.BlockSpectrum(150, 150, w_w_inf, h_w_inf, b[0], b[1], b[2] + shift, b[3] + shift) for b in bounds]
+
+        def pul_IW():
+            return self._StageSum(FactorizedLeakageEngine.Gram_pul(30, 30, WindowWidth, WindowHeight, spectra_IW),
+                                  (WindowWidth * WindowHeight) / 2, Areas)
+
+        def pul_OW():
+            return self._StageSum(FactorizedLeakageEngine.Gram_pul(150, 150, w_w_inf, h_w_inf, spectra_OW),
+                                  (w_w_inf * h_w_inf) / 2, Areas)
+
+        def pua_IW(DiameterCentralLeg):
+            return self._StageSum(FactorizedLeakageEngine.Gram_pua(30, 30, WindowWidth, WindowHeight, DiameterCentralLeg, spectra_IW),
+                                  (WindowHeight * (WindowWidth**2)) / 4, Areas)
+
+        def pua_OW(DiameterCentralLeg):
+            return self._StageSum(FactorizedLeakageEngine.Gram_pua(150, 150, w_w_inf, h_w_inf, DiameterCentralLeg, spectra_OW),
+                                  (h_w_inf * (w_w_inf**2)) / 4, Areas)
+
+        # Core-Specific Leakage Expressions (same weighting as LeakageInductanceCalculator._LeakageScaler)
+        DiameterCentralLeg, Weights = core_series_weights(SelectedCore)
+        series = {'pul_IW': pul_IW, 'pul_OW': pul_OW,
+                  'pua_IW': lambda: pua_IW(DiameterCentralLeg), 'pua_OW': lambda: pua_OW(DiameterCentralLeg)}
+
+        return sum(series[name]()*weight for name, weight in Weights.items())
@@ -0,0 +1,136 @@
+import numpy as np
+from functools import lru_cache
+
+class OpenBoundaryLeakageEngine:
+    """
+    Closed-form alternative to the "infinite window" (10x window, 150 harmonics) outside-window series.
+    Outside the core the only magnetic boundary left is the central-leg surface (x = 0), so it is replaced by the mirror
+    image of the blocks (same current sign) and the field is the free-space field of the blocks and their images. The
+    2D energy then reduces to the log-kernel integrals between pairs of uniform rectangles, which are exact sums over the
+    rectangle corners of a 4th antiderivative of ln(r). The radius weighting of the 2.5D energy adds the first moment of
+    the vector potential over the blocks and its square on the central-leg surface, evaluated with Gauss-Legendre
+    quadrature of the closed-form rectangle potential.
+    The windings must be ampere-turn balanced (zero net current), as the energy of an unbalanced 2D field is unbounded.
+    """
+    mu_0 = 4 * np.pi * 1e-7
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _Gauss(Points):
+        # Gauss-Legendre nodes and weights on [-1, 1]
+        nodes, weights = np.polynomial.legendre.leggauss(Points)
+        nodes.setflags(write=False)
+        weights.setflags(write=False)
+        return nodes, weights
+
+    @staticmethod
+    def _K(u, v):
+        # int int ln(sqrt(u^2 + v^2)) du dv
+        u, v = np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64)
+        r2 = u**2 + v**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = u * v * np.log(r2) - 3 * u * v + u**2 * np.arctan(v / u) + v**2 * np.arctan(u / v)
+        return 0.5 * np.where(r2 > 0, value, 0) # The only 0/0 is at the origin, where the antiderivative vanishes
+
+    @staticmethod
+    def _Q(u, v):
+        # 4th antiderivative (twice in u and twice in v) of ln(sqrt(u^2 + v^2))
+        u, v = np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64)
+        r2 = u**2 + v**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = ((6 * u**2 * v**2 - u**4 - v**4) * np.log(r2) / 24 + u**3 * v * np.arctan(v / u) / 3
+                     + u * v**3 * np.arctan(u / v) / 3 - 25 * u**2 * v**2 / 24)
+        return 0.5 * np.where(r2 > 0, value, 0)
+
+    @staticmethod
+    def RectanglePotential(x, y, Bounds):
+        """
+        int over the rectangles Bounds = (..., 4) arrays of (Width_Minus, Width_Plus, Height_Minus, Height_Plus) of
+        ln|r - r'| dS', at the points (x, y) (broadcast against the leading axes of Bounds).
+        """
+        Bounds = np.asarray(Bounds, dtype=np.float64)
+        # Corner differences, (..., 2, 2): point against (minus, plus) of the rectangle in x and in y
+        u = (np.asarray(x, dtype=np.float64)[..., np.newaxis] - Bounds[..., :2])[..., :, np.newaxis]
+        v = (np.asarray(y, dtype=np.float64)[..., np.newaxis] - Bounds[..., 2:])[..., np.newaxis, :]
+        signs = np.array([[1, -1], [-1, 1]])
+        return np.einsum('...ab,ab->...', OpenBoundaryLeakageEngine._K(u, v), signs)
+
+    @staticmethod
+    def RectanglePairIntegral(Bounds_1, Bounds_2):
+        """
+        int over rectangle 1 int over rectangle 2 of ln|r - r'| dS dS', as a signed sum over the 16 corner pairs.
+        Bounds_1 and Bounds_2 are (..., 4) arrays broadcast against each other.
+        """
+        Bounds_1, Bounds_2 = np.asarray(Bounds_1, dtype=np.float64), np.asarray(Bounds_2, dtype=np.float64)
+        # Corner differences, (..., 2, 2): (minus, plus) of rectangle 1 against (minus, plus) of rectangle 2
+        u = Bounds_1[..., :2, np.newaxis] - Bounds_2[..., np.newaxis, :2]
+        v = Bounds_1[..., 2:, np.newaxis] - Bounds_2[..., np.newaxis, 2:]
+        signs = np.array([[-1, 1], [1, -1]])
+        Q = OpenBoundaryLeakageEngine._Q(u[..., :, :, np.newaxis, np.newaxis], v[..., np.newaxis, np.newaxis, :, :])
+        return np.einsum('...abcd,ab,cd->...', Q, signs, signs)
+
+    @staticmethod
+    def _WithImages(CurrentDensities, Bounds):
+        # Blocks followed by their images in the central-leg surface (same current density)
+        Bounds = np.asarray(Bounds, dtype=np.float64)
+        images = np.stack((-Bounds[:, 1], -Bounds[:, 0], Bounds[:, 2], Bounds[:, 3]), axis=-1)
+        return np.tile(np.asarray(CurrentDensities, dtype=np.float64), 2), np.concatenate((Bounds, images))
+
+    @staticmethod
+    def VectorPotential(x, y, CurrentDensities, Bounds):
+        """
+        Vector potential of the blocks (with the given current densities) and their images at the points (x, y).
+        """
+        J, rectangles = OpenBoundaryLeakageEngine._WithImages(CurrentDensities, Bounds)
+        x, y = np.asarray(x, dtype=np.float64)[..., np.newaxis], np.asarray(y, dtype=np.float64)[..., np.newaxis]
+        return -OpenBoundaryLeakageEngine.mu_0 / (2 * np.pi) * (OpenBoundaryLeakageEngine.RectanglePotential(x, y, rectangles) @ J)
+
+    @staticmethod
+    def Leakage_pul(I_ref, CurrentDensities, Bounds):
+        """
+        2D leakage inductance p.u.l. outside the window (same arguments as FactorizedLeakageEngine.Leakage_pul, with the
+        blocks positioned relative to the central-leg surface as inside the window).
+        """
+        # int A J over the blocks = field energy in x > 0 (half of the energy of the blocks and their images)
+        J, rectangles = OpenBoundaryLeakageEngine._WithImages(CurrentDensities, Bounds)
+        blocks = rectangles[:len(rectangles) // 2]
+        F = OpenBoundaryLeakageEngine.RectanglePairIntegral(blocks[:, np.newaxis, :], rectangles[np.newaxis, :, :])
+
+        return -OpenBoundaryLeakageEngine.mu_0 / (2 * np.pi) * (J[:len(blocks)] @ F @ J) / I_ref**2
+
+    @staticmethod
+    def Leakage_pua(I_ref, DiameterCentralLeg, CurrentDensities, Bounds, QuadraturePoints=10):
+        """
+        2.5D leakage inductance p.u.a. outside the window: the field energy in x > 0 weighted by the radius
+        r = DiameterCentralLeg / 2 + x, using int x |B|^2 / mu_0 = int x A J + (1 / (2 mu_0)) int A(0, y)^2 dy.
+        """
+        mu_0 = OpenBoundaryLeakageEngine.mu_0
+        nodes, weights = OpenBoundaryLeakageEngine._Gauss(QuadraturePoints)
+
+        # Quadrature points of every block (first moment of A J) and of the central-leg surface (A^2), in one evaluation
+        Bounds = np.asarray(Bounds, dtype=np.float64)
+        half_widths, half_heights = (Bounds[:, 1] - Bounds[:, 0]) / 2, (Bounds[:, 3] - Bounds[:, 2]) / 2
+        x_block = (Bounds[:, :1] + half_widths[:, np.newaxis] * (nodes + 1))[:, :, np.newaxis]
+        y_block = (Bounds[:, 2:3] + half_heights[:, np.newaxis] * (nodes + 1))[:, np.newaxis, :]
+
+        # Central-leg surface: Gauss-Legendre between the block edges, tan-mapped tails beyond them
+        edges = np.unique(Bounds[:, 2:])
+        scale = edges[-1] - edges[0]
+        theta = np.pi / 4 * (nodes + 1)
+        y_line = np.concatenate([((start + end) / 2 + (end - start) / 2 * nodes) for start, end in zip(edges[:-1], edges[1:])]
+                                + [edges[-1] + scale * np.tan(theta), edges[0] - scale * np.tan(theta)])
+        w_line = np.concatenate([(end - start) / 2 * weights for start, end in zip(edges[:-1], edges[1:])]
+                                + 2 * [np.pi / 4 * weights * scale / np.cos(theta)**2])
+
+        points = len(Bounds) * nodes.size**2
+        x = np.concatenate((np.broadcast_to(x_block, (len(Bounds), nodes.size, nodes.size)).reshape(-1), np.zeros_like(y_line)))
+        y = np.concatenate((np.broadcast_to(y_block, (len(Bounds), nodes.size, nodes.size)).reshape(-1), y_line))
+        A = OpenBoundaryLeakageEngine.VectorPotential(x, y, CurrentDensities, Bounds)
+
+        w_x = (half_widths[:, np.newaxis] * weights)[:, :, np.newaxis]
+        w_y = (half_heights[:, np.newaxis] * weights)[:, np.newaxis, :]
+        moment = np.asarray(CurrentDensities, dtype=np.float64) @ (w_x * x_block * w_y * A[:points].reshape(len(Bounds), nodes.size, nodes.size)).sum(axis=(1, 2))
+        boundary = w_line @ A[points:]**2 / (2 * mu_0)
+
+        Leakage_pul = OpenBoundaryLeakageEngine.Leakage_pul(I_ref, CurrentDensities, Bounds)
+        return DiameterCentralLeg / 2 * Leakage_pul + (moment + boundary) / I_ref**2
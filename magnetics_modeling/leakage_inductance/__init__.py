@@ -0,0 +1,4 @@
+"""
+Leakage inductance models. Every module defines the class it is named after; import the submodules directly, or the
+classes lazily from magnetics_modeling.
+"""
@@ -0,0 +1,162 @@
+import numpy as np
+
+from magnetics_modeling.winding_loss.WindingLossCalculator import WindingLossCalculator
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_series_weights
+
+class ElectroThermalSolver:
+    """
+    Coupled losses <-> temperatures of one or many transformer designs through a lumped thermal network.
+
+    Each design is a 4-node network (core, primary, secondary, bobbin) referred to the ambient temperature, built from
+    the WindingMaker equivalent blocks and the window geometry:
+      - core -> ambient by convection over the outer core surface
+      - bobbin -> core by conduction through the bobbin tube and flanges
+      - winding -> bobbin by conduction through half the winding and half the bobbin wall (innermost blocks only)
+      - winding <-> winding by conduction through the spacing between blocks
+      - winding -> ambient by convection over the part of the outermost blocks that is outside the core
+    The networks of all designs are stacked into one block-diagonal system solved in a single batched call, and the
+    temperature-dependent losses are iterated to a fixed point, only for the designs that have not converged yet.
+    InitialTemperatures (e.g. the Temperatures of a previous sweep point) warm-starts the iteration.
+    """
+    NODES = ('core', 'primary', 'secondary', 'bobbin')
+
+    def __init__(self,
+                 SelectedCore,
+                 WindowWidth, WindowHeight, BobbinThickness,
+                 EquivalentWindingsBlocks,
+                 CoreLoss, WindingLosses,
+                 AmbientTemperature=25, ReferenceTemperature=20,
+                 InitialTemperatures=None, LossModel=None,
+                 Tolerance=1e-3, MaxIterations=100,
+                 ThermalConductivityWinding=1.0, ThermalConductivityBobbin=0.2, ThermalConductivitySpacing=0.05,
+                 HeatTransferCoefficient=10.0):
+
+        primary = {key: np.asarray(value, dtype=np.float64) for key, value in EquivalentWindingsBlocks['primary'].items()}
+        secondary = {key: np.asarray(value, dtype=np.float64) for key, value in EquivalentWindingsBlocks['secondary'].items()}
+
+        # Losses at the reference temperature, one row per design (geometry, losses or ambient temperature)
+        shape = np.broadcast_shapes(self._Shape(WindowWidth, WindowHeight, BobbinThickness, primary, secondary), np.shape(AmbientTemperature))
+        self.BaseLosses = np.stack(np.broadcast_arrays(np.asarray(CoreLoss, dtype=np.float64),
+                                                       np.asarray(WindingLosses['primary'], dtype=np.float64),
+                                                       np.asarray(WindingLosses['secondary'], dtype=np.float64),
+                                                       np.zeros(shape)), axis=-1).reshape(-1, 4)
+        self.ReferenceTemperature = ReferenceTemperature
+        self.LossModel = LossModel or self.CopperLossModel
+
+        self.Conductances, self.AmbientConductances = self.Network(
+            SelectedCore, WindowWidth, WindowHeight, BobbinThickness, primary, secondary,
+            ThermalConductivityWinding, ThermalConductivityBobbin, ThermalConductivitySpacing, HeatTransferCoefficient)
+        self.Conductances = np.broadcast_to(self.Conductances, (len(self.BaseLosses), 4, 4))
+        self.AmbientConductances = np.broadcast_to(self.AmbientConductances, (len(self.BaseLosses), 4))
+
+        self.AmbientTemperature = np.broadcast_to(np.asarray(AmbientTemperature, dtype=np.float64).reshape(-1, 1), (len(self.BaseLosses), 1))
+        self.Temperatures, self.Losses, self.Iterations, self.Converged = self._Solve(InitialTemperatures, Tolerance, MaxIterations)
+        self.NodeTemperatures = {node: self.Temperatures[:, index] for index, node in enumerate(self.NODES)}
+
+    def CopperLossModel(self, Temperatures, Rows):
+        """
+        Default loss model: winding losses follow the copper resistivity, the core loss is temperature independent.
+        A custom LossModel takes the same arguments (node temperatures of the given design rows) and returns their losses.
+        """
+        coefficient = WindingLossCalculator.CopperTemperatureCoefficient
+        scale = (1 + coefficient * (Temperatures - 20)) / (1 + coefficient * (self.ReferenceTemperature - 20))
+        scale[:, [0, 3]] = 1
+        return self.BaseLosses[Rows] * scale
+
+    @staticmethod
+    def _Shape(WindowWidth, WindowHeight, BobbinThickness, primary, secondary):
+        # Number of designs described by the (broadcast) geometry
+        return np.broadcast_shapes(*(np.shape(value) for value in (WindowWidth, WindowHeight, BobbinThickness, *primary.values(), *secondary.values())))
+
+    @staticmethod
+    def _OutsideFraction(SelectedCore):
+        # Fraction of each turn that is outside the core (the outside-window angle of the leakage series)
+        _, Weights = core_series_weights(SelectedCore)
+        return Weights['pua_OW'] / (2*np.pi)
+
+    @staticmethod
+    def Network(SelectedCore, WindowWidth, WindowHeight, BobbinThickness, primary, secondary,
+                ThermalConductivityWinding, ThermalConductivityBobbin, ThermalConductivitySpacing, HeatTransferCoefficient):
+        """
+        Conductance matrices (..., 4, 4) between the nodes and conductances (..., 4) of each node to the ambient, in W/K.
+        """
+        MeanTurnLength = lambda x: WindingLossCalculator.MeanTurnLength(SelectedCore, x)
+
+        # Vertical overlap / horizontal gap and horizontal overlap / vertical gap of the two blocks
+        overlap_y = np.minimum(primary['y'] + primary['height'], secondary['y'] + secondary['height']) - np.maximum(primary['y'], secondary['y'])
+        overlap_x = np.minimum(primary['x'] + primary['width'], secondary['x'] + secondary['width']) - np.maximum(primary['x'], secondary['x'])
+        gap_x = np.maximum(primary['x'], secondary['x']) - np.minimum(primary['x'] + primary['width'], secondary['x'] + secondary['width'])
+        gap_y = np.maximum(primary['y'], secondary['y']) - np.minimum(primary['y'] + primary['height'], secondary['y'] + secondary['height'])
+        side_by_side = overlap_y > 0
+
+        # A block that has the other one between itself and the bobbin tube (or the outside) does not touch it
+        inner = [~(side_by_side & (other['x'] < block['x'])) for block, other in ((primary, secondary), (secondary, primary))]
+        outer = [~(side_by_side & (other['x'] > block['x'])) for block, other in ((primary, secondary), (secondary, primary))]
+
+        G = np.zeros(ElectroThermalSolver._Shape(WindowWidth, WindowHeight, BobbinThickness, primary, secondary) + (4, 4))
+        G_amb = np.zeros(G.shape[:-1])
+
+        def connect(i, j, conductance):
+            G[..., i, j] -= conductance
+            G[..., j, i] -= conductance
+            G[..., i, i] += conductance
+            G[..., j, j] += conductance
+
+        # Winding -> bobbin: half the winding width in series with half the bobbin wall
+        for node, block, touches in ((1, primary, inner[0]), (2, secondary, inner[1])):
+            area = block['height'] * MeanTurnLength(block['x'])
+            resistance = block['width'] / (2 * ThermalConductivityWinding * area) + BobbinThickness / (2 * ThermalConductivityBobbin * area)
+            connect(node, 3, np.where(touches, 1 / resistance, 0))
+
+        # Winding <-> winding through the spacing, across the side-by-side or the stacked faces
+        x_mid = (np.maximum(primary['x'], secondary['x']) + np.minimum(primary['x'] + primary['width'], secondary['x'] + secondary['width'])) / 2
+        area = np.where(side_by_side, overlap_y * MeanTurnLength(x_mid), np.maximum(overlap_x, 0) * MeanTurnLength((primary['x'] + secondary['x']) / 2))
+        gap = np.where(side_by_side, gap_x, gap_y)
+        half_widths = np.where(side_by_side, (primary['width'] + secondary['width']) / 2, (primary['height'] + secondary['height']) / 2)
+        resistance = half_widths / (ThermalConductivityWinding * area) + np.maximum(gap, 0) / (ThermalConductivitySpacing * area)
+        connect(1, 2, np.where(area > 0, 1 / resistance, 0))
+
+        # Bobbin -> core through the tube and both flanges
+        area_tube = (WindowHeight - 2 * BobbinThickness) * MeanTurnLength(BobbinThickness / 2)
+        area_flanges = 2 * (WindowWidth - BobbinThickness) * MeanTurnLength(WindowWidth / 2)
+        connect(3, 0, ThermalConductivityBobbin * (area_tube + area_flanges) / (BobbinThickness / 2))
+
+        # Convection: core outer surface and the part of the outermost winding faces outside the core
+        A, B, C = SelectedCore["A"], SelectedCore["B"], SelectedCore["C"]
+        G_amb[..., 0] = HeatTransferCoefficient * 2 * (A * C + 2 * B * A + 2 * B * C)
+        OutsideFraction = ElectroThermalSolver._OutsideFraction(SelectedCore)
+        for node, block, exposed in ((1, primary, outer[0]), (2, secondary, outer[1])):
+            area = block['height'] * MeanTurnLength(block['x'] + block['width']) * OutsideFraction
+            G_amb[..., node] = np.where(exposed, HeatTransferCoefficient * area, 0)
+
+        return G + G_amb[..., np.newaxis] * np.eye(4), G_amb
+
+    def _Solve(self, InitialTemperatures, Tolerance, MaxIterations):
+        count = len(self.BaseLosses)
+        if InitialTemperatures is None:
+            Temperatures = np.repeat(self.AmbientTemperature, 4, axis=1)
+        else:
+            Temperatures = np.array(np.broadcast_to(InitialTemperatures, (count, 4)), dtype=np.float64)
+
+        Losses = np.empty((count, 4))
+        Iterations = np.zeros(count, dtype=np.int64)
+        Converged = np.zeros(count, dtype=bool)
+        active = np.arange(count)
+
+        for _ in range(MaxIterations):
+            # One batched solve of the block-diagonal system of the designs still iterating
+            Losses[active] = self.LossModel(Temperatures[active], active)
+            rhs = Losses[active] + self.AmbientConductances[active] * self.AmbientTemperature[active]
+            Updated = np.linalg.solve(self.Conductances[active], rhs[..., np.newaxis])[..., 0]
+
+            change = np.abs(Updated - Temperatures[active]).max(axis=1)
+            Temperatures[active] = Updated
+            Iterations[active] += 1
+
+            done = change < Tolerance
+            Converged[active[done]] = True
+            active = active[~done]
+            if not active.size:
+                break
+
+        return Temperatures, Losses, Iterations, Converged
@@ -0,0 +1,3 @@
+"""
+Thermal models.
+"""
@@ -0,0 +1,3 @@
+"""
+Winding (copper) loss models.
+"""
@@ -0,0 +1,39 @@
+"""
+Cores, block layouts and designs shared by the tests.
+"""
+import pytest
+
+
+@pytest.fixture
+def cores():
+    return {
+        'ETD': {'family': 'ETD', 'A': 34.2e-3, 'B': 17.3e-3, 'C': 10.8e-3, 'D': 12.1e-3, 'E': 26.4e-3, 'F': 10.7e-3},
+        'EFD': {'family': 'EFD', 'A': 25e-3, 'B': 12.5e-3, 'C': 9.1e-3, 'D': 9.3e-3, 'E': 18.7e-3, 'F': 11.4e-3, 'F2': 5.2e-3},
+    }
+
+
+@pytest.fixture
+def bounds():
+    # Block bounds (Width_Minus, Width_Plus, Height_Minus, Height_Plus) as fractions of the window, side by side with
+    # ends that do not line up
+    return ((0.13, 0.47, 0.09, 0.81), (0.55, 0.86, 0.14, 0.74))
+
+
+@pytest.fixture
+def turns():
+    return (40, 24)
+
+
+@pytest.fixture
+def blocks():
+    def blocks(Bounds):
+        return {winding: {'x': b[0], 'width': b[1] - b[0], 'y': b[2], 'height': b[3] - b[2]}
+                for winding, b in zip(('primary', 'secondary'), Bounds)}
+    return blocks
+
+
+@pytest.fixture
+def design():
+    return {'BobbinType': 'Normal', 'BobbinThickness': 1e-3, 'NumberOfTurns_1': 20, 'NumberOfTurns_2': 10,
+            'ConductorDiameter_1': 0.5e-3, 'InsulationThickness_1': 0.05e-3,
+            'ConductorDiameter_2': 0.8e-3, 'InsulationThickness_2': 0.05e-3, 'WindingsSpacing': 0.5e-3}
@@ -0,0 +1,60 @@
+"""
+BatchLeakageInductanceCalculator against LeakageInductanceCalculator (factorized and dense reference), design by design,
+and batches of the FactorizedLeakageEngine under a MemoryBudget.
+"""
+import tracemalloc
+import numpy as np
+import pytest
+
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+from magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator import BatchLeakageInductanceCalculator
+from magnetics_modeling.leakage_inductance.FactorizedLeakageEngine import FactorizedLeakageEngine
+
+
+@pytest.mark.parametrize('family', ('ETD', 'EFD'))
+@pytest.mark.parametrize('ReferredWinding', ('Primary', 'Secondary'))
+def test_batch_matches_single_designs(family, ReferredWinding, cores):
+    rng = np.random.default_rng(1)
+    WindowWidth, WindowHeight, designs = 7.85e-3, 24.2e-3, 12
+    x_1, w_1 = rng.uniform(0, 2e-3, designs), rng.uniform(1e-3, 3e-3, designs)
+    x_2 = x_1 + w_1 + rng.uniform(0, 1e-3, designs)
+    w_2 = rng.uniform(0.5e-3, WindowWidth - x_2)
+    blocks = {'primary': {'x': x_1, 'y': rng.uniform(0, 3e-3, designs), 'width': w_1, 'height': rng.uniform(5e-3, 20e-3, designs)},
+              'secondary': {'x': x_2, 'y': rng.uniform(0, 3e-3, designs), 'width': w_2, 'height': rng.uniform(5e-3, 20e-3, designs)}}
+    turns_1, turns_2 = rng.integers(10, 80, designs), rng.integers(5, 40, designs)
+
+    batch = BatchLeakageInductanceCalculator(cores[family], ReferredWinding, WindowWidth, WindowHeight, blocks, turns_1, turns_2,
+                                             ChunkSize=5).LeakageInductance
+    for index in range(designs):
+        design = {winding: {key: float(values[index]) for key, values in block.items()} for winding, block in blocks.items()}
+        single = LeakageInductanceCalculator(cores[family], ReferredWinding, WindowWidth, WindowHeight, design,
+                                             int(turns_1[index]), int(turns_2[index])).LeakageInductance
+        assert batch[index] == pytest.approx(single, rel=1e-12)
+        # The original triple sums, for a few designs
+        if index < 3:
+            dense = LeakageInductanceCalculator(cores[family], ReferredWinding, WindowWidth, WindowHeight, design,
+                                                int(turns_1[index]), int(turns_2[index]), Method='dense').LeakageInductance
+            assert batch[index] == pytest.approx(dense, rel=1e-12)
+
+
+@pytest.mark.parametrize('family, ReferredWinding', [('PQ', 'Primary'), ('ETD', 'Foo')])
+def test_unsupported_inputs_are_rejected(family, ReferredWinding, cores):
+    blocks = {'primary': {'x': [0.5e-3], 'y': [1e-3], 'width': [1e-3], 'height': [10e-3]},
+              'secondary': {'x': [2e-3], 'y': [2e-3], 'width': [1e-3], 'height': [9e-3]}}
+    with pytest.raises(ValueError):
+        BatchLeakageInductanceCalculator({**cores['ETD'], 'family': family}, ReferredWinding, 3.65e-3, 18.6e-3, blocks, [20], [10])
+
+
+def test_memory_budget_bounds_factorized_batches():
+    rng = np.random.default_rng(2)
+    WindowWidth, WindowHeight, designs = 7.85e-3, 24.2e-3, 600
+    bounds = np.sort(rng.uniform(0, 1, (designs, 2, 2, 2)), axis=-1).reshape(designs, 2, 4) * [WindowWidth, WindowWidth, WindowHeight, WindowHeight]
+    J = rng.normal(size=(designs, 2)) * 1e6
+    reference = FactorizedLeakageEngine.Leakage_pua(150, 150, 1, WindowWidth, WindowHeight, 0.01, J, bounds)
+
+    tracemalloc.start()
+    chunked = FactorizedLeakageEngine.Leakage_pua(150, 150, 1, WindowWidth, WindowHeight, 0.01, J, bounds, MemoryBudget=2**20)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 2**20
+    np.testing.assert_array_equal(chunked, reference)
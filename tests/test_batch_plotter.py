@@ -0,0 +1,36 @@
+"""
+BatchTransformerPlotter: images drawn over the cached background against a full draw of the same figure.
+"""
+import io
+import numpy as np
+from matplotlib.image import imread
+
+from magnetics_modeling.auxiliary_functions.batch_plotter import BatchTransformerPlotter
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+
+
+SPLIT = {'BobbinType': 'Split', 'PrimaryHeight': 8e-3, 'InterSectionSpacing': 1e-3, 'SecondaryHeight': 8e-3}
+
+
+def _image(Buffer):
+    return imread(io.BytesIO(Buffer.getvalue()), format='png')
+
+
+def test_cached_background_matches_full_draw(cores, design):
+    plotter = BatchTransformerPlotter(figsize=(4, 4))
+    for SelectedCore, Design in ((cores['ETD'], design), (cores['ETD'], {**design, **SPLIT}), (cores['EFD'], design),
+                                 (cores['ETD'], {**design, 'NumberOfTurns_1': 30})):
+        cached = io.BytesIO()
+        assert plotter.render_design(cached, *core_window_dimensions(SelectedCore), **Design) is cached
+        full = io.BytesIO()
+        plotter.fig.savefig(full, format='png')
+        np.testing.assert_array_equal(_image(cached), _image(full))
+
+
+def test_legend_lists_the_spacing_of_split_bobbins_only(cores, design):
+    plotter = BatchTransformerPlotter(figsize=(4, 4))
+    for Design, labels in ((design, 4), ({**design, **SPLIT}, 5)):
+        plotter.render_design(io.BytesIO(), *core_window_dimensions(cores['ETD']), **Design)
+        [legend] = [legend for legend in plotter.legends.values() if legend.get_visible()]
+        texts = [text.get_text() for text in legend.get_texts()]
+        assert len(texts) == labels and ('Spacing' in texts) == (Design['BobbinType'] == 'Split')
@@ -0,0 +1,21 @@
+"""
+The pre-package import paths resolve to the modules of magnetics_modeling.
+"""
+import importlib
+import pytest
+
+import magnetics_modeling
+
+
+@pytest.mark.parametrize('module', ['leakage_inductance.LeakageInductanceCalculator', 'auxiliary_functions.design_service',
+                                    'auxiliary_functions.core_catalog', 'winding_loss.WindingLossCalculator',
+                                    'core_loss.CoreLossCalculator', 'thermal.ElectroThermalSolver'])
+def test_old_paths_alias_the_same_modules(module):
+    assert importlib.import_module(module) is importlib.import_module(f'magnetics_modeling.{module}')
+
+
+def test_old_from_imports():
+    from leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+    from auxiliary_functions import winding_maker
+    assert LeakageInductanceCalculator is magnetics_modeling.LeakageInductanceCalculator
+    assert winding_maker.WindingMaker is magnetics_modeling.WindingMaker
@@ -0,0 +1,54 @@
+"""
+CoreCatalog.build: stored values, unsupported families, versioned publishing and permissions.
+"""
+import os
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions import versioned_directory
+from magnetics_modeling.auxiliary_functions.core_catalog import CoreCatalog
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+
+
+RECORD = {'manufacturer': 'TDK', 'family': 'ETD', 'sub_family': 'ETD', 'model': 'ETD34', 'core_material': 'N87',
+          'A': '34.2e-3', 'B': '17.3e-3', 'C': 0, 'D': '12.1e-3', 'E': '26.4e-3', 'F': '10.7e-3', 'F2': ''}
+
+
+def test_zero_is_kept_and_empty_is_nan(tmp_path):
+    catalog = CoreCatalog.build([RECORD], str(tmp_path / 'catalog'))
+    core = catalog.GetCore('TDK', 'ETD', 'ETD', 'ETD34', 'N87')
+    assert core['C'] == 0.0
+    assert 'F2' not in core
+    assert np.isnan(catalog['F2'][0])
+
+
+def test_unsupported_family_has_no_window(tmp_path):
+    pq = {**RECORD, 'family': 'PQ', 'sub_family': 'PQ', 'model': 'PQ32/30'}
+    catalog = CoreCatalog.build([RECORD, pq], str(tmp_path / 'catalog'))
+    assert catalog.UnsupportedFamilies == ['PQ']
+    assert 'WindowWidth' not in catalog.GetCore('TDK', 'PQ', 'PQ', 'PQ32/30', 'N87')
+    assert catalog.GetCore('TDK', 'ETD', 'ETD', 'ETD34', 'N87')['WindowWidth'] == (26.4e-3 - 10.7e-3) / 2
+    with pytest.raises(ValueError):
+        core_window_dimensions(catalog.GetCore('TDK', 'PQ', 'PQ', 'PQ32/30', 'N87'))
+
+
+def test_rebuilds_publish_new_versions(tmp_path):
+    path = str(tmp_path / 'catalog')
+    first = CoreCatalog.build([RECORD], path)
+    versions = []
+    for width in ('30e-3', '31e-3', '32e-3'):
+        CoreCatalog.build([{**RECORD, 'E': width}], path)
+        versions.append(versioned_directory.current(path))
+
+    # Readers that opened an earlier version keep it, new readers get the last one
+    assert first['E'][0] == 26.4e-3
+    assert CoreCatalog(path)['E'][0] == 32e-3
+    # The current and the previous version are kept
+    assert sorted(os.listdir(path)) == sorted([versioned_directory.POINTER] + [os.path.basename(v) for v in versions[-2:]])
+    assert os.stat(versions[-1]).st_mode & 0o077 == 0o777 & ~_umask() & 0o077
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
@@ -0,0 +1,47 @@
+"""
+CoreLossCalculator: the iGSE of a sine against the Steinmetz equation, the tabulated materials against their datasheet
+points, and the streamed loop decomposition against the one-shot one.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.core_loss.CoreLossCalculator import CoreLossCalculator, STEINMETZ_COEFFICIENTS
+
+
+PARAMETERS = (4.6, 1.36, 2.7)
+
+
+@pytest.mark.parametrize('Frequency, PeakFluxDensity', [(25e3, 0.2), (100e3, 0.1), (100e3, 0.2), (300e3, 0.05)])
+def test_sine_matches_steinmetz(Frequency, PeakFluxDensity):
+    k, alpha, beta = PARAMETERS
+    phase = np.arange(4096) / 4096
+    calculator = CoreLossCalculator({'core_material': None}, Frequency, PeakFluxDensity * np.sin(2 * np.pi * phase),
+                                    CoreVolume=2e-6, SteinmetzParameters=PARAMETERS)
+    expected = k * Frequency**alpha * PeakFluxDensity**beta
+    assert calculator.PowerDensity == pytest.approx(expected, rel=1e-6)
+    assert calculator.CoreLoss == pytest.approx(expected * 2e-6, rel=1e-6)
+
+
+@pytest.mark.parametrize('material, Frequency, PeakFluxDensity, PowerDensity', [
+    ('N87', 100e3, 0.2, 375e3), ('N87', 25e3, 0.2, 57e3), ('OGP44', 100e3, 0.2, 300e3), ('OGP44', 100e3, 0.1, 50e3)])
+def test_coefficients_match_datasheet_points(material, Frequency, PeakFluxDensity, PowerDensity):
+    k, alpha, beta = (STEINMETZ_COEFFICIENTS[material][name] for name in ('k', 'alpha', 'beta'))
+    assert k * Frequency**alpha * PeakFluxDensity**beta == pytest.approx(PowerDensity, rel=0.1)
+
+
+def test_stream_matches_one_shot():
+    # A waveform with minor loops, repeated over many periods and cut into uneven chunks
+    samples, periods, Frequency = 400, 50, 100e3
+    phase = np.arange(samples) / samples
+    B = 0.15 * np.sin(2 * np.pi * phase) + 0.04 * np.sin(2 * np.pi * 7 * phase)
+    Time = np.arange(samples * periods + 1) / (samples * Frequency)
+    record = np.concatenate((np.tile(B, periods), B[:1]))
+
+    periodic = CoreLossCalculator({'core_material': None}, Frequency, B, SteinmetzParameters=PARAMETERS).PowerDensity[0]
+    whole = CoreLossCalculator.Stream([(Time, record)], SteinmetzParameters=PARAMETERS)
+    cuts = np.sort(np.random.default_rng(0).choice(np.arange(1, Time.size), 60, replace=False))
+    chunked = CoreLossCalculator.Stream(zip(np.split(Time, cuts), np.split(record, cuts)), SteinmetzParameters=PARAMETERS)
+
+    assert chunked == pytest.approx(whole, rel=1e-12)
+    # The loops left open at the end of the record count as half cycles, which fades as 1 / periods
+    assert whole == pytest.approx(periodic, rel=1 / periods)
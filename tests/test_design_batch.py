@@ -0,0 +1,93 @@
+"""
+DesignBatch: invalid rows are reported as errors next to the evaluated ones, and an interrupted run resumes to the
+output of an uninterrupted one.
+"""
+import io
+import csv
+import json
+
+import pytest
+
+from magnetics_modeling.auxiliary_functions.design_batch import DesignBatch
+
+
+ROWS = [('valid', {}), ('no-secondary-turns', {'NumberOfTurns_2': 0}), ('fractional-turns', {'NumberOfTurns_1': 2.5}),
+        ('negative-spacing', {'WindingsSpacing': -1e-3}), ('bad-alignment', {'SecondaryYAlign': 'middle'}),
+        ('negative-core', {'E': -26.4e-3})]
+
+
+def _write_designs(Path, Rows):
+    with open(Path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, list({name: None for row in Rows for name in row}))
+        writer.writeheader()
+        writer.writerows(Rows)
+
+
+def test_invalid_rows_are_errors(tmp_path, cores, design):
+    source, output = tmp_path / 'designs.csv', tmp_path / 'results.jsonl'
+    _write_designs(source, [{'id': name, **cores['ETD'], **design, **change} for name, change in ROWS])
+
+    summary = DesignBatch(str(source), str(output), ChunkSize=4).run()
+    with open(output) as file:
+        results = {result['id']: result for result in map(json.loads, file)}
+
+    assert summary['rows'] == len(ROWS) and summary['errors'] == len(ROWS) - 1
+    assert results['valid']['fits'] and results['valid']['LeakageInductance'] > 0 and results['valid']['error'] is None
+    for name, _ in ROWS[1:]:
+        assert not results[name]['fits'] and results[name]['error'].startswith('ValueError'), name
+
+
+def _sweep(cores, design):
+    # Ten designs over both cores, one of them invalid
+    return [{'id': f'design-{index}', **cores[('ETD', 'EFD')[index % 2]], **design, 'NumberOfTurns_1': 10 + 3 * index,
+             **({'WindingsSpacing': -1e-3} if index == 7 else {})} for index in range(10)]
+
+
+@pytest.mark.parametrize('extension', ('jsonl', 'csv'))
+def test_resume_after_interruption_matches_uninterrupted_run(tmp_path, monkeypatch, cores, design, extension):
+    source = tmp_path / 'designs.csv'
+    _write_designs(source, _sweep(cores, design))
+    reference, output = tmp_path / f'reference.{extension}', tmp_path / f'results.{extension}'
+    expected = DesignBatch(str(source), str(reference), ChunkSize=3).run()
+
+    # Interrupted while writing chunk 2: the checkpoint holds chunk 1 and the output ends in a partly written line
+    write = DesignBatch._write
+
+    def interrupted(self, file, Results, Header):
+        if Results[0]['row'] == 0:
+            return write(self, file, Results, Header)
+        text = io.StringIO()
+        write(self, text, Results, Header)
+        file.write(text.getvalue()[:len(text.getvalue()) // 2])
+        file.flush()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(DesignBatch, '_write', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        DesignBatch(str(source), str(output), ChunkSize=3).run()
+    with open(f'{output}.checkpoint') as file:
+        checkpoint = json.load(file)
+    assert checkpoint['rows'] == 3 and checkpoint['chunks'] == 1 and not checkpoint['complete']
+    assert output.stat().st_size > checkpoint['output_bytes']
+
+    monkeypatch.setattr(DesignBatch, '_write', write)
+    summary = DesignBatch(str(source), str(output), ChunkSize=3).run(Resume=True)
+
+    assert output.read_bytes() == reference.read_bytes()
+    assert summary == expected
+    assert summary['rows'] == 10 and summary['fitting'] > 0 and summary['errors'] == 1 and summary['complete']
+
+
+def test_resume_rejects_checkpoint_of_another_input(tmp_path, cores, design):
+    source, other, output = tmp_path / 'designs.csv', tmp_path / 'other.csv', tmp_path / 'results.jsonl'
+    rows = _sweep(cores, design)
+    _write_designs(source, rows)
+    _write_designs(other, rows)
+    DesignBatch(str(source), str(output), ChunkSize=3).run()
+
+    # Another file, then the same path with different designs
+    with pytest.raises(ValueError, match='belongs to input'):
+        DesignBatch(str(other), str(output), ChunkSize=3).run(Resume=True)
+    _write_designs(source, rows[::-1])
+    with pytest.raises(ValueError, match='changed since'):
+        DesignBatch(str(source), str(output), ChunkSize=3).run(Resume=True)
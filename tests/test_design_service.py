@@ -0,0 +1,55 @@
+"""
+DesignService /evaluate: valid designs are evaluated, invalid ones are rejected with 400 and leave the service running.
+"""
+import json
+import asyncio
+import pytest
+
+from magnetics_modeling.auxiliary_functions.design_service import DesignService
+
+
+@pytest.fixture
+def post(cores):
+    def post(*Requests):
+        async def run():
+            async with DesignService(Port=0, Processes=0, MaxBatchDelay=0, RequestTimeout=5) as service:
+                responses = [await service._route('POST', '/evaluate', json.dumps({'core': cores['ETD'], **request}))
+                             for request in Requests]
+                assert not service._dispatcher.done()
+                return responses
+        return asyncio.run(run())
+    return post
+
+
+@pytest.fixture
+def evaluate(post):
+    def evaluate(*Designs):
+        return post(*({'design': design} for design in Designs))
+    return evaluate
+
+
+def test_valid_design(evaluate, design):
+    [(status, payload)] = evaluate(design)
+    assert status == 200
+    assert payload['result']['fits'] and payload['result']['LeakageInductance'] > 0
+    json.dumps(payload, allow_nan=False)
+
+
+@pytest.mark.parametrize('change', [{'NumberOfTurns_2': 0}, {'NumberOfTurns_1': -3}, {'NumberOfTurns_1': 2.5},
+                                    {'NumberOfTurns_1': True}, {'ConductorDiameter_1': 0}, {'BobbinThickness': -1e-3},
+                                    {'WindingsSpacing': float('nan')}, {'SecondaryYAlign': 'middle'},
+                                    {'BobbinType': 'Round'}, {'BobbinType': 'Split'}])
+def test_invalid_design_is_rejected(change, evaluate, design):
+    [(status, payload)] = evaluate({**design, **change})
+    assert status == 400, payload
+
+
+def test_empty_request_keeps_the_service_running(post, design):
+    (status, payload), (next_status, next_payload) = post({'designs': []}, {'design': design})
+    assert (status, payload) == (200, {'results': []})
+    assert next_status == 200 and next_payload['result']['fits']
+
+
+def test_unknown_referred_winding_is_rejected(post, design):
+    [(status, payload)] = post({'design': design, 'ReferredWinding': 'Foo'})
+    assert status == 400 and payload['error'].startswith('ValueError'), payload
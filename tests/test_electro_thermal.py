@@ -0,0 +1,57 @@
+"""
+ElectroThermalSolver: convergence of the fixed point, warm starts and the heat balance of the network.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.thermal.ElectroThermalSolver import ElectroThermalSolver
+
+
+@pytest.fixture
+def solver(cores, design):
+    def solver(SelectedCore, **options):
+        WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+        blocks = WindingMaker(WindowWidth, WindowHeight, **design).winding_dims
+        return ElectroThermalSolver(SelectedCore, WindowWidth, WindowHeight, design['BobbinThickness'], blocks,
+                                    1.0, {'primary': 0.6, 'secondary': 0.4}, **options)
+    return solver
+
+
+@pytest.mark.parametrize('family', ('ETD', 'EFD'))
+def test_solution_is_a_fixed_point_with_heat_balance(solver, cores, family):
+    result = solver(cores[family], AmbientTemperature=[25, 40, 60], Tolerance=1e-6)
+    assert result.Converged.all() and result.Iterations.max() < 100
+
+    # Node equations hold with the losses at the solved temperatures
+    losses = result.CopperLossModel(result.Temperatures, np.arange(3))
+    np.testing.assert_allclose(losses, result.Losses, rtol=1e-6)
+    residual = np.einsum('bij,bj->bi', result.Conductances, result.Temperatures) - losses - result.AmbientConductances * result.AmbientTemperature
+    np.testing.assert_allclose(residual, 0, atol=1e-6)
+
+    # Every watt leaves through the ambient conductances, and every node is above the ambient
+    to_ambient = (result.AmbientConductances * (result.Temperatures - result.AmbientTemperature)).sum(axis=1)
+    np.testing.assert_allclose(to_ambient, result.Losses.sum(axis=1), rtol=1e-6)
+    assert np.all(result.Temperatures > result.AmbientTemperature)
+
+    # Hotter ambient, higher copper resistance
+    assert np.all(np.diff(result.Losses[:, 1:3].sum(axis=1)) > 0)
+
+
+def test_warm_start_takes_fewer_iterations(solver, cores):
+    cold = solver(cores['ETD'], AmbientTemperature=40)
+    warm = solver(cores['ETD'], AmbientTemperature=41, InitialTemperatures=cold.Temperatures)
+    reference = solver(cores['ETD'], AmbientTemperature=41)
+    assert warm.Converged.all() and warm.Iterations[0] < reference.Iterations[0]
+    np.testing.assert_allclose(warm.Temperatures, reference.Temperatures, atol=1e-2)
+
+
+def test_iteration_limit_is_reported(solver, cores):
+    result = solver(cores['ETD'], Tolerance=1e-12, MaxIterations=2)
+    assert not result.Converged.any() and result.Iterations[0] == 2
+
+
+def test_unsupported_family_is_rejected(solver, cores):
+    with pytest.raises(ValueError, match='PQ'):
+        solver({**cores['ETD'], 'family': 'PQ', 'WindowWidth': 7.85e-3, 'WindowHeight': 24.2e-3})
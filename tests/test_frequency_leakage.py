@@ -0,0 +1,56 @@
+"""
+FrequencyDependentLeakageCalculator: block energy fractions against a brute-force field integration, and the limits
+of the sweep.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.leakage_inductance.LeakageFieldMap import LeakageFieldMap
+from magnetics_modeling.leakage_inductance.FrequencyDependentLeakageCalculator import FrequencyDependentLeakageCalculator
+
+
+@pytest.fixture
+def calculator(cores, design):
+    def calculator(Frequencies):
+        WindowWidth, WindowHeight = core_window_dimensions(cores['ETD'])
+        blocks = WindingMaker(WindowWidth, WindowHeight, **design).winding_dims
+        return FrequencyDependentLeakageCalculator(cores['ETD'], 'Primary', WindowWidth, WindowHeight, blocks,
+                                                   design['NumberOfTurns_1'], design['NumberOfTurns_2'],
+                                                   design['ConductorDiameter_1'], design['InsulationThickness_1'],
+                                                   design['ConductorDiameter_2'], design['InsulationThickness_2'], Frequencies)
+    return calculator
+
+
+def test_energy_fractions_match_field_integration(cores, design):
+    WindowWidth, WindowHeight = core_window_dimensions(cores['ETD'])
+    blocks = WindingMaker(WindowWidth, WindowHeight, **design).winding_dims
+    fractions = FrequencyDependentLeakageCalculator.BlockEnergyFractions(30, 30, WindowWidth, WindowHeight, blocks,
+                                                                        design['NumberOfTurns_1'], design['NumberOfTurns_2'])
+    assert all(0 < fraction < 1 for fraction in fractions.values()) and sum(fractions.values()) <= 1
+
+    # Midpoint sums of |B|^2 over the window and over each block
+    field_map = LeakageFieldMap('Primary', WindowWidth, WindowHeight, blocks, design['NumberOfTurns_1'], design['NumberOfTurns_2'])
+
+    def energy(x_minus, x_plus, y_minus, y_plus, points=200):
+        x = x_minus + (np.arange(points) + 0.5) * (x_plus - x_minus) / points
+        y = y_minus + (np.arange(points) + 0.5) * (y_plus - y_minus) / points
+        return (field_map.at(*np.meshgrid(x, y))['B']**2).mean() * (x_plus - x_minus) * (y_plus - y_minus)
+
+    total = energy(0, WindowWidth, 0, WindowHeight, 600)
+    for winding, fraction in fractions.items():
+        block = blocks[winding]
+        assert fraction == pytest.approx(energy(block['x'], block['x'] + block['width'],
+                                                block['y'], block['y'] + block['height']) / total, rel=2e-3), winding
+
+
+def test_static_limit_and_decrease_with_frequency(calculator):
+    frequencies = np.logspace(-3, 8, 45)
+    sweep = calculator(frequencies)
+    assert sweep.LeakageInductance[0] == pytest.approx(sweep.StaticLeakageInductance, rel=1e-9)
+    for K_L in sweep.InductanceFactors.values():
+        assert K_L[0] == pytest.approx(1, rel=1e-9)
+    assert np.all(np.diff(sweep.LeakageInductance) <= 0) and sweep.LeakageInductance[-1] < sweep.LeakageInductance[0]
+    # Field exclusion can remove at most the energy stored inside the blocks
+    assert sweep.LeakageInductance[-1] >= sweep.StaticLeakageInductance * (1 - sum(sweep.EnergyFractions.values()))
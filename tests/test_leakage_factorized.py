@@ -0,0 +1,28 @@
+"""
+LeakageInductanceCalculator: the default factorized evaluation against the dense triple sums (Method='dense').
+"""
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+
+
+SPLIT = {'BobbinType': 'Split', 'PrimaryHeight': 7e-3, 'InterSectionSpacing': 1e-3, 'SecondaryHeight': 7e-3}
+
+
+@pytest.mark.parametrize('family', ('ETD', 'EFD'))
+@pytest.mark.parametrize('BobbinType', ('Normal', 'Split'))
+@pytest.mark.parametrize('ReferredWinding', ('Primary', 'Secondary'))
+def test_factorized_matches_dense(family, BobbinType, ReferredWinding, cores, design):
+    SelectedCore = cores[family]
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    design = {**design, **SPLIT} if BobbinType == 'Split' else design
+    winding = WindingMaker(WindowWidth, WindowHeight, **design)
+    assert winding.turns['x'].size
+
+    LeakageInductance = {Method: LeakageInductanceCalculator(SelectedCore, ReferredWinding, WindowWidth, WindowHeight,
+                                                             winding.winding_dims, design['NumberOfTurns_1'],
+                                                             design['NumberOfTurns_2'], Method=Method).LeakageInductance
+                         for Method in ('factorized', 'dense')}
+    assert LeakageInductance['factorized'] == pytest.approx(LeakageInductance['dense'], rel=1e-12)
@@ -0,0 +1,32 @@
+"""
+LeakageFieldMap.grid: FFT synthesis against direct summation, and the grid sizes it accepts.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.LeakageFieldMap import LeakageFieldMap
+
+
+@pytest.fixture
+def field_map(cores, bounds, turns, blocks):
+    WindowWidth, WindowHeight = core_window_dimensions(cores['ETD'])
+    return LeakageFieldMap('Primary', WindowWidth, WindowHeight,
+                           blocks(np.array(bounds) * np.array([WindowWidth, WindowWidth, WindowHeight, WindowHeight])), *turns)
+
+
+@pytest.mark.parametrize('Points', [(2, 2), (17, 33)])
+def test_grid_matches_direct_summation(Points, field_map):
+    grid = field_map.grid(Points)
+    x, y = np.meshgrid(grid['x'], grid['y'])
+    direct = field_map.at(x, y)
+    scale = np.abs(field_map.grid((33, 33))['B']).max()
+    np.testing.assert_allclose(grid['A'], direct['A'], atol=1e-9 * scale * field_map.WindowWidth)
+    for name in ('Bx', 'By'):
+        np.testing.assert_allclose(grid[name], direct[name], atol=1e-9 * scale)
+
+
+@pytest.mark.parametrize('Points', [(1, 1), (0, 5), (5, 1), (9.5, 9)])
+def test_grid_needs_two_points_per_axis(Points, field_map):
+    with pytest.raises(ValueError):
+        field_map.grid(Points)
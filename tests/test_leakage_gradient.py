@@ -0,0 +1,44 @@
+"""
+LeakageInductanceCalculator(..., Gradient=True) against central finite differences of the full calculator.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+
+
+@pytest.mark.parametrize('family', ('ETD', 'EFD'))
+@pytest.mark.parametrize('ReferredWinding', ('Primary', 'Secondary'))
+def test_gradient_matches_central_differences(family, ReferredWinding, cores, bounds, turns, blocks):
+    SelectedCore = cores[family]
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    bounds = np.array(bounds) * np.array([WindowWidth, WindowWidth, WindowHeight, WindowHeight])
+    turns = np.array(turns, dtype=np.float64)
+
+    def _leakage(family, ReferredWinding, Bounds, Turns, Gradient=False):
+        return LeakageInductanceCalculator(SelectedCore, ReferredWinding, WindowWidth, WindowHeight, blocks(Bounds), *Turns,
+                                           Gradient=Gradient)
+
+    calculator = _leakage(family, ReferredWinding, bounds, turns, Gradient=True)
+    assert calculator.LeakageInductance == pytest.approx(_leakage(family, ReferredWinding, bounds, turns).LeakageInductance, rel=1e-12)
+
+    scale = calculator.LeakageInductance / WindowWidth
+    for block, names in enumerate(LeakageInductanceCalculator.GRADIENT_BOUNDS):
+        for index, name in enumerate(names):
+            step = 1e-7 * WindowWidth
+            plus, minus = bounds.copy(), bounds.copy()
+            plus[block, index] += step
+            minus[block, index] -= step
+            difference = (_leakage(family, ReferredWinding, plus, turns).LeakageInductance
+                          - _leakage(family, ReferredWinding, minus, turns).LeakageInductance) / (2 * step)
+            assert calculator.Gradient[name] == pytest.approx(difference, rel=1e-5, abs=1e-6 * scale), name
+
+    for index, name in enumerate(('NumberOfTurns_1', 'NumberOfTurns_2')):
+        step = 1e-5 * turns[index]
+        plus, minus = turns.copy(), turns.copy()
+        plus[index] += step
+        minus[index] -= step
+        difference = (_leakage(family, ReferredWinding, bounds, plus).LeakageInductance
+                      - _leakage(family, ReferredWinding, bounds, minus).LeakageInductance) / (2 * step)
+        assert calculator.Gradient[name] == pytest.approx(difference, rel=1e-6, abs=1e-9 * calculator.LeakageInductance), name
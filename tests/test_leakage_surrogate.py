@@ -0,0 +1,69 @@
+"""
+LeakageSurrogate: a small table against the exact batch series, the fallback outside its domain and the options
+LeakageInductanceCalculator does not combine with it.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.LeakageSurrogate import LeakageSurrogate, DOMAINS
+from magnetics_modeling.leakage_inductance.BatchLeakageInductanceCalculator import BatchLeakageInductanceCalculator
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+
+
+# Narrow domains around one design of each arrangement keep the build quick while every leaf still meets the tolerance
+SMALL_DOMAINS = {'Normal': ((0.1, 0.2, 0.05, 0.2, 0.05, 0.7, 0.0, -0.05, 3.0), (0.15, 0.25, 0.1, 0.25, 0.1, 0.8, 0.05, 0.0, 5.2)),
+                 'Split': ((0.1, 0.5, 0.0, -0.05, 0.05, 0.3, 0.05, 0.3, 3.0), (0.15, 0.6, 0.05, 0.0, 0.1, 0.35, 0.1, 0.35, 5.2))}
+
+
+@pytest.fixture(scope='module')
+def surrogate(tmp_path_factory):
+    return LeakageSurrogate.build(str(tmp_path_factory.mktemp('surrogate')), Tolerance=0.1, Degree=2, MaxDepth=3, Domains=SMALL_DOMAINS)
+
+
+def _designs(SelectedCore, Count=1000):
+    # Fresh designs of both block arrangements inside the table and over the full domains (mostly outside it), plus
+    # one whose blocks overlap (outside every domain)
+    rng = np.random.default_rng(7)
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    bounds = np.concatenate([LeakageSurrogate._Bounds(Topology, LeakageSurrogate._Draw(rng, Topology, *map(np.asarray, Domains[Topology]), Count))
+                             for Domains in (SMALL_DOMAINS, DOMAINS) for Topology in Domains] + [[(0.1, 0.5, 0.1, 0.9, 0.3, 0.7, 0.2, 0.8)]])
+    x_1, x_1p, y_1, y_1p, x_2, x_2p, y_2, y_2p = (bounds * np.tile([WindowWidth, WindowWidth, WindowHeight, WindowHeight], 2)).T
+    blocks = {'primary': {'x': x_1, 'y': y_1, 'width': x_1p - x_1, 'height': y_1p - y_1},
+              'secondary': {'x': x_2, 'y': y_2, 'width': x_2p - x_2, 'height': y_2p - y_2}}
+    turns = rng.integers(5, 60, (2, len(bounds)))
+    return WindowWidth, WindowHeight, blocks, *turns
+
+
+@pytest.mark.parametrize('family', ('ETD', 'EFD'))
+def test_query_against_exact_series(surrogate, family, cores):
+    SelectedCore = cores[family]
+    WindowWidth, WindowHeight, blocks, turns_1, turns_2 = _designs(SelectedCore)
+    exact = BatchLeakageInductanceCalculator(SelectedCore, 'Primary', WindowWidth, WindowHeight, blocks, turns_1, turns_2).LeakageInductance
+
+    result = surrogate.query(SelectedCore, 'Primary', WindowWidth, WindowHeight, blocks, turns_1, turns_2)
+    inside = result['InDomain']
+    assert inside.sum() >= 2000 and not inside.all() and not inside[-1]
+    assert surrogate.Manifest['leaves_within_tolerance'] == surrogate.Manifest['leaves']
+    assert np.all(np.abs(result['LeakageInductance'][inside] / exact[inside] - 1) <= result['ErrorEstimate'][inside])
+    np.testing.assert_array_equal(result['ErrorEstimate'][~inside], 0)
+    np.testing.assert_allclose(result['LeakageInductance'][~inside], exact[~inside], rtol=1e-12)
+
+    unchecked = surrogate.query(SelectedCore, 'Primary', WindowWidth, WindowHeight, blocks, turns_1, turns_2, Fallback=False)
+    np.testing.assert_array_equal(unchecked['LeakageInductance'][inside], result['LeakageInductance'][inside])
+    assert np.isnan(unchecked['LeakageInductance'][~inside]).all()
+
+
+@pytest.mark.parametrize('family, ReferredWinding', [('PQ', 'Primary'), ('ETD', 'Foo')])
+def test_query_rejects_unsupported_inputs(surrogate, family, ReferredWinding, cores):
+    WindowWidth, WindowHeight, blocks, turns_1, turns_2 = _designs(cores['ETD'], 4)
+    with pytest.raises(ValueError):
+        surrogate.query({**cores['ETD'], 'family': family}, ReferredWinding, WindowWidth, WindowHeight, blocks, turns_1, turns_2)
+
+
+@pytest.mark.parametrize('options', [{'Gradient': True}, {'Tolerance': 1e-3}, {'OutsideWindow': 'open'}])
+def test_calculator_rejects_options_the_table_does_not_cover(surrogate, options, cores, bounds, turns, blocks):
+    WindowWidth, WindowHeight = core_window_dimensions(cores['ETD'])
+    Blocks = blocks(np.array(bounds) * np.array([WindowWidth, WindowWidth, WindowHeight, WindowHeight]))
+    with pytest.raises(ValueError):
+        LeakageInductanceCalculator(cores['ETD'], 'Primary', WindowWidth, WindowHeight, Blocks, *turns, Surrogate=surrogate, **options)
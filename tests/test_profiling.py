@@ -0,0 +1,55 @@
+"""
+Profiler: stages are recorded on the profiler of their own thread, and nested profilers restore the outer one.
+"""
+import threading
+
+from magnetics_modeling.auxiliary_functions.profiling import Profiler, stage, checkpoint, profiled
+
+
+@profiled('work')
+def _work(Name):
+    with stage(Name):
+        checkpoint('half')
+
+
+def test_nested_profilers_restore_the_outer_one():
+    with Profiler() as outer:
+        _work('before')
+        with Profiler() as inner:
+            _work('inside')
+        _work('after')
+    _work('outside')
+
+    assert set(inner.Records) == {'work', 'work/inside', 'work/inside/half'}
+    assert set(outer.Records) == {'work', 'work/before', 'work/before/half', 'work/after', 'work/after/half'}
+    assert outer.Records['work']['calls'] == 2
+
+
+def test_threads_record_on_their_own_profiler():
+    barrier = threading.Barrier(4)
+    profilers = {}
+
+    def worker(Name):
+        with Profiler() as profiler:
+            barrier.wait()  # Every profiler is active at the same time
+            for _ in range(50):
+                _work(Name)
+            barrier.wait()
+        profilers[Name] = profiler
+
+    threads = [threading.Thread(target=worker, args=(f'thread-{index}',)) for index in range(3)]
+    for thread in threads:
+        thread.start()
+
+    # A thread without a profiler records nothing, even while the others are active
+    barrier.wait()
+    with stage('main') as unrecorded:
+        _work('main')
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    assert not hasattr(unrecorded, 'profiler')
+    for name, profiler in profilers.items():
+        assert set(profiler.Records) == {'work', f'work/{name}', f'work/{name}/half'}
+        assert profiler.Records['work']['calls'] == 50
@@ -0,0 +1,26 @@
+"""
+ResultCache with LeakageInductanceCalculator: a cache hit restores the same calculator state as a computation.
+"""
+import numpy as np
+
+from magnetics_modeling.auxiliary_functions.result_cache import ResultCache
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.leakage_inductance.LeakageInductanceCalculator import LeakageInductanceCalculator
+
+
+def test_cache_hit_restores_results_and_geometry(tmp_path, cores, bounds, turns, blocks):
+    cache = ResultCache(str(tmp_path / 'results.sqlite'))
+    SelectedCore = cores['ETD']
+    WindowWidth, WindowHeight = core_window_dimensions(SelectedCore)
+    Blocks = blocks(np.array(bounds) * np.array([WindowWidth, WindowWidth, WindowHeight, WindowHeight]))
+
+    exact = LeakageInductanceCalculator(SelectedCore, 'Primary', WindowWidth, WindowHeight, Blocks, *turns)
+    computed, hit = (LeakageInductanceCalculator(SelectedCore, 'Primary', WindowWidth, WindowHeight, Blocks, *turns, Cache=cache)
+                     for _ in range(2))
+
+    statistics = cache.statistics()
+    assert (statistics['hits'], statistics['misses'], statistics['total_hits']) == (1, 1, 1)
+    names = LeakageInductanceCalculator.CACHED_RESULTS + sum(LeakageInductanceCalculator.GRADIENT_BOUNDS, ()) + (
+        'Width_1', 'Height_1', 'Width_2', 'Height_2')
+    for name in names:
+        assert getattr(hit, name) == getattr(computed, name) == getattr(exact, name), name
@@ -0,0 +1,44 @@
+"""
+WindingLossCalculator: Dowell's factors in the low-frequency limit and the DC losses of arbitrary waveforms.
+"""
+import numpy as np
+import pytest
+
+from magnetics_modeling.auxiliary_functions.core_window_dimensions import core_window_dimensions
+from magnetics_modeling.auxiliary_functions.winding_maker import WindingMaker
+from magnetics_modeling.winding_loss.WindingLossCalculator import WindingLossCalculator
+
+
+@pytest.mark.parametrize('Layers', (1, 3, 8))
+def test_dowell_factors_tend_to_one(Layers):
+    Delta = np.array([1e-4, 1e-3, 1e-2, 0.1])
+    F_skin, F_prox = WindingLossCalculator.DowellFactors(Delta, Layers)
+    assert np.all(np.abs(F_skin + F_prox - 1) <= Layers**2 * Delta**4 + 1e-9)
+    assert np.all(np.abs(WindingLossCalculator.DowellInductanceFactor(Delta, Layers) - 1) <= Delta**4 / 10)
+
+    # Both branches agree where the series take over; F_R only increases and K_L only decreases with Delta
+    Delta = np.array([0.15, np.nextafter(0.15, 1), 0.5, 1, 2, 5])
+    F_R = sum(WindingLossCalculator.DowellFactors(Delta, Layers))
+    K_L = WindingLossCalculator.DowellInductanceFactor(Delta, Layers)
+    assert abs(F_R[0] - F_R[1]) < 1e-12 and np.all(np.diff(F_R[1:]) > 0)
+    assert abs(K_L[0] - K_L[1]) < 1e-12 and np.all(np.diff(K_L[1:]) < 0)
+
+
+@pytest.mark.parametrize('Waveform', ('sine', 'square', 'triangle'))
+def test_low_frequency_loss_is_dc_loss(cores, design, Waveform):
+    WindowWidth, WindowHeight = core_window_dimensions(cores['ETD'])
+    blocks = WindingMaker(WindowWidth, WindowHeight, **design).winding_dims
+    phase = np.arange(128) / 128
+    samples = {'sine': np.sin(2 * np.pi * phase), 'square': np.where(phase < 0.5, 1.0, -1.0),
+               'triangle': 1 - 4 * np.abs(phase - 0.5)}[Waveform]
+
+    calculator = WindingLossCalculator(1.0, 2.0, cores['ETD'], blocks, design['NumberOfTurns_1'], design['NumberOfTurns_2'],
+                                       design['ConductorDiameter_1'], design['InsulationThickness_1'],
+                                       design['ConductorDiameter_2'], design['InsulationThickness_2'], Waveform=samples)
+
+    # Every harmonic of interest is far below the skin-effect range, so R_ac = R_dc and P = R_dc * I_rms^2
+    ratio = design['NumberOfTurns_1'] / design['NumberOfTurns_2']
+    I_rms_2 = 2.0**2 * (samples**2).mean()
+    expected = calculator.ResistanceDC['primary'] * I_rms_2 + calculator.ResistanceDC['secondary'] * ratio**2 * I_rms_2
+    assert calculator.WindingLoss == pytest.approx(expected, rel=1e-6)
+    assert np.all(calculator.ResistanceFactors['primary'] >= 1)
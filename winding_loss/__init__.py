@@ -0,0 +1,6 @@
+"""
+Former location of magnetics_modeling.winding_loss, kept as an alias so existing imports keep working.
+"""
+from magnetics_modeling._compat import alias
+
+alias(__name__, 'magnetics_modeling.winding_loss')